@@ -0,0 +1,79 @@
+"""
+An opening burst of float lookups against the local FMP stub: one request per
+ticker with no throttling (the old behaviour) versus batched lookups paced by
+the token bucket, plus an endpoint that doesn't batch. Checks that every
+resolved float matches what the stub serves.
+
+    python -m benchmarks.bench_float_lookups
+"""
+import argparse
+from time import perf_counter, sleep
+
+from benchmarks.fmp_stub import StubConfig, serve, stub_float
+from benchmarks.synthetic import make_tickers
+from float_provider import FloatProvider
+
+BURST = 60
+STUB_RATE_PER_S = 5
+
+SCENARIOS = {
+    # name: (stub batches?, provider kwargs); the first mimics the old one-shot lookups
+    "per-ticker, no limiter": (
+        True, dict(batch_size=1, batch_window_s=0.0, rate_per_min=60_000, max_retries=0),
+    ),
+    "batched + limiter": (
+        True, dict(batch_size=25, batch_window_s=0.2, rate_per_min=STUB_RATE_PER_S * 60),
+    ),
+    "limiter, stub won't batch": (
+        False, dict(batch_size=25, batch_window_s=0.2, rate_per_min=STUB_RATE_PER_S * 60),
+    ),
+}
+
+
+def run(name: str, batching: bool, kwargs: dict, tickers: list[str], timeout_s: float) -> dict:
+    server, stub, url = serve(StubConfig(STUB_RATE_PER_S, latency_ms=50, batching=batching))
+    prov = FloatProvider(workers=8, cache_path=None, api_key="stub", base_url=url, **kwargs)
+    try:
+        t0 = perf_counter()
+        for t in tickers:
+            prov.prefetch(t)
+        # Wait for every lookup to land (or give up on it)
+        while prov._pending and perf_counter() - t0 < timeout_s:
+            sleep(0.01)
+        elapsed = perf_counter() - t0
+        resolved = {t: prov.peek(t) for t in tickers}
+        wrong = [t for t, (ok, v) in resolved.items() if ok and v != stub_float(t)]
+        assert not wrong, f"{name}: floats differ from the stub for {wrong}"
+        return {
+            "scenario": name,
+            "seconds": round(elapsed, 3),
+            "resolved": sum(ok for ok, _ in resolved.values()),
+            "upstream_requests": stub.requests,
+            "http_429": stub.throttled,
+            "metrics": prov.metrics.summary(),
+        }
+    finally:
+        prov.close()
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--burst", type=int, default=BURST)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    tickers = make_tickers(args.burst, seed=3)
+    print(f"{args.burst} tickers, stub allows {STUB_RATE_PER_S} req/s\n")
+    print(f"{'scenario':<28} {'seconds':>8} {'resolved':>9} {'requests':>9} {'429s':>6}")
+    for name, (batching, kwargs) in SCENARIOS.items():
+        r = run(name, batching, kwargs, tickers, args.timeout)
+        print(
+            f"{name:<28} {r['seconds']:>8.2f} {r['resolved']:>9} "
+            f"{r['upstream_requests']:>9} {r['http_429']:>6}"
+        )
+        print(f"    {r['metrics']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Per-cycle cost of process_stocks as the session grows, with the ticker-indexed
+GainersStore versus the old list scan + full re-sort.
+
+    python -m benchmarks.bench_gainers_store
+"""
+from time import perf_counter
+
+from benchmarks.synthetic import make_session, make_tickers
+import bot
+from gainers_store import GainersStore
+from replay import NoFloats
+from stock import Stock
+
+SESSION_SIZES = (100, 500, 1_000, 2_000, 5_000, 10_000)
+ROWS_PER_CYCLE = 100
+TIMED_CYCLES = 50
+NO_ALERTS = float("inf")
+
+
+def legacy_cycle(gainers: list[Stock], new_data) -> bool:
+    """The pre-GainersStore loop: linear lookup per row, then a full sort."""
+    changed = False
+    for stk_name, price, vol, rvol, rsi in new_data:
+        stk = next((s for s in gainers if s.get_ticker() == stk_name), None)
+        if stk:
+            new_abs = stk.get_new_abs(price)
+            stk.update_technicals(price, vol, bot.dt.now(), rvol, rsi)
+            if new_abs != stk.get_abs():
+                changed = True
+                stk.set_abs(new_abs)
+                stk.set_price(price)
+        else:
+            gainers.append(Stock(stk_name, price, vol, rvol, rsi, bot.dt.now()))
+            changed = True
+    if changed:
+        gainers.sort(key=lambda s: s.get_abs(), reverse=True)
+    return changed
+
+
+def seed_session(size: int):
+    """Builds a store and a legacy list that both already hold `size` tickers."""
+    store = GainersStore()
+    legacy: list[Stock] = []
+    for t in make_tickers(size, seed=1):
+        store.add(t, 5.0, 1_000_000.0, 1.0, 50.0, bot.dt.now())
+        legacy.append(Stock(t, 5.0, 1_000_000.0, 1.0, 50.0, bot.dt.now()))
+    return store, legacy
+
+
+def main():
+    float_prov = NoFloats()
+    print(f"{'tickers':>8} {'store ms/cycle':>15} {'legacy ms/cycle':>16}")
+    for size in SESSION_SIZES:
+        store, legacy = seed_session(size)
+        # Same seed as seed_session, so cycles touch tickers already seen
+        cycles = [
+            rows for _, rows in
+            make_session(size, TIMED_CYCLES, ROWS_PER_CYCLE, seed=1)
+        ]
+
+        t0 = perf_counter()
+        for rows in cycles:
+            bot.process_stocks(store, float_prov, [], rows, NO_ALERTS)
+        store_ms = (perf_counter() - t0) * 1000 / TIMED_CYCLES
+
+        t0 = perf_counter()
+        for rows in cycles:
+            legacy_cycle(legacy, rows)
+        legacy_ms = (perf_counter() - t0) * 1000 / TIMED_CYCLES
+
+        print(f"{size:>8} {store_ms:>15.3f} {legacy_ms:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
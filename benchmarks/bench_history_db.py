@@ -0,0 +1,87 @@
+"""
+Fills a history database with synthetic sessions through HistoryWriter, then
+times the cross-day queries the CLI runs, e.g. every A-tier alert on a float
+under 3M in the last 30 days.
+
+    python -m benchmarks.bench_history_db
+"""
+import argparse
+from datetime import timedelta
+from pathlib import Path
+import random
+from statistics import median
+import tempfile
+from time import perf_counter
+
+from benchmarks.synthetic import SESSION_START, make_tickers
+from gainers_store import GainersStore
+from history_db import HistoryWriter, connect, query
+
+PCT = 15.0
+TIERS = "ABCD"
+UNIVERSE = 3_000
+
+QUERIES = {
+    "A-tier alerts, float < 3M, 30 days": lambda day: dict(
+        since=day - timedelta(days=30), tier="A", max_float=3e6, alerts_only=True
+    ),
+    "one ticker, all days": lambda day: dict(ticker="AAPL"),
+    "score >= 9, 90 days": lambda day: dict(since=day - timedelta(days=90), min_score=9),
+    "alerts on the latest day": lambda day: dict(since=day, alerts_only=True),
+}
+
+
+def fill_day(store: GainersStore, tickers: list[str], rng: random.Random, t0):
+    """A day's worth of stocks, about a third of them alerted with random crit stats."""
+    for t in tickers:
+        s = store.add(t, rng.uniform(1, 30), rng.uniform(1e4, 5e6), rng.uniform(0.5, 8), rng.uniform(30, 80), t0)
+        s.set_float_shares(rng.choice([None, rng.uniform(5e5, 5e7)]))
+        if rng.random() < 0.33:
+            s.did_meet_crit(t0 + timedelta(minutes=rng.randint(1, 300)))
+            s.snapshot_crit_technicals(rng.randint(0, 12), rng.choice(TIERS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, default=250)
+    parser.add_argument("--tickers", type=int, default=400, help="tickers seen per day")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    universe = make_tickers(UNIVERSE, seed=5) + ["AAPL"]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "history.sqlite"
+        writer = HistoryWriter(path)
+        record_s = 0.0
+        day = SESSION_START
+        for d in range(args.days):
+            day = SESSION_START + timedelta(days=d)
+            store = GainersStore()
+            fill_day(store, rng.sample(universe, args.tickers), rng, day)
+            t0 = perf_counter()
+            writer.record(day, PCT, store)
+            record_s += perf_counter() - t0
+        t0 = perf_counter()
+        writer.close()
+        drain_s = perf_counter() - t0
+        rows = args.days * args.tickers
+        print(f"{rows} rows over {args.days} days: record() {record_s * 1e3 / args.days:.1f} ms/day "
+              f"on the caller, {drain_s:.2f}s left to write at close, "
+              f"{path.stat().st_size / 1e6:.1f} MB")
+
+        db = connect(path, readonly=True)
+        print(f"\n{'query':<38} {'rows':>6} {'p50 ms':>8} {'max ms':>8}")
+        for name, make in QUERIES.items():
+            kwargs = make(day.date())
+            times = []
+            for _ in range(args.repeat):
+                t0 = perf_counter()
+                found = query(db, **kwargs)
+                times.append((perf_counter() - t0) * 1e3)
+            print(f"{name:<38} {len(found):>6} {median(times):>8.2f} {max(times):>8.2f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+How the adaptive refresh period reacts to different tables: runs each
+scenario's cycles through process_stocks and the scheduler (without
+sleeping) and reports how often it picked half, base or a stretched period.
+Fails if a quiet or merely ticking table doesn't stretch the period, or a
+running one doesn't speed it up.
+
+    python -m benchmarks.bench_refresh_pacing
+"""
+import argparse
+import random
+from datetime import timedelta
+
+from benchmarks.synthetic import SESSION_START, make_tickers
+import bot
+from gainers_store import GainersStore
+from replay import NoFloats
+from scheduler import RefreshScheduler
+
+PCT = 20.0
+BOARD = 100
+BASE_S = 60.0
+
+
+def quiet(rng: random.Random, price: float) -> float:
+    """A cent here and there."""
+    return price + rng.choice((-0.01, 0.0, 0.0, 0.01))
+
+
+def ticking(rng: random.Random, price: float) -> float:
+    """Every row changes price each cycle, but by well under a point."""
+    return price * (1 + rng.uniform(-0.004, 0.004))
+
+
+def running(rng: random.Random, price: float) -> float:
+    """A tenth of the board swings ~3% a cycle, the rest ticks."""
+    if rng.random() < 0.1:
+        return price * rng.choice((1.03, 1 / 1.03))
+    return price * (1 + rng.uniform(-0.004, 0.004))
+
+
+SCENARIOS = {"quiet": quiet, "ticking": ticking, "running": running}
+
+
+def make_board(tickers: list[str], rng: random.Random) -> dict[str, float]:
+    """Opening prices; the board is seeded with them, so abs % starts at 0."""
+    return {t: rng.uniform(1, 20) for t in tickers}
+
+
+def pace(cycles: list[list[tuple]], seed_rows: list[tuple]) -> dict[str, float]:
+    """Share of cycles the scheduler picked each kind of period for."""
+    gainers = GainersStore()
+    float_prov = NoFloats()
+    scheduler = RefreshScheduler(BASE_S)
+    t = SESSION_START
+    bot.process_stocks(gainers, float_prov, [], seed_rows, PCT, t)
+    shares = {"half": 0, "base": 0, "stretched": 0}
+    for new_data in cycles:
+        t += timedelta(seconds=BASE_S)
+        board_rows = gainers.state.rows_of(row[0] for row in new_data)
+        abs_before = gainers.state.col("abs_pct_chg")[board_rows]
+        n_seen = len(gainers)
+        bot.process_stocks(gainers, float_prov, [], new_data, PCT, t)
+        movers, near_crit = bot.board_pace(gainers, new_data, board_rows, abs_before, n_seen, PCT)
+        scheduler.next_wait(movers, near_crit)
+        kind = "half" if scheduler.period < BASE_S else "base" if scheduler.period == BASE_S else "stretched"
+        shares[kind] += 1
+    return {kind: n / len(cycles) for kind, n in shares.items()}
+
+
+def walk(prices: dict[str, float], step, cycles: int, rng: random.Random) -> list[list[tuple]]:
+    """Cycles of the whole board, each price moved by `step`."""
+    out = []
+    for _ in range(cycles):
+        for t in prices:
+            prices[t] = step(rng, prices[t])
+        out.append([(t, p, 1e6, 1.0, 50.0) for t, p in prices.items()])
+    return out
+
+
+def left_board(tickers: list[str], cycles: int, rng: random.Random) -> tuple[list[tuple], list[list[tuple]]]:
+    """
+    A few tickers climb to just under the threshold, then drop off the board
+    for good while the rest of it sits quiet.
+    """
+    prices = make_board(tickers, rng)
+    seed = [(t, p, 1e6, 1.0, 50.0) for t, p in prices.items()]
+    leavers = set(tickers[:5])
+    near = {t: prices[t] * (1 + PCT * 0.9 / 100) for t in leavers}
+    out = [[(t, near.get(t, p), 1e6, 1.0, 50.0) for t, p in prices.items()]]
+    out.extend(walk({t: p for t, p in prices.items() if t not in leavers}, quiet, cycles - 1, rng))
+    return seed, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=60)
+    args = parser.parse_args()
+
+    tickers = make_tickers(BOARD, seed=3)
+    results = {}
+    for name, step in SCENARIOS.items():
+        rng = random.Random(11)
+        prices = make_board(tickers, rng)
+        seed = [(t, p, 1e6, 1.0, 50.0) for t, p in prices.items()]
+        results[name] = pace(walk(prices, step, args.cycles, rng), seed)
+    seed, cycles = left_board(tickers, args.cycles, random.Random(11))
+    results["near crit, left board"] = pace(cycles, seed)
+
+    print(f"{'scenario':<24} {'half':>6} {'base':>6} {'stretched':>10}")
+    for name, shares in results.items():
+        print(f"{name:<24} {shares['half']:>6.0%} {shares['base']:>6.0%} {shares['stretched']:>10.0%}")
+
+    for name in ("quiet", "ticking", "near crit, left board"):
+        # The first cycle or so may still be hot or at base before it idles
+        assert results[name]["stretched"] >= 0.9, f"{name} table didn't stretch the period: {results[name]}"
+    assert results["running"]["half"] >= 0.9, f"running table didn't speed up: {results['running']}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+End-to-end scrape cycle latency of bot.py's real Selenium path (refresh,
+wait_for_table, scrape_overview, scrape_technicals) against the local
+TradingView fixture, or of the TableStream observer path with --stream, or
+of two PinnedScraper browsers scraped in parallel with --pinned.
+Needs Chrome, but no network or TradingView account.
+
+    python -m benchmarks.bench_scrape_cycle --rows 100 --cycles 20 [--stream | --pinned]
+"""
+import argparse
+import json
+from statistics import mean, median
+from time import perf_counter, sleep
+
+import benchmarks.synthetic  # sets OPEN_HR/CLOSE_HR for bot
+from benchmarks.tv_fixture import FixtureConfig, serve
+import bot
+from selenium import webdriver
+
+
+def make_driver(headless: bool) -> webdriver.Chrome:
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1300,1044")
+    return webdriver.Chrome(options=options)
+
+
+def pct(values: list[float], p: float) -> float:
+    s = sorted(values)
+    return s[min(len(s) - 1, int(round(p / 100 * (len(s) - 1))))]
+
+
+def refresh_cycles(driver, cycles: int, stages: dict[str, list[float]], counts: list[int]):
+    for _ in range(cycles):
+        t_cycle = t = perf_counter()
+        driver.refresh()
+        stages["refresh"].append(perf_counter() - t)
+
+        t = perf_counter()
+        bot.wait_for_table(driver, 12)
+        stages["wait_for_table"].append(perf_counter() - t)
+
+        t = perf_counter()
+        rows = bot.scrape_overview(driver)
+        stages["scrape_overview"].append(perf_counter() - t)
+
+        t = perf_counter()
+        rsi = bot.scrape_technicals(driver)
+        stages["scrape_technicals"].append(perf_counter() - t)
+
+        stages["cycle"].append(perf_counter() - t_cycle)
+        assert rows and rsi, "fixture scrape came back empty"
+        counts.append(len(rows))
+
+
+def stream_cycles(driver, cycles: int, interval: float, stages: dict[str, list[float]], counts: list[int]):
+    stream = bot.TableStream(driver)
+    for _ in range(cycles):
+        t = perf_counter()
+        rows, _ = stream.scrape()
+        stages["cycle"].append(perf_counter() - t)
+        counts.append(len(rows))
+        # Give the page time to push changes, like the sleep between live cycles
+        sleep(interval)
+
+
+def pinned_cycles(scraper, cycles: int, stages: dict[str, list[float]], counts: list[int]):
+    for _ in range(cycles):
+        t = perf_counter()
+        rows, rsi = scraper.scrape()
+        stages["cycle"].append(perf_counter() - t)
+        assert rows and rsi, "fixture scrape came back empty"
+        skew = abs((rows[0]["captured"] - rows[0]["rsi_captured"]).total_seconds())
+        stages["price_rsi_skew"].append(skew)
+        counts.append(len(rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--tab-delay-ms", type=int, default=50)
+    parser.add_argument("--stream", action="store_true", help="time TableStream.scrape instead")
+    parser.add_argument("--pinned", action="store_true", help="time PinnedScraper.scrape instead")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between stream cycles")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    server, url = serve(FixtureConfig(rows=args.rows, tab_delay_ms=args.tab_delay_ms))
+    driver = make_driver(not args.headed)
+    second = make_driver(not args.headed) if args.pinned else None
+    if args.stream:
+        stages: dict[str, list[float]] = {"cycle": []}
+    elif args.pinned:
+        stages = {"cycle": [], "price_rsi_skew": []}
+    else:
+        stages = {"refresh": [], "wait_for_table": [], "scrape_overview": [], "scrape_technicals": [], "cycle": []}
+    counts: list[int] = []
+    try:
+        driver.get(url)
+        bot.wait_for_table(driver, 12)
+        if args.stream:
+            stream_cycles(driver, args.cycles, args.interval, stages, counts)
+        elif args.pinned:
+            scraper = bot.PinnedScraper(driver, url, second)
+            pinned_cycles(scraper, args.cycles, stages, counts)
+            scraper.close()
+        else:
+            refresh_cycles(driver, args.cycles, stages, counts)
+    finally:
+        driver.quit()
+        if second is not None:
+            second.quit()
+        server.shutdown()
+
+    results = {
+        name: {"p50_ms": median(v) * 1000, "p95_ms": pct(v, 95) * 1000, "max_ms": max(v) * 1000}
+        for name, v in stages.items()
+    }
+    mode = "stream" if args.stream else "pinned" if args.pinned else "refresh"
+    if args.json:
+        print(json.dumps({
+            "mode": mode, "rows": args.rows, "cycles": args.cycles,
+            "mean_rows_per_cycle": mean(counts), "stages": results,
+        }, indent=2))
+        return
+    print(f"{mode}: {args.cycles} cycles, {args.rows} rows, {mean(counts):.1f} rows scraped/cycle")
+    print(f"{'stage':<18} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name, r in results.items():
+        print(f"{name:<18} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['max_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Memory per tracked ticker: columnar SessionState rows + Stock views versus
+the old one-object-per-ticker layout with every field in the instance dict,
+and the per-object cost of a Stock view / PriceHistory with and without
+__slots__.
+
+    python -m benchmarks.bench_session_memory
+"""
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable
+
+from gainers_store import GainersStore
+from price_history import PriceHistory
+from session_state import SessionState
+from stock import Stock
+from benchmarks.synthetic import SESSION_START, make_tickers
+
+SESSION_SIZES = (100, 1_000, 10_000)
+
+
+class DictStock:
+    """Field layout of Stock before SessionState: one attribute per field."""
+    def __init__(self, ticker, price, vol, rvol, rsi, curr_time):
+        self.TICKER = ticker
+        self.OG_PRICE = price
+        self.TIME_ENTERED = curr_time
+        self.OG_VOL = vol
+        self.OG_RVOL = rvol
+        self.OG_RSI = rsi
+        self.CRIT_TIME = curr_time + timedelta(minutes=3)
+        self.CRIT_PRICE = price * 1.2
+        self.CRIT_VOL = vol
+        self.CRIT_RVOL = rvol * 1.5
+        self.CRIT_RSI = rsi + 1.0
+        self.CRIT_VOL_FLOAT_RATIO = 0.4
+        self.CRIT_SCORE = 7
+        self.CRIT_TIER = "C"
+        self.price = price * 1.3
+        self.base_price = price * 1.2
+        self.abs_pct_chg = 30.5
+        self.pct_chg_after = 8.3
+        self.met_crit = True
+        self.age = 12
+        self.past_prices = None
+        self.max_price = price * 1.4
+        self.time_max_price = curr_time + timedelta(minutes=9)
+        self.volume_at_max_price = vol
+        self.rvol_at_max_price = rvol * 2.0
+        self.rsi_at_max_price = rsi + 2.0
+        self.float_shares = 2_500_000.0
+        self.last_volume = vol
+        self.last_rvol = rvol * 2.0
+        self.last_rsi = rsi + 2.0
+        self.last_vol_float_ratio = 0.6
+
+
+class DictViewStock(Stock):
+    """Stock view as it was before __slots__: same fields, plus an instance dict."""
+
+
+class DictPriceHistory(PriceHistory):
+    """PriceHistory as it was before __slots__."""
+
+
+def fill_crit(s, curr_time: datetime):
+    """Gives a columnar Stock the same populated fields as DictStock."""
+    s.CRIT_TIME = curr_time + timedelta(minutes=3)
+    s.CRIT_PRICE = s.OG_PRICE * 1.2
+    s.CRIT_VOL = s.OG_VOL
+    s.CRIT_RVOL = s.OG_RVOL * 1.5
+    s.CRIT_RSI = s.OG_RSI + 1.0
+    s.CRIT_VOL_FLOAT_RATIO = 0.4
+    s.CRIT_SCORE = 7
+    s.CRIT_TIER = "C"
+    s.price = s.OG_PRICE * 1.3
+    s.base_price = s.OG_PRICE * 1.2
+    s.abs_pct_chg = 30.5
+    s.pct_chg_after = 8.3
+    s.met_crit = True
+    s.age = 12
+    s.max_price = s.OG_PRICE * 1.4
+    s.time_max_price = curr_time + timedelta(minutes=9)
+    s.rvol_at_max_price = s.OG_RVOL * 2.0
+    s.rsi_at_max_price = s.OG_RSI + 2.0
+    s.float_shares = 2_500_000.0
+    s.last_rvol = s.OG_RVOL * 2.0
+    s.last_rsi = s.OG_RSI + 2.0
+    s.last_vol_float_ratio = 0.6
+
+
+def measure(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return after - before
+
+
+def build_dict(tickers: list[str]):
+    return [
+        DictStock(t, 5.0 + i % 7, (i % 900 + 0.5) * 1e3, 2.0, 55.0, SESSION_START)
+        for i, t in enumerate(tickers)
+    ]
+
+
+def build_columnar(tickers: list[str]):
+    store = GainersStore()
+    for i, t in enumerate(tickers):
+        s = store.add(t, 5.0 + i % 7, (i % 900 + 0.5) * 1e3, 2.0, 55.0, SESSION_START)
+        fill_crit(s, SESSION_START)
+    return store
+
+
+def per_object(n: int = 10_000):
+    """Bytes per Stock view and per PriceHistory, before and after __slots__."""
+    state = SessionState(capacity=n)
+    for t in make_tickers(n, seed=3):
+        state.add_row(t)
+    history = PriceHistory()
+    rows = [
+        (
+            "Stock view",
+            measure(lambda: [DictViewStock.at_row(state, r, history) for r in range(n)]) / n,
+            measure(lambda: [Stock.at_row(state, r, history) for r in range(n)]) / n,
+        ),
+        (
+            "PriceHistory",
+            measure(lambda: [DictPriceHistory() for _ in range(n)]) / n,
+            measure(lambda: [PriceHistory() for _ in range(n)]) / n,
+        ),
+    ]
+    print(f"{'object':>14} {'dict B':>8} {'slots B':>8} {'saved':>7}")
+    for name, before, after in rows:
+        print(f"{name:>14} {before:>8.0f} {after:>8.0f} {1 - after / before:>7.0%}")
+    print()
+
+
+def main():
+    per_object()
+    # Both layouts carry a PriceHistory per ticker; report it separately
+    history = measure(PriceHistory)
+    print(f"PriceHistory (both layouts): {history} bytes/ticker")
+    print(f"{'tickers':>8} {'dict B/ticker':>14} {'columnar B/ticker':>18} {'saved':>7}")
+    for n in SESSION_SIZES:
+        tickers = make_tickers(n, seed=3)
+        dict_b = measure(lambda: build_dict(tickers)) / n
+        col_b = measure(lambda: build_columnar(tickers)) / n - history
+        print(f"{n:>8} {dict_b:>14.0f} {col_b:>18.0f} {1 - col_b / dict_b:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+SignalScorer.score_batch versus one score() call per row, with a parity
+check that both paths agree on every row.
+
+    python -m benchmarks.bench_signal_scorer
+"""
+from datetime import datetime
+from time import perf_counter
+
+import numpy as np
+
+from signal_scorer import SignalFeatures, SignalScorer
+
+N_ROWS = 10_000
+REPEATS = 20
+
+
+def make_features(n: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Random features covering every band edge, with NaN and 0 sprinkled in."""
+    rng = np.random.default_rng(seed)
+    feats = {
+        "float_shares": rng.choice([0.0, 5e5, 1e6, 2.9e6, 3e6, 1e7, 2e7, 5e7], n)
+        * rng.choice([1.0, 1.01], n),
+        "rvol": rng.choice([0.0, 2.9, 3.0, 5.0, 9.9, 10.0, 30.0], n),
+        "vol_float_ratio": rng.choice([0.0, 0.49, 0.5, 1.0, 1.9, 2.0, 4.0], n),
+        "rsi": rng.choice([0.0, 34.9, 35.0, 59.9, 60.0, 75.0, 84.9, 85.0, 89.9, 90.0, 99.0], n),
+        "abs_pct": rng.uniform(-5, 60, n),
+    }
+    for arr in feats.values():
+        arr[rng.random(n) < 0.1] = np.nan
+    return feats
+
+
+def to_optional(v: float):
+    return None if np.isnan(v) else float(v)
+
+
+def check_parity(feats: dict[str, np.ndarray]):
+    batch = SignalScorer.score_batch(**feats)
+    now = datetime.now()
+    for i in range(len(feats["abs_pct"])):
+        one = SignalScorer.score(SignalFeatures(
+            ticker="T",
+            price=1.0,
+            abs_pct=float(feats["abs_pct"][i]),
+            volume=0.0,
+            float_shares=to_optional(feats["float_shares"][i]),
+            rvol=to_optional(feats["rvol"][i]),
+            rsi=to_optional(feats["rsi"][i]),
+            vol_float_ratio=to_optional(feats["vol_float_ratio"][i]),
+            time=now,
+        ))
+        got = (int(batch.scores[i]), str(batch.tiers[i]))
+        assert got == (one.score, one.tier), f"row {i}: batch {got} != scalar {one}"
+
+
+def main():
+    feats = make_features(N_ROWS)
+    check_parity(feats)
+    print(f"parity: OK on {N_ROWS} rows")
+
+    t0 = perf_counter()
+    for _ in range(REPEATS):
+        SignalScorer.score_batch(**feats)
+    batch_ms = (perf_counter() - t0) * 1000 / REPEATS
+
+    rows = [
+        SignalFeatures("T", 1.0, float(feats["abs_pct"][i]), 0.0,
+                       to_optional(feats["float_shares"][i]), to_optional(feats["rvol"][i]),
+                       to_optional(feats["rsi"][i]), to_optional(feats["vol_float_ratio"][i]),
+                       datetime.now())
+        for i in range(N_ROWS)
+    ]
+    t0 = perf_counter()
+    for f in rows:
+        SignalScorer.score(f)
+    scalar_ms = (perf_counter() - t0) * 1000
+
+    print(f"score_batch: {batch_ms:.3f} ms / {N_ROWS} rows")
+    print(f"score loop:  {scalar_ms:.3f} ms / {N_ROWS} rows")
+
+
+if __name__ == "__main__":
+    main()
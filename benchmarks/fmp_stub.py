@@ -0,0 +1,127 @@
+"""
+Local stand-in for FMP's `/stable/shares-float` endpoint, so FloatProvider's
+batching, rate limiting and retries can be exercised offline.
+
+`symbol` may be a comma separated list, unless `batching` is off: then, like
+an endpoint that doesn't batch, "A,B" is taken as one unknown symbol.
+Roughly one ticker in ten has no float. Requests past `rate_per_s` in any one
+second get a 429 with a Retry-After header.
+
+    python -m benchmarks.fmp_stub --port 8766 --rate-per-s 5
+"""
+import argparse
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from threading import Lock, Thread
+from time import monotonic, sleep
+from urllib.parse import parse_qs, urlparse
+import zlib
+
+FLOAT_PATH = "/stable/shares-float"
+
+
+@dataclass
+class StubConfig:
+    rate_per_s: int = 0  # 0 for no rate limit
+    latency_ms: float = 50.0
+    batching: bool = True
+
+
+def stub_float(ticker: str) -> float | None:
+    """The float the stub reports for a ticker (None for ~10% of tickers)."""
+    h = zlib.crc32(ticker.encode())
+    return None if h % 10 == 0 else float(1_000_000 + h % 50_000_000)
+
+
+class FMPStub:
+    """Request counters plus the fixed-window rate limit."""
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self.requests = 0
+        self.throttled = 0
+        self._window = 0
+        self._in_window = 0
+        self._lock = Lock()
+
+    def admit(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            if not self.config.rate_per_s:
+                return True
+            window = int(monotonic())
+            if window != self._window:
+                self._window, self._in_window = window, 0
+            self._in_window += 1
+            if self._in_window > self.config.rate_per_s:
+                self.throttled += 1
+                return False
+            return True
+
+    def answer(self, symbols: list[str]) -> list[dict]:
+        if not self.config.batching and len(symbols) > 1:
+            return []
+        return [
+            {"symbol": s, "floatShares": f}
+            for s in symbols if (f := stub_float(s)) is not None
+        ]
+
+
+def serve(config: StubConfig, port: int = 0) -> tuple[ThreadingHTTPServer, FMPStub, str]:
+    """
+    Starts the stub on a background thread and returns (server, stub, base_url),
+    where base_url is what FloatProvider takes as `base_url`.
+    """
+    stub = FMPStub(config)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != FLOAT_PATH:
+                self.send_error(404)
+                return
+            sleep(config.latency_ms / 1000)
+            if not stub.admit():
+                self.send_response(429)
+                self.send_header("Retry-After", "1")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            symbols = parse_qs(url.query).get("symbol", [""])[0].upper().split(",")
+            body = json.dumps(stub.answer([s for s in symbols if s])).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    Thread(target=server.serve_forever, name="fmp-stub", daemon=True).start()
+    host, bound_port = server.server_address[:2]
+    return server, stub, f"http://{host}:{bound_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local FMP shares-float stand-in.")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--rate-per-s", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--no-batching", action="store_true")
+    args = parser.parse_args()
+
+    server, _, url = serve(
+        StubConfig(args.rate_per_s, args.latency_ms, not args.no_batching), args.port
+    )
+    print(f"Serving FMP stub at {url} (set FMP_BASE_URL to this; Ctrl+C to stop)")
+    try:
+        while True:
+            sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
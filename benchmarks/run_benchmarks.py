@@ -0,0 +1,199 @@
+"""
+Benchmark suite for the core processing path. For each session size it
+replays a synthetic gainers session through process_stocks and then times
+the per-row helpers and the end-of-day steps on the resulting state:
+
+    process_stocks              ms per cycle, over the whole session
+    Stock.update_technicals     us per call
+    parse_volume                us per call (memoized string fallback)
+    SignalScorer.score          us per call
+    show_eod_stats              ms per call (console output discarded)
+    export_eod_stats_to_excel   ms per call
+    export_all_seen_to_excel    ms per call
+
+No browser or network needed. Results go to stdout as a table, and with
+--json to a machine-readable file for comparing runs.
+
+    python -m benchmarks.run_benchmarks [--sizes 100 1000 10000] [--cycles 2000] [--json out.json]
+"""
+import argparse
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import io
+import json
+import platform
+import subprocess
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+from benchmarks.synthetic import make_session
+import bot
+from gainers_store import GainersStore
+from replay import NoFloats
+from signal_scorer import SignalFeatures, SignalScorer
+from stock import Stock, format_volume, parse_volume
+
+SIZES = (100, 1_000, 10_000)
+CYCLES = 2_000
+ROWS_PER_CYCLE = 100
+PCT_CHG_DES = 10.0
+MICRO_CALLS = 20_000
+
+
+@dataclass
+class Result:
+    name: str
+    tickers: int
+    unit: str
+    n: int
+    mean: float
+    p50: float
+    p95: float
+    max: float
+
+
+def summarize(name: str, tickers: int, unit: str, samples: list[float]) -> Result:
+    s = sorted(samples)
+    n = len(s)
+    return Result(
+        name, tickers, unit, n,
+        round(sum(s) / n, 4), round(s[n // 2], 4), round(s[min(n - 1, int(n * 0.95))], 4), round(s[-1], 4),
+    )
+
+
+def time_each(fn: Callable[[], object], repeat: int, scale: float) -> list[float]:
+    out = []
+    for _ in range(repeat):
+        t0 = perf_counter()
+        fn()
+        out.append((perf_counter() - t0) * scale)
+    return out
+
+
+def time_calls(fn: Callable[[int], object], calls: int, batches: int = 20) -> list[float]:
+    """us per call, measured over `batches` batches so timer overhead stays out of it."""
+    per = max(1, calls // batches)
+    out = []
+    for b in range(batches):
+        t0 = perf_counter()
+        for i in range(b * per, (b + 1) * per):
+            fn(i)
+        out.append((perf_counter() - t0) / per * 1e6)
+    return out
+
+
+def run_size(size: int, cycles: int, rows_per_cycle: int, export_dir: Path) -> list[Result]:
+    results = []
+    gainers = GainersStore()
+    alerted: list[Stock] = []
+    float_prov = NoFloats()
+    # Alert lines and tables are rendered into memory, so terminal speed stays out of it
+    sink = io.StringIO()
+
+    # process_stocks over the whole session
+    per_cycle = []
+    last_time = datetime.now()
+    with redirect_stdout(sink):
+        for cycle_time, rows in make_session(size, cycles, rows_per_cycle, seed=size):
+            t0 = perf_counter()
+            bot.process_stocks(gainers, float_prov, alerted, rows, PCT_CHG_DES, cycle_time)
+            per_cycle.append((perf_counter() - t0) * 1e3)
+            last_time = cycle_time
+    float_prov.close()
+    results.append(summarize("process_stocks", size, "ms/cycle", per_cycle))
+
+    stocks = list(gainers)
+    n = len(stocks)
+    vols = [s.last_volume or 1e6 for s in stocks]
+    vol_strs = [format_volume(v) for v in vols]
+
+    def update(i: int):
+        s = stocks[i % n]
+        s.update_technicals(5.0 + i % 7, vols[i % n], last_time + timedelta(seconds=i), 3.2, 61.0)
+    results.append(summarize("Stock.update_technicals", size, "us/call", time_calls(update, MICRO_CALLS)))
+
+    results.append(summarize(
+        "parse_volume", size, "us/call",
+        time_calls(lambda i: parse_volume(vol_strs[i % n]), MICRO_CALLS),
+    ))
+
+    feats = [
+        SignalFeatures(
+            ticker=s.get_ticker(), price=s.price, abs_pct=s.get_abs(),
+            volume=vols[i], float_shares=s.float_shares,
+            rvol=s.last_rvol, rsi=s.last_rsi, vol_float_ratio=s.last_vol_float_ratio, time=last_time,
+        )
+        for i, s in enumerate(stocks)
+    ]
+    results.append(summarize(
+        "SignalScorer.score", size, "us/call",
+        time_calls(lambda i: SignalScorer.score(feats[i % n]), MICRO_CALLS),
+    ))
+
+    def eod():
+        with redirect_stdout(sink):
+            bot.show_eod_stats(gainers, PCT_CHG_DES, None)
+        sink.seek(0)
+        sink.truncate()
+    results.append(summarize("show_eod_stats", size, "ms/call", time_each(eod, 3, 1e3)))
+
+    winners = [gainers.stock_at(r) for r in gainers.state.crit_rows()]
+    with redirect_stdout(sink):
+        results.append(summarize(
+            "export_eod_stats_to_excel", size, "ms/call",
+            time_each(lambda: bot.export_eod_stats_to_excel(winners, PCT_CHG_DES, export_dir), 3, 1e3),
+        ))
+        results.append(summarize(
+            "export_all_seen_to_excel", size, "ms/call",
+            time_each(lambda: bot.export_all_seen_to_excel(stocks, PCT_CHG_DES, export_dir), 3, 1e3),
+        ))
+    print(f"  {size} tickers: {n} seen, {len(winners)} met criteria over {cycles} cycles")
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the core processing path on synthetic sessions.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="tickers per session")
+    parser.add_argument("--cycles", type=int, default=CYCLES)
+    parser.add_argument("--rows", type=int, default=ROWS_PER_CYCLE, help="rows scraped per cycle")
+    parser.add_argument("--json", type=Path, help="also write results here as JSON")
+    args = parser.parse_args()
+
+    results: list[Result] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            results.extend(run_size(size, args.cycles, args.rows, Path(tmp)))
+
+    print(f"\n{'benchmark':<30} {'tickers':>8} {'unit':>9} {'mean':>10} {'p50':>10} {'p95':>10} {'max':>10}")
+    for r in results:
+        print(f"{r.name:<30} {r.tickers:>8} {r.unit:>9} {r.mean:>10.3f} {r.p50:>10.3f} {r.p95:>10.3f} {r.max:>10.3f}")
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "meta": {
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "cycles": args.cycles,
+                "rows_per_cycle": args.rows,
+            },
+            "results": [asdict(r) for r in results],
+        }, indent=2))
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Synthetic top gainers sessions for the benchmarks. Nothing here touches a
+browser or the network.
+"""
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Iterator
+
+# bot.py reads these at import time
+os.environ.setdefault("OPEN_HR", "8")
+os.environ.setdefault("CLOSE_HR", "15")
+
+SESSION_START = datetime(2026, 1, 5, 8, 30, 30)
+
+
+def make_tickers(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    seen: set[str] = set()
+    while len(seen) < n:
+        seen.add("".join(rng.choice(letters) for _ in range(rng.randint(2, 5))))
+    return sorted(seen)
+
+
+def make_session(
+    n_tickers: int,
+    n_cycles: int,
+    rows_per_cycle: int = 100,
+    interval_s: float = 30.0,
+    seed: int = 0,
+) -> Iterator[tuple[datetime, list[tuple[str, float, float, float, float]]]]:
+    """
+    Yields (cycle_time, new_data) tuples shaped like the rows run_main_loop
+    hands to process_stocks. The universe of tickers is introduced gradually
+    over the session, so the set of tickers seen keeps growing like a real day.
+    """
+    rng = random.Random(seed)
+    tickers = make_tickers(n_tickers, seed)
+    prices = {t: rng.uniform(1, 20) for t in tickers}
+    volumes = {t: rng.uniform(50_000, 5_000_000) for t in tickers}
+
+    for cycle in range(n_cycles):
+        # Fraction of the universe that has shown up so far
+        live = max(rows_per_cycle, int(n_tickers * (cycle + 1) / n_cycles))
+        pool = tickers[:min(live, n_tickers)]
+        rows = []
+        for t in rng.sample(pool, min(rows_per_cycle, len(pool))):
+            prices[t] = max(0.01, prices[t] * (1 + rng.gauss(0.002, 0.02)))
+            volumes[t] += rng.uniform(0, 200_000)
+            rows.append((
+                t,
+                round(prices[t], 2),
+                float(round(volumes[t])),
+                round(rng.uniform(0.5, 15), 2),
+                round(rng.uniform(20, 95), 2),
+            ))
+        yield SESSION_START + timedelta(seconds=cycle * interval_s), rows
@@ -0,0 +1,207 @@
+"""
+Local stand-in for TradingView's market movers gainers page. It serves a
+synthetic table with the same `listRow` rows, `data-field` headers and
+`market-screener-header-columnset-tabs` tabs that bot.py's scrapers expect,
+so the real Selenium path can be exercised and timed offline.
+
+Prices drift deterministically with server time (so each reload sees new
+data), and the page also mutates a few rows in place every `mutate_ms`, like
+the live page streaming quotes.
+
+    python -m benchmarks.tv_fixture --rows 100 --port 8765
+"""
+import argparse
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import math
+import random
+from threading import Thread
+from time import monotonic, sleep
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import make_tickers
+
+GAINERS_PATH = "/markets/stocks-usa/market-movers-gainers/"
+
+OVERVIEW_FIELDS = ["TickerUniversal", "Change", "Price", "Volume", "RelativeVolume", "MarketCap"]
+TECHNICALS_FIELDS = [
+    "TickerUniversal", "TechRating", "MARating", "OsRating", "RelativeStrengthIndex", "Momentum",
+]
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Stock gainers (fixture)</title></head>
+<body>
+<div id="market-screener-header-columnset-tabs" role="tablist">
+  <button id="overview" role="tab" aria-selected="true">Overview</button>
+  <button id="technicals" role="tab" aria-selected="false">Technicals</button>
+</div>
+<table>
+  <thead><tr id="hdr"></tr></thead>
+  <tbody id="rows"></tbody>
+</table>
+<script>
+const FIELDS = {fields};
+const DATA = {data};
+const TAB_DELAY_MS = {tab_delay_ms};
+const MUTATE_MS = {mutate_ms};
+let mode = "overview";
+
+function fmtVol(v) {{
+  if (v >= 1e9) return (v / 1e9).toFixed(2) + "B";
+  if (v >= 1e6) return (v / 1e6).toFixed(2) + "M";
+  if (v >= 1e3) return (v / 1e3).toFixed(2) + "K";
+  return String(Math.round(v));
+}}
+
+function cells(d) {{
+  if (mode === "overview") {{
+    return [d.chg.toFixed(2) + "%", d.price.toFixed(2) + " USD", fmtVol(d.vol),
+            d.rvol.toFixed(2), fmtVol(d.vol * d.price * 40) + " USD"];
+  }}
+  return ["Buy", "Strong buy", "Neutral", d.rsi.toFixed(2), (d.chg / 3).toFixed(2)];
+}}
+
+function render() {{
+  const hdr = document.getElementById("hdr");
+  hdr.innerHTML = FIELDS[mode].map(f => `<th data-field="${{f}}">${{f}}</th>`).join("");
+  const body = document.getElementById("rows");
+  body.innerHTML = DATA.map(d =>
+    `<tr class="listRow-fixture" data-rowkey="${{d.ticker}}"><td><a href="#">${{d.ticker}}</a></td>` +
+    cells(d).map(c => `<td>${{c}}</td>`).join("") + "</tr>").join("");
+}}
+
+function setMode(m) {{
+  document.querySelectorAll("#market-screener-header-columnset-tabs button")
+    .forEach(b => b.setAttribute("aria-selected", String(b.id === m)));
+  // The real page re-renders the table asynchronously after a tab click
+  setTimeout(() => {{ mode = m; render(); }}, TAB_DELAY_MS);
+}}
+
+document.querySelectorAll("#market-screener-header-columnset-tabs button")
+  .forEach(b => b.addEventListener("click", () => setMode(b.id)));
+
+if (MUTATE_MS > 0) {{
+  setInterval(() => {{
+    const rows = document.querySelectorAll("#rows tr");
+    for (let k = 0; k < Math.max(1, DATA.length / 20); k++) {{
+      const i = Math.floor(Math.random() * DATA.length);
+      const d = DATA[i];
+      d.price = Math.max(0.01, d.price * (1 + (Math.random() - 0.45) * 0.01));
+      d.vol += Math.random() * 20000;
+      d.rsi = Math.min(99, Math.max(1, d.rsi + (Math.random() - 0.5) * 2));
+      const c = rows[i] && rows[i].querySelectorAll("td");
+      if (!c) continue;
+      cells(d).forEach((v, j) => {{ if (c[j + 1].innerText !== v) c[j + 1].innerText = v; }});
+    }}
+  }}, MUTATE_MS);
+}}
+
+render();
+</script>
+</body>
+</html>
+"""
+
+
+@dataclass
+class FixtureConfig:
+    rows: int = 100
+    seed: int = 0
+    tick_s: float = 1.0  # seconds between server-side data steps
+    mutate_ms: int = 500  # in-page mutation interval, 0 to disable
+    tab_delay_ms: int = 50  # delay before the table re-renders after a tab click
+
+
+class TVFixture:
+    """Synthetic gainers table whose data evolves with server time."""
+    def __init__(self, config: FixtureConfig):
+        self.config = config
+        self.tickers = make_tickers(config.rows, config.seed)
+        rng = random.Random(config.seed)
+        self._base = [
+            (rng.uniform(1, 20), rng.uniform(1e5, 5e6), rng.uniform(1, 15), rng.uniform(30, 80))
+            for _ in self.tickers
+        ]
+        self._t0 = monotonic()
+
+    def snapshot(self, rows: int | None = None) -> list[dict]:
+        step = int((monotonic() - self._t0) / self.config.tick_s)
+        out = []
+        for i, ticker in enumerate(self.tickers[:rows or len(self.tickers)]):
+            price0, vol0, rvol, rsi0 = self._base[i]
+            # Deterministic per (ticker, step) so every client sees the same table
+            drift = math.sin(step * 0.05 + i) * 0.2 + step * 0.001
+            price = price0 * (1 + drift)
+            out.append({
+                "ticker": ticker,
+                "price": round(price, 2),
+                "chg": round(drift * 100, 2),
+                "vol": vol0 * (1 + step * 0.01),
+                "rvol": rvol,
+                "rsi": max(1.0, min(99.0, rsi0 + math.sin(step * 0.1 + i) * 15)),
+            })
+        out.sort(key=lambda d: d["chg"], reverse=True)
+        return out
+
+    def page(self, rows: int | None = None) -> str:
+        return PAGE.format(
+            fields=json.dumps({"overview": OVERVIEW_FIELDS, "technicals": TECHNICALS_FIELDS}),
+            data=json.dumps(self.snapshot(rows)),
+            tab_delay_ms=self.config.tab_delay_ms,
+            mutate_ms=self.config.mutate_ms,
+        )
+
+
+def serve(config: FixtureConfig, port: int = 0) -> tuple[ThreadingHTTPServer, str]:
+    """
+    Starts the fixture on a background thread and returns (server, gainers_url).
+    Port 0 picks a free port. A `?rows=N` query overrides the row count per request.
+    """
+    fixture = TVFixture(config)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            rows = parse_qs(url.query).get("rows")
+            body = fixture.page(int(rows[0]) if rows else None).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    Thread(target=server.serve_forever, name="tv-fixture", daemon=True).start()
+    host, bound_port = server.server_address[:2]
+    return server, f"http://{host}:{bound_port}{GAINERS_PATH}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local TradingView gainers stand-in.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mutate-ms", type=int, default=500)
+    parser.add_argument("--tab-delay-ms", type=int, default=50)
+    args = parser.parse_args()
+
+    server, url = serve(
+        FixtureConfig(args.rows, args.seed, mutate_ms=args.mutate_ms, tab_delay_ms=args.tab_delay_ms),
+        args.port,
+    )
+    print(f"Serving gainers fixture at {url} (Ctrl+C to stop)")
+    try:
+        while True:
+            sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
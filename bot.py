@@ -6,19 +6,35 @@
 # calculate and store their prices and percent changes, and send notifications given the  #
 # desired change from the user. It is in constant development, and is sometimes unstable. #
 #-----------------------------------------------------------------------------------------#
+from time import perf_counter
+# Everything below, imports included, counts toward the startup report
+BOOT_TIME = perf_counter()
+from checkpoint import SessionCheckpointer, recent_tickers
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dotenv import load_dotenv
+from excel_stream import (
+    ALL_SEEN_COLUMNS, EOD_COLUMNS, ExcelJournal, all_seen_row, eod_row, write_xlsx,
+)
 from datetime import datetime as dt
 from datetime import timedelta
-from millify import millify
+from functools import cache
 from float_provider import FloatProvider
-import openpyxl
+from gainers_store import GainersStore
+from history_db import HistoryWriter
+from notifier import Notifier
+import numpy as np
+from scheduler import RefreshScheduler
 import os
 from pathlib import Path
+import subprocess
 from platform import system
-from time import sleep
-from typing import Callable, Optional
+from time import perf_counter_ns, sleep
+from typing import TYPE_CHECKING, Optional
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, WebDriverException
+from selenium.common.exceptions import (
+    SessionNotCreatedException, TimeoutException, StaleElementReferenceException, WebDriverException,
+)
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
@@ -26,11 +42,14 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from signal_scorer import SignalFeatures, SignalScorer
-from rich import box, style
-from rich.console import Console
-from rich.table import Table
-from stock import Stock
-from webdriver_manager.chrome import ChromeDriverManager
+from stock import Stock, format_volume
+from tick_recorder import TickRecorder
+from tracer import tracer
+
+if TYPE_CHECKING:
+    # Render stack: imported where it's first used, as it's slow to load
+    from dashboard import Dashboard
+    from rich.console import Console
 
 ##############################################################################
 #                           GLOBAL CONFIG                                    #
@@ -60,15 +79,136 @@ CLOSE_HR = int(os.getenv("CLOSE_HR", ""))
 HEADLESS = int(os.getenv("HEADLESS", "0"))
 EOD_EXPORT_DIR = os.getenv("EOD_EXPORT_PATH", "")
 EXPORT_PATH = Path(EOD_EXPORT_DIR) if EOD_EXPORT_DIR else None
+PCT_CHG_WINDOWS = (1, 5, 10, 20)
+TICK_LOG_DIR = os.getenv("TICK_LOG_PATH", "")
+TICK_LOG_PATH = Path(TICK_LOG_DIR) if TICK_LOG_DIR else None
+STREAM_MODE = int(os.getenv("STREAM_MODE", "0"))
+STREAM_RSI_CYCLES = int(os.getenv("STREAM_RSI_CYCLES", "5"))
+STREAM_STALE_SECS = float(os.getenv("STREAM_STALE_SECS", "30"))
+PINNED_TABS = int(os.getenv("PINNED_TABS", "0"))
+SCREENER_URLS = {
+    "gainers": GAINS_URL,
+    "premarket": "https://www.tradingview.com/markets/stocks-usa/market-movers-pre-market-gainers/",
+    "unusual-volume": "https://www.tradingview.com/markets/stocks-usa/market-movers-unusual-volume/",
+}
+SCREENERS = [s.strip() for s in os.getenv("SCREENERS", "gainers").split(",") if s.strip()]
+POOL_SIZE = int(os.getenv("POOL_SIZE", "0")) or len(SCREENERS)
+POOL_TIMEOUT_SECS = float(os.getenv("POOL_TIMEOUT_SECS", "20"))
+# Bounds on the adaptive refresh period; by default a quiet table only stretches
+# it to 1.5x the chosen rate (4x while backing off timeouts)
+MIN_REFRESH_SECS = float(os.getenv("MIN_REFRESH_SECS", "2"))
+MAX_REFRESH_SECS = float(os.getenv("MAX_REFRESH_SECS", "0")) or None
+# A row only counts as moving (for pacing) once its abs % change shifts this many points in a cycle
+HOT_MOVE_PCT = float(os.getenv("HOT_MOVE_PCT", "1"))
+# Per-stage latency stats (TRACE=1), plus a Chrome trace file per run in TRACE_PATH
+TRACE = int(os.getenv("TRACE", "0"))
+TRACE_DIR = os.getenv("TRACE_PATH", "")
+TRACE_PATH = Path(TRACE_DIR) if TRACE_DIR else None
+# Live in-place dashboard instead of printing tables to the scrollback
+DASHBOARD = int(os.getenv("DASHBOARD", "0"))
+DASHBOARD_FPS = float(os.getenv("DASHBOARD_FPS", "4"))
+# Minutes between intraday Excel checkpoints in EOD_EXPORT_PATH (0 = journal only)
+EXCEL_CHECKPOINT_MIN = float(os.getenv("EXCEL_CHECKPOINT_MIN", "10"))
+# Crash-safe session checkpoints (default: in EOD_EXPORT_PATH; "0" turns them off)
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_PATH", EOD_EXPORT_DIR)
+CHECKPOINT_PATH = Path(CHECKPOINT_DIR) if CHECKPOINT_DIR and CHECKPOINT_DIR != "0" else None
+CHECKPOINT_SECS = float(os.getenv("CHECKPOINT_SECS", "30"))
+# Multi-day SQLite history of every ticker seen (default: in EOD_EXPORT_PATH; "0" turns it off)
+HISTORY_DB = os.getenv(
+    "HISTORY_DB_PATH", str(Path(EOD_EXPORT_DIR) / "history.sqlite") if EOD_EXPORT_DIR else ""
+)
+HISTORY_DB_PATH = Path(HISTORY_DB) if HISTORY_DB and HISTORY_DB != "0" else None
+# Minutes before the open to re-check login, warm the page and prefetch floats (0 = off)
+WARMUP_MIN = float(os.getenv("WARMUP_MIN", "5"))
+# Pinned chromedriver; otherwise the one webdriver_manager resolves, remembered in DRIVER_CACHE_PATH
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH", "")
+DRIVER_CACHE_PATH = Path(os.getenv("DRIVER_CACHE_PATH", str(Path.home() / ".wdm" / "stockbot_chromedriver.txt")))
 
 ##############################################################################
 #                           HELPER FUNCTIONS                                 #
 ##############################################################################
 
 
-def setup_webdriver() -> webdriver.Chrome:
+class StartupTimer:
+    """
+    Startup milestones, from the process importing bot.py up to the first
+    scrape. Each mark() records the time since the previous one; skip() drops
+    time that isn't ours (user prompts, waiting for the open) from the total.
+    """
+    def __init__(self, start: float):
+        self.marks: list[tuple[str, float]] = []
+        self.done = False
+        self._last = start
+
+    def mark(self, name: str):
+        if self.done:
+            return
+        now = perf_counter()
+        self.marks.append((name, now - self._last))
+        self._last = now
+
+    def skip(self):
+        self._last = perf_counter()
+
+    def finish(self, name: str):
+        """Marks the last milestone and prints the report, once."""
+        if self.done:
+            return
+        self.mark(name)
+        self.done = True
+        steps = ", ".join(f"{n} {secs:.2f}s" for n, secs in self.marks)
+        total = sum(secs for _, secs in self.marks)
+        print(f"\nStartup: {total:.2f}s to first scrape ({steps})")
+
+
+STARTUP = StartupTimer(BOOT_TIME)
+
+
+@cache
+def get_console() -> "Console":
+    """One console for every table we print, created on first use."""
+    from rich.console import Console
+    return Console()
+
+
+def _driver_runs(path: str) -> bool:
+    try:
+        return subprocess.run([path, "--version"], capture_output=True, timeout=10).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def chromedriver_path(refresh: bool = False) -> str:
+    """
+    Path to chromedriver. The one webdriver_manager resolved last time is
+    reused as long as it still exists and runs, so a warm start needs no
+    network; refresh=True (or a stale cache) resolves it again.
+    """
+    if CHROMEDRIVER_PATH:
+        return CHROMEDRIVER_PATH
+    if not refresh:
+        try:
+            cached = DRIVER_CACHE_PATH.read_text().strip()
+        except OSError:
+            cached = ""
+        if cached and _driver_runs(cached):
+            return cached
+    # webdriver_manager pulls in a network stack, so only import it on a miss
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+    try:
+        DRIVER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_CACHE_PATH.write_text(path)
+    except OSError as e:
+        print(f"\n\033[1;33m[WARNING]\033[0m Could not cache the chromedriver path: {e}")
+    return path
+
+
+def setup_webdriver(use_profile: bool = True) -> webdriver.Chrome:
     """
     Creates and configures the Selenium Chrome WebDriver instance.
+    Extra instances pass use_profile=False, since Chrome locks a profile
+    directory to one process.
     """
     options = webdriver.ChromeOptions()
     if OS == "Windows":
@@ -78,7 +218,7 @@ def setup_webdriver() -> webdriver.Chrome:
     profile_dir = os.getenv("TV_PROFILE_PATH", "")
     profile_name = os.getenv("TV_PROFILE_NAME", "Default")
 
-    if profile_dir:
+    if profile_dir and use_profile:
         options.add_argument(f"--user-data-dir={profile_dir}")
         options.add_argument(f"--profile-directory={profile_name}")
 
@@ -86,8 +226,13 @@ def setup_webdriver() -> webdriver.Chrome:
         options.add_argument("--headless=new")
         options.add_argument("--window-size=1300,1044")
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(options=options, service=service)
+    try:
+        driver = webdriver.Chrome(options=options, service=Service(chromedriver_path()))
+    except SessionNotCreatedException:
+        # Chrome updated past the cached driver; resolve a matching one
+        if CHROMEDRIVER_PATH:
+            raise
+        driver = webdriver.Chrome(options=options, service=Service(chromedriver_path(refresh=True)))
 
     driver.set_window_size(1300, 1044)
     driver.set_page_load_timeout(20)
@@ -116,20 +261,6 @@ def is_recaptcha_visible(driver: webdriver.Chrome) -> bool:
     )
 
 
-def play_sound(file: str):
-    """
-    Play sound for user notifications. Different approach for Windows vs. other OS.
-    """
-    if OS == "Windows":
-        import winsound
-
-        winsound.PlaySound(file, winsound.SND_ASYNC)
-    else:
-        from playsound import playsound
-
-        playsound(file)
-
-
 def get_next_day(now=None) -> tuple[dt, dt]:
     if now is None:
         now = dt.now()
@@ -269,6 +400,30 @@ def wait_for_login(driver: webdriver.Chrome, timeout: int = 15):
     )
 
 
+def ensure_logged_in(driver: webdriver.Chrome):
+    """
+    Checks the TradingView session and logs in again if it isn't live.
+    """
+    driver.get(URL)
+    logged_in = is_logged_in(driver)
+    print(
+            "You",
+            "\033[1;32mare\033[0m logged in." if logged_in
+                    else "\033[1;31mare not\033[0m logged in."
+    )
+    if not logged_in:
+        if HEADLESS:
+            raise RuntimeError(
+                    "Not logged in. Run once non-headless to authenticate.")
+        driver.get(URL)
+        login_to_tradingview(driver, EMAIL, PASS)
+        # Check recaptcha
+        check_recaptcha(driver)
+        # Make sure to wait for login (reCAPTCHA can be tricky with this)
+        wait_for_login(driver)
+
+
+@tracer.traced("wait_for_table")
 def wait_for_table(driver: webdriver.Chrome, timeout=15):
     """
     Wait until the gainers table loads by confirming at least one row
@@ -385,6 +540,23 @@ def click_header_tab(driver: webdriver.Chrome, tab_id: str):
     WebDriverWait(driver, 10).until(_selected)
 
 
+# Shared by the scrape scripts, so rows come back typed: numbers or null, volume in shares
+PARSE_JS = """
+function num(t) {
+    const n = parseFloat(t.trim().replace(/[^0-9.]/g, ''));
+    return Number.isNaN(n) ? null : n;
+}
+function shares(t) {
+    const m = t.trim().toUpperCase().replace(/,/g, '').match(/^([0-9.]+)\\s*([KMBT]?)/);
+    if (!m) return null;
+    const n = parseFloat(m[1]);
+    if (Number.isNaN(n)) return null;
+    return n * ({ "": 1, K: 1e3, M: 1e6, B: 1e9, T: 1e12 })[m[2]];
+}
+"""
+
+
+@tracer.traced("scrape_overview")
 def scrape_overview(driver: webdriver.Chrome) -> list[dict]:
     """
     Scrape overview tab from TradingView: ticker, price, volume, rvol.
@@ -393,7 +565,7 @@ def scrape_overview(driver: webdriver.Chrome) -> list[dict]:
         return []
 
     rows = driver.execute_script(
-        """
+        PARSE_JS + """
         const rowCss = arguments[0];
         return Array.from(document.querySelectorAll(rowCss))
             .slice(0, 100)
@@ -405,14 +577,11 @@ def scrape_overview(driver: webdriver.Chrome) -> list[dict]:
                     (c[0].querySelector("a")?.innerText || c[0].innerText)
                         .trim();
 
-                const priceText = c[2].innerText.trim().replace(/[^0-9.]/g, '');
-                const price = parseFloat(priceText);
-                const vol = c[3].innerText.trim();
+                const price = num(c[2].innerText);
+                const vol = shares(c[3].innerText);
+                const rvol = num(c[4].innerText);
 
-                const rvolText = c[4].innerText.trim().replace(/[^0-9.]/g, '');
-                const rvol = parseFloat(rvolText);
-
-                if (!ticker || Number.isNaN(price)) return null;
+                if (!ticker || price === null) return null;
                 return { ticker, price, vol, rvol };
             })
             .filter(r => r !== null);
@@ -421,6 +590,7 @@ def scrape_overview(driver: webdriver.Chrome) -> list[dict]:
     )
     return rows
 
+@tracer.traced("scrape_technicals")
 def scrape_technicals(driver: webdriver.Chrome) -> dict[str, float]:
     """
     Scrape technicals tab for RSI.
@@ -430,7 +600,7 @@ def scrape_technicals(driver: webdriver.Chrome) -> dict[str, float]:
         return {}
 
     rows = driver.execute_script(
-        """
+        PARSE_JS + """
         const rowCss = arguments[0];
         const result = {};
         Array.from(document.querySelectorAll(rowCss))
@@ -441,9 +611,8 @@ def scrape_technicals(driver: webdriver.Chrome) -> dict[str, float]:
                 const ticker =
                     (c[0].querySelector("a")?.innerText || c[0].innerText)
                         .trim();
-                const rsiText = c[4].innerText.trim().replace(/[^0-9.]/g, '');
-                const rsi = parseFloat(rsiText);
-                if (!ticker || Number.isNaN(rsi)) return;
+                const rsi = num(c[4].innerText);
+                if (!ticker || rsi === null) return;
                 result[ticker] = rsi;
             });
         return result;
@@ -453,62 +622,426 @@ def scrape_technicals(driver: webdriver.Chrome) -> dict[str, float]:
     return rows
 
 
-def in_gainers(gainers: list[Stock], filt: Callable[[Stock], bool]) -> Optional[Stock]:
+TABLE_STREAM_JS = PARSE_JS + """
+const rowCss = arguments[0];
+const old = window.__sbStream;
+if (old && document.contains(old.table)) return true;
+
+const first = document.querySelector(rowCss);
+const table = first && first.closest("table");
+if (!table) return false;
+
+const s = { table, rows: new Map(), rsi: new Map(), last: Date.now() };
+
+function mode() {
+    const fields = Array.from(table.querySelectorAll("thead th[data-field]"))
+        .map(th => th.getAttribute("data-field") || "");
+    if (fields.some(f => f.includes("RelativeVolume"))) return "overview";
+    if (fields.some(f => f.includes("RelativeStrengthIndex"))) return "technicals";
+    return "";
+}
+
+function capture(tr, m) {
+    const c = tr.querySelectorAll("td");
+    if (c.length < 5) return;
+    const ticker = (c[0].querySelector("a")?.innerText || c[0].innerText).trim();
+    if (!ticker) return;
+    if (m === "overview") {
+        const price = num(c[2].innerText);
+        if (price === null) return;
+        s.rows.set(ticker, { ticker, price, vol: shares(c[3].innerText), rvol: num(c[4].innerText) });
+    } else if (m === "technicals") {
+        const rsi = num(c[4].innerText);
+        if (rsi !== null) s.rsi.set(ticker, rsi);
+    }
+}
+
+s.observer = new MutationObserver(muts => {
+    s.last = Date.now();
+    const m = mode();
+    const touched = new Set();
+    for (const mu of muts) {
+        const el = mu.target.nodeType === 1 ? mu.target : mu.target.parentElement;
+        const tr = el && el.closest(rowCss);
+        if (tr) touched.add(tr);
+        for (const n of mu.addedNodes) {
+            if (n.nodeType !== 1) continue;
+            if (n.matches(rowCss)) touched.add(n);
+            else n.querySelectorAll(rowCss).forEach(r => touched.add(r));
+        }
+    }
+    touched.forEach(tr => capture(tr, m));
+});
+s.observer.observe(table, { subtree: true, childList: true, characterData: true });
+
+// Seed with the whole table so the first drain is a full snapshot
+const m = mode();
+table.querySelectorAll(rowCss).forEach(tr => capture(tr, m));
+window.__sbStream = s;
+return true;
+"""
+
+TABLE_STREAM_DRAIN_JS = """
+const s = window.__sbStream;
+if (!s || !document.contains(s.table)) return null;
+const out = {
+    rows: Array.from(s.rows.values()),
+    rsi: Object.fromEntries(s.rsi),
+    idle_ms: Date.now() - s.last,
+};
+s.rows.clear();
+s.rsi.clear();
+return out;
+"""
+
+
+class TableStream:
+    """
+    Push-based alternative to refreshing and re-scraping the page every cycle.
+    A MutationObserver installed once on the gainers table buffers rows as
+    they change in the page, and each cycle only drains what changed. RSI is
+    resampled with a tab round trip every `rsi_cycles` cycles and carried
+    between samples. Falls back to a full reload when the observer is gone or
+    the table has been quiet for `stale_secs`.
+    """
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        rsi_cycles: int = STREAM_RSI_CYCLES,
+        stale_secs: float = STREAM_STALE_SECS,
+    ):
+        self.driver = driver
+        self.rsi_cycles = max(1, rsi_cycles)
+        self.stale_secs = stale_secs
+        self.rsi: dict[str, float] = {}
+        self.timed_out = False # this cycle's reload timed out
+        self._cycle = 0
+
+    def install(self) -> bool:
+        """Installs the observer on the current page (no-op if already live)."""
+        if not ensure_header_mode(self.driver, "overview", timeout=6, retries=3):
+            return False
+        return bool(self.driver.execute_script(TABLE_STREAM_JS, STOCK_LIST_CSS))
+
+    def drain(self) -> Optional[dict]:
+        return self.driver.execute_script(TABLE_STREAM_DRAIN_JS)
+
+    def reload(self) -> bool:
+        """Full page reload, then reinstall the observer."""
+        try:
+            self.driver.refresh()
+        except TimeoutException:
+            self.timed_out = True
+            print("\n\033[1;33m[WARNING]\033[0m Page refresh timed out, continuing anyway...")
+        try:
+            wait_for_table(self.driver, 12)
+        except TimeoutException:
+            self.timed_out = True
+            print("\n\033[1;33m[WARNING]\033[0m Table did not fully load after refresh...")
+        return self.install()
+
+    def scrape(self) -> tuple[list[dict], dict[str, float]]:
+        """
+        Returns (changed overview rows, RSI by ticker) in the same shapes as
+        scrape_overview/scrape_technicals. Sets `timed_out` when a fallback
+        reload timed out.
+        """
+        self._cycle += 1
+        self.timed_out = False
+        changes = self.drain()
+        if changes is None or changes["idle_ms"] > self.stale_secs * 1000:
+            if not self.reload() or (changes := self.drain()) is None:
+                # Observer won't take; do this cycle the old way
+                return scrape_overview(self.driver), scrape_technicals(self.driver)
+
+        rows = {r["ticker"]: r for r in changes["rows"]}
+        rsi = changes["rsi"]
+        if self._cycle % self.rsi_cycles == 1 or self.rsi_cycles == 1:
+            # The observer captures the re-rendered rows on each tab switch
+            ensure_header_mode(self.driver, "technicals", timeout=6, retries=3)
+            ensure_header_mode(self.driver, "overview", timeout=6, retries=3)
+            more = self.drain()
+            if more is not None:
+                rows.update((r["ticker"], r) for r in more["rows"])
+                rsi = {**rsi, **more["rsi"]}
+
+        self.rsi.update(rsi)
+        return list(rows.values()), self.rsi
+
+
+def copy_session(src: webdriver.Chrome, dst: webdriver.Chrome, url: str = URL):
+    """
+    Logs dst in by copying src's cookies for url's site over.
+    """
+    dst.get(url)
+    for cookie in src.get_cookies():
+        try:
+            dst.add_cookie(cookie)
+        except WebDriverException:
+            # Cookies for other domains/paths can't be set from here; skip them
+            pass
+
+
+def scrape_pinned(
+    driver: webdriver.Chrome, mode: str
+) -> tuple[list[dict] | dict[str, float], dt, bool]:
     """
-    Searches for a stock of interest in the list and returns it if it exists.
+    Refreshes a driver pinned to one column set and scrapes it.
+    Returns the scrape, the time it was captured and whether the refresh or
+    table load timed out.
     """
-    for stock in gainers:
-        if filt(stock):
-            return stock
-    return None
+    timed_out = False
+    try:
+        with tracer.span("refresh"):
+            driver.refresh()
+    except TimeoutException:
+        timed_out = True
+        print(f"\n\033[1;33m[WARNING]\033[0m {mode} page refresh timed out, continuing anyway...")
+    try:
+        wait_for_table(driver, 12)
+    except TimeoutException:
+        timed_out = True
+        print(f"\n\033[1;33m[WARNING]\033[0m {mode} table did not fully load after refresh...")
+    if mode == "overview":
+        return scrape_overview(driver), dt.now(), timed_out
+    return scrape_technicals(driver), dt.now(), timed_out
+
+
+class PinnedScraper:
+    """
+    Two browser instances on the gainers page, one kept on the overview
+    column set and one on technicals, refreshed and scraped in parallel so
+    neither ever flips tabs. The technicals instance gets a copy of the
+    logged-in session's cookies.
+    """
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        url: str = GAINS_URL,
+        technicals_driver: Optional[webdriver.Chrome] = None,
+    ):
+        self.overview = driver
+        self.technicals = technicals_driver or setup_webdriver(use_profile=False)
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pinned")
+        self.timed_out = False # either page timed out last scrape
+
+        copy_session(self.overview, self.technicals, url)
+        for drv, mode in ((self.overview, "overview"), (self.technicals, "technicals")):
+            drv.get(url)
+            try:
+                wait_for_table(drv, 12)
+            except TimeoutException:
+                print(f"\n\033[1;33m[WARNING]\033[0m {mode} table did not load, pinning anyway...")
+            if not ensure_header_mode(drv, mode, timeout=8, retries=3):
+                print(f"\n\033[1;33m[WARNING]\033[0m Could not pin the {mode} tab yet.")
+
+    def scrape(self) -> tuple[list[dict], dict[str, float]]:
+        """
+        Scrapes both column sets at once. Each overview row is tagged with its
+        capture time ("captured") and its RSI's ("rsi_captured"). Sets
+        `timed_out` when either page timed out.
+        """
+        ov = self._pool.submit(scrape_pinned, self.overview, "overview")
+        te = self._pool.submit(scrape_pinned, self.technicals, "technicals")
+        overview_rows, t_overview, ov_timed_out = ov.result()
+        technicals_map, t_technicals, te_timed_out = te.result()
+        self.timed_out = ov_timed_out or te_timed_out
+        for row in overview_rows:
+            row["captured"] = t_overview
+            row["rsi_captured"] = t_technicals if row["ticker"] in technicals_map else None
+        return overview_rows, technicals_map
+
+    def close(self):
+        """Quits the extra technicals instance (the overview driver is the caller's)."""
+        self._pool.shutdown(wait=False)
+        try:
+            self.technicals.quit()
+        except Exception:
+            pass
+
+
+class ScreenerWorker:
+    """
+    One WebDriver assigned one or more screener pages. With a single page it
+    just refreshes it; with several it navigates between them each cycle.
+    """
+    def __init__(self, name: str, driver: webdriver.Chrome, pages: list[tuple[str, str]]):
+        self.name = name
+        self.driver = driver
+        self.pages = pages
+        self.timings: deque[float] = deque(maxlen=50)
+        self.skips = 0 # cycles this worker overran the pool timeout
+
+    def scrape(self) -> list[tuple[str, list[dict], dict[str, float]]]:
+        """Returns (screener, overview rows, RSI map) for each assigned page."""
+        t0 = perf_counter()
+        out = []
+        for screener, url in self.pages:
+            try:
+                with tracer.span("refresh"):
+                    if len(self.pages) > 1:
+                        self.driver.get(url)
+                    else:
+                        self.driver.refresh()
+                wait_for_table(self.driver, 12)
+            except TimeoutException:
+                print(f"\n\033[1;33m[WARNING]\033[0m {screener} table did not fully load...")
+            out.append((screener, scrape_overview(self.driver), scrape_technicals(self.driver)))
+        self.timings.append(perf_counter() - t0)
+        return out
+
+
+class ScreenerPool:
+    """
+    A pool of WebDriver instances scraping several screener pages (gainers,
+    pre-market gainers, unusual volume, ...) concurrently on a thread pool.
+    Results are merged by ticker, earlier screeners winning, for a single
+    process_stocks pass. A worker that overruns the cycle timeout is left
+    running and its results are picked up on a later cycle, so one slow page
+    never stalls the others.
+    """
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        screeners: list[str] = SCREENERS,
+        size: int = POOL_SIZE,
+        timeout: float = POOL_TIMEOUT_SECS,
+    ):
+        pages = [(name, SCREENER_URLS.get(name, name)) for name in screeners]
+        size = max(1, min(size, len(pages)))
+        self.order = [name for name, _ in pages]
+        self.timeout = timeout
+        self.workers: list[ScreenerWorker] = []
+        for i in range(size):
+            drv = driver if i == 0 else setup_webdriver(use_profile=False)
+            if i > 0:
+                copy_session(driver, drv, pages[i][1])
+            assigned = pages[i::size]
+            drv.get(assigned[0][1])
+            self.workers.append(ScreenerWorker(f"worker{i}", drv, assigned))
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="screener")
+        self._pending: dict[ScreenerWorker, Future] = {}
+        self.skipped = 0 # workers that overran the timeout last cycle
+
+    def _run(self, worker: ScreenerWorker) -> list[tuple[str, list[dict], dict[str, float]]]:
+        try:
+            return worker.scrape()
+        except WebDriverException as e:
+            print(f"\n\033[1;33m[WARNING]\033[0m {worker.name} scrape failed: {e.msg}")
+            return []
+
+    def scrape(self) -> tuple[list[dict], dict[str, float]]:
+        for w in self.workers:
+            if w not in self._pending:
+                self._pending[w] = self._executor.submit(self._run, w)
+        wait(self._pending.values(), timeout=self.timeout)
+
+        by_screener: dict[str, tuple[list[dict], dict[str, float]]] = {}
+        self.skipped = 0
+        for w, fut in list(self._pending.items()):
+            if not fut.done():
+                self.skipped += 1
+                w.skips += 1
+                print(f"\n\033[1;33m[WARNING]\033[0m {w.name} ({', '.join(p for p, _ in w.pages)}) "
+                      f"still scraping after {self.timeout:g}s, skipping it this cycle.")
+                continue
+            del self._pending[w]
+            for screener, rows, rsi in fut.result():
+                by_screener[screener] = (rows, rsi)
+
+        merged: dict[str, dict] = {}
+        rsi_map: dict[str, float] = {}
+        for screener in self.order:
+            rows, rsi = by_screener.get(screener, ([], {}))
+            for row in rows:
+                merged.setdefault(row["ticker"], row)
+            for ticker, val in rsi.items():
+                rsi_map.setdefault(ticker, val)
+        return list(merged.values()), rsi_map
+
+    def print_timings(self):
+        for w in self.workers:
+            if w.timings:
+                t = sorted(w.timings)
+                print(f"{w.name} ({', '.join(p for p, _ in w.pages)}): "
+                      f"p50 {t[len(t) // 2]:.2f}s, max {t[-1]:.2f}s over {len(t)} cycles, "
+                      f"skipped {w.skips} cycles")
+
+    def close(self):
+        """Quits every driver but the caller's (worker 0)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for w in self.workers[1:]:
+            try:
+                w.driver.quit()
+            except Exception:
+                pass
 
 
 def process_stocks(
-    gainers: list[Stock],
+    gainers: GainersStore,
     float_prov: FloatProvider,
     alerted: list[Stock],
-    new_data: list[tuple[str, float, str, float, float]],
+    new_data: list[tuple[str, float, Optional[float], Optional[float], Optional[float]]],
     pct_chg_des: float,
-) -> bool:
+    now: Optional[dt] = None,
+    notifier: Optional[Notifier] = None,
+) -> int:
     """
-    Update each Stock or create new ones based on the newly scraped data.
-    Checks if user criteria is met, plays sounds, etc.
-    Returns True if anything changed, otherwise False.
+    Update each Stock or create new ones based on the newly scraped data:
+    (ticker, price, volume in shares, rvol, rsi) rows.
+    Checks if user criteria is met, alerts, etc.
+    `now` is the cycle's timestamp (defaults to the wall clock). The cycle's
+    alerts are handed to `notifier` for the chime; without one (e.g.
+    replays) alerting is silent.
+    Returns how many rows changed (new tickers or a new abs % change), so 0
+    when nothing did.
     """
-    changed = False
+    if now is None:
+        now = dt.now()
+    changed = 0
+    seen: list[Stock] = []
+    new_alerts: list[str] = []
     for stk_name, price, vol, rvol, rsi in new_data:
-        stk = in_gainers(gainers, lambda s: s.get_ticker() == stk_name)
+        stk = gainers.get(stk_name)
         if stk:
+            seen.append(stk)
+            # Pick up the float as soon as the background lookup lands
+            if stk.get_float_shares() is None:
+                stk.set_float_shares(float_prov.peek(stk_name)[1])
             new_abs_pct_chg = stk.get_new_abs(price)
             stk.set_new_after(price)
 
             # Keep last technicals up to date
-            stk.update_technicals(price, vol, dt.now(), rvol, rsi)
+            stk.update_technicals(price, vol, now, rvol, rsi)
 
             if new_abs_pct_chg != stk.get_abs():
-                changed = True
-                stk.set_abs(new_abs_pct_chg)
+                changed += 1
+                gainers.set_abs(stk, new_abs_pct_chg)
                 stk.set_price(price)
 
             # check user criteria
             if stk.get_abs() >= pct_chg_des and not stk.has_met_crit():
-                # Get float for this stock + cache it
+                # Float was prefetched on first sighting; never wait on it here.
+                # If it hasn't landed (or failed), retry in the background.
+                float_pending = False
                 if stk.get_float_shares() is None:
-                    stk.set_float_shares(float_prov.get_float_shares(stk.get_ticker()))
+                    float_prov.prefetch(stk_name)
+                    resolved, float_shares = float_prov.peek(stk_name)
+                    stk.set_float_shares(float_shares)
+                    float_pending = not resolved
                 # Recompute vol/float now that we have a float value known
-                stk.update_technicals(price, vol, dt.now(), rvol, rsi)
+                stk.update_technicals(price, vol, now, rvol, rsi)
                 # Build features for scoring
-                vol_shares = Stock.parse_volume_to_shares(vol) or 0.0
                 feats = SignalFeatures(
                     ticker=stk.get_ticker(),
                     price=price,
                     abs_pct=stk.get_abs(),
-                    volume=vol_shares,
+                    volume=vol or 0.0,
                     float_shares=stk.float_shares,
                     rvol=stk.last_rvol,
                     rsi=stk.last_rsi,
                     vol_float_ratio=stk.last_vol_float_ratio,
-                    time=dt.now(),
+                    time=now,
                 )
                 score_obj = SignalScorer.score(feats)
                 stk.snapshot_crit_technicals(score_obj.score, score_obj.tier)
@@ -517,23 +1050,47 @@ def process_stocks(
                 print(
                     f"\n{stk.get_ticker()} +{stk.get_abs():.2f}% "
                     f"| Score: {score_obj.score:+d} ({score_obj.tier})"
-                    f"| {dt.now().strftime("%H:%M:%S")}"
+                    f"{' (float pending)' if float_pending else ''}"
+                    f"| {now.strftime("%H:%M:%S")}"
                 )
 
-                stk.did_meet_crit()
+                stk.did_meet_crit(now)
                 stk.set_base_price(price)
                 alerted.append(stk)
-                show_alert_watchlist(alerted[:10])
-                play_sound(SOUND)
+                new_alerts.append(stk_name)
         else:
             # brand new stock
-            new_stock = Stock(stk_name, price, vol, rvol, rsi, dt.now())
-            gainers.append(new_stock)
-            changed = True
-
+            seen.append(gainers.add(stk_name, price, vol, rvol, rsi, now))
+            # Start the float lookup now so it's ready if this one runs
+            float_prov.prefetch(stk_name)
+            changed += 1
+
+    # Live score/tier for every row this cycle, not just fresh alerts
+    gainers.score_live(seen)
+    if new_alerts and notifier is not None:
+        notifier.alert(new_alerts)
     return changed
 
 
+def board_pace(
+    gainers: GainersStore,
+    new_data: list[tuple],
+    board_rows: np.ndarray,
+    abs_before: np.ndarray,
+    n_seen: int,
+    pct_chg_des: float,
+) -> tuple[int, int]:
+    """
+    (movers, near_crit) for the refresh scheduler once a cycle is processed.
+    Movers are new tickers plus rows of this board whose abs % change moved
+    HOT_MOVE_PCT points since `abs_before` (taken at `board_rows` before
+    processing); near_crit only counts tickers on this cycle's board.
+    """
+    state = gainers.state
+    movers = state.moved_count(board_rows, abs_before, HOT_MOVE_PCT) + len(gainers) - n_seen
+    return movers, state.near_crit_count(pct_chg_des, state.rows_of(row[0] for row in new_data))
+
+
 def colorize_pct(val: float) -> str:
     """
     Return a Rich color markup string for the percentage, e.g. [green]2.53%[/green].
@@ -548,12 +1105,12 @@ def colorize_pct(val: float) -> str:
     return f"[{color}]{val:6.2f}%[/{color}]"
 
 
-def safe_pct(stk_age: int, val: float, min_age: int) -> str:
+def safe_pct(stk_age: int, val: Optional[float], min_age: int) -> str:
     """
     Return a colorized percent if the stock's age >= min_age, else '--'.
     This avoids showing intervals not yet 'lived'.
     """
-    if stk_age >= min_age:
+    if stk_age >= min_age and val is not None:
         return colorize_pct(val)
     else:
         return "--"
@@ -592,16 +1149,12 @@ def style_for_rvol(rvol: Optional[float]) -> str:
         return "bold white on red3"
 
 
-def style_for_vol(vol_str: Optional[str], float_shares: Optional[float] = None) -> str:
+def style_for_vol(vol_shares: Optional[float], float_shares: Optional[float] = None) -> str:
     """
     Heatmap style for volume.
     If float_shares is provided, color based on vol/float ratio (participation).
     Otherwise, color based on absolute volume bands.
     """
-    if not vol_str:
-        return "white on grey23"
-
-    vol_shares = Stock.parse_volume_to_shares(vol_str)
     if not vol_shares or vol_shares <= 0:
         return "white on grey23"
 
@@ -658,14 +1211,144 @@ def style_for_fr(fr: Optional[float]) -> str:
         return "bold white on red3"
 
 
+def watchlist_cells(s: Stock) -> list[list[str]]:
+    """
+    The three watchlist rows (spot, alert, peak) for one alerted stock, as
+    Rich markup cells.
+    """
+    # --- basic time & growth metrics ---
+    ticker = s.get_ticker()
+    score = s.get_crit_score() or 0
+    tier = s.get_crit_tier() or "-"
+
+    # SPOTTED
+    time_spotted = getattr(s, "TIME_ENTERED", None)
+    time_spotted_str = (
+        time_spotted.strftime("%H:%M:%S") if time_spotted else "n/a"
+    )
+
+    # ALERTED
+    crit_time = s.get_crit_time()
+    time_alerted_str = (
+        crit_time.strftime("%H:%M:%S") if crit_time else "n/a"
+    )
+
+    # PEAK
+    peak_time = s.get_time_max_price()
+    time_peaked_str = (
+        peak_time.strftime("%H:%M:%S") if peak_time else "n/a"
+    )
+
+    time_to_peak = s.get_time_peak_alert()
+    time_to_peak_str = f"{time_to_peak} min" if time_to_peak is not None else "n/a"
+
+    # Growths
+    g_spot_to_peak = s.get_peak_change_spot()
+    g_alert_to_peak = s.get_peak_change()
+
+    # Float & FR
+    float_shares = s.get_float_shares()
+    float_m = float_shares / 1_000_000 if float_shares else None
+    float_str = (
+            f"[{style_for_float(float_shares)}]{float_m:.2f}M[/]"
+            if float_m else "n/a"
+    )
+
+    fr_alert = s.get_crit_vol_float_ratio()
+    fr_alert_str = f"{fr_alert:.2f}x" if fr_alert is not None else "n/a"
+
+    # FR at peak: use volume_at_max_price / float
+    fr_peak = None
+    if float_shares and float_shares > 0:
+        vol_peak_shares = s.get_vol_at_max_price()
+        if vol_peak_shares:
+            fr_peak = vol_peak_shares / float_shares
+    fr_peak_str = f"{fr_peak:.2f}x" if fr_peak is not None else "n/a"
+
+    # RV / RSI snapshots
+    # Spot RV/RSI
+    rv_spot = s.get_og_rvol()
+    rsi_spot = s.get_og_rsi()
+    # Alert
+    rv_alert = s.get_crit_rvol()
+    rsi_alert = s.get_crit_rsi()
+    # Peak
+    rv_peak = s.get_peak_rvol()
+    rsi_peak = s.get_peak_rsi()
+
+    # Prices & volumes
+    price_spot = s.get_og_price()
+    vol_spot = s.get_og_vol()
+
+    price_alert = s.get_crit_price()
+    vol_alert = s.get_crit_vol()
+
+    price_peak = s.get_max_price()
+    vol_peak = s.get_vol_at_max_price()
+
+    price_spot_str = f"{price_spot:.2f}" if price_spot is not None else "n/a"
+    price_alert_str = f"{price_alert:.2f}" if price_alert is not None else "n/a"
+    price_peak_str = f"{price_peak:.2f}" if price_peak is not None else "n/a"
+
+    vol_spot_str = format_volume(vol_spot) if vol_spot is not None else "n/a"
+    vol_alert_str = format_volume(vol_alert) if vol_alert is not None else "n/a"
+    vol_peak_str = format_volume(vol_peak) if vol_peak is not None else "n/a"
+
+    # Row 1: Tick+Score | TimeSpot | Float | RV | RSI | Price | Vol
+    row1_col1 = (
+        f"[{style_for_score(score)}]{ticker} "
+        f"({tier} {score:+d})[/]"
+    )
+    row1 = [
+        row1_col1,
+        f"{time_spotted_str}",
+        f"{float_str}",
+        f"[{style_for_rvol(rv_spot)}]{rv_spot:.1f}x[/]"
+        if rv_spot is not None else "n/a",
+        f"[{style_for_rsi(rsi_spot)}]{rsi_spot:.0f}[/]"
+        if rsi_spot is not None else "n/a",
+        f"${price_spot_str}",
+        f"[{style_for_vol(vol_spot, float_shares)}]{vol_spot_str}[/]",
+    ]
+
+    # Row 2: G%spot->pk/G%alert->pk | TimeAlert | FR | RV | RSI | Price | Vol
+    row2 = [
+        f"{g_spot_to_peak:.1f}% / {g_alert_to_peak:.1f}%",
+        f"{time_alerted_str}",
+        f"[{style_for_fr(fr_alert)}]{fr_alert_str}[/]",
+        f"[{style_for_rvol(rv_alert)}]{rv_alert:.1f}x[/]"
+        if rv_alert is not None else "n/a",
+        f"[{style_for_rsi(rsi_alert)}]{rsi_alert:.0f}[/]"
+        if rsi_alert is not None else "n/a",
+        f"${price_alert_str}",
+        f"[{style_for_vol(vol_alert, float_shares)}]{vol_alert_str}[/]",
+    ]
+
+    # Row 3: AlertTime->PkTime | TimePk | FR | RV | RSI | Price | Vol
+    row3 = [
+        f"{time_to_peak_str}",
+        f"{time_peaked_str}",
+        f"[{style_for_fr(fr_peak)}]{fr_peak_str}[/]",
+        f"[{style_for_rvol(rv_peak)}]"
+        f"{rv_peak:.1f}x[/]" if rv_peak is not None else "n/a",
+        f"[{style_for_rsi(rsi_peak)}]{rsi_peak:.0f}[/]"
+        if rsi_peak is not None else "n/a",
+        f"${price_peak_str}",
+        f"{vol_peak_str}",
+    ]
+
+    return [row1, row2, row3]
+
+
 def show_alert_watchlist(stocks: list[Stock]) -> None:
     """
     Render up to 10 alerted stocks in a table/card layout for user to see.
     """
     if not stocks:
         return
-    
-    console = Console()
+    from rich import box
+    from rich.table import Table
+
     table = Table(
         show_header=False,
         box=box.SIMPLE_HEAVY,
@@ -677,353 +1360,126 @@ def show_alert_watchlist(stocks: list[Stock]) -> None:
         table.add_column(no_wrap=True)
 
     for s in stocks[:10]:
-        # --- basic time & growth metrics ---
-        ticker = s.get_ticker()
-        score = s.get_crit_score() or 0
-        tier = s.get_crit_tier() or "-"
-
-        # SPOTTED
-        time_spotted = getattr(s, "TIME_ENTERED", None)
-        time_spotted_str = (
-            time_spotted.strftime("%H:%M:%S") if time_spotted else "n/a"
-        )
+        for row in watchlist_cells(s):
+            table.add_row(*row)
 
-        # ALERTED
-        crit_time = s.get_crit_time()
-        time_alerted_str = (
-            crit_time.strftime("%H:%M:%S") if crit_time else "n/a"
-        )
+        # optional separator row between tickers
+        table.add_row("", "", "", "", "", "", "")
 
-        # PEAK
-        peak_time = s.get_time_max_price()
-        time_peaked_str = (
-            peak_time.strftime("%H:%M:%S") if peak_time else "n/a"
-        )
+    get_console().print(table)
 
-        time_to_peak = s.get_time_peak_alert()
-        time_to_peak_str = f"{time_to_peak} min" if time_to_peak is not None else "n/a"
 
-        # Growths
-        g_spot_to_peak = s.get_peak_change_spot()
-        g_alert_to_peak = s.get_peak_change()
+TOP_GAINER_COLUMNS = [
+    ("Ticker", "left"), ("Price", "right"), ("Abs%", "right"), ("Score", "right"),
+    *((f"{m}m", "right") for m in PCT_CHG_WINDOWS),
+]
 
-        # Float & FR
-        float_shares = s.get_float_shares()
-        float_m = float_shares / 1_000_000 if float_shares else None
-        float_str = (
-                f"[{style_for_float(float_shares)}]{float_m:.2f}M[/]"
-                if float_m else "n/a"
-        )
 
-        fr_alert = s.get_crit_vol_float_ratio()
-        fr_alert_str = f"{fr_alert:.2f}x" if fr_alert is not None else "n/a"
-
-        # FR at peak: use volume_at_max_price / float
-        fr_peak = None
-        if float_shares and float_shares > 0:
-            vol_peak_shares = Stock.parse_volume_to_shares(s.get_vol_at_max_price())
-            if vol_peak_shares:
-                fr_peak = vol_peak_shares / float_shares
-        fr_peak_str = f"{fr_peak:.2f}x" if fr_peak is not None else "n/a"
-
-        # RV / RSI snapshots
-        # Spot RV/RSI
-        rv_spot = s.get_og_rvol()
-        rsi_spot = s.get_og_rsi()
-        # Alert
-        rv_alert = s.get_crit_rvol()
-        rsi_alert = s.get_crit_rsi()
-        # Peak
-        rv_peak = s.get_peak_rvol()
-        rsi_peak = s.get_peak_rsi()
-
-        # Prices & volumes
-        price_spot = s.get_og_price()
-        vol_spot = s.get_og_vol()
-
-        price_alert = s.get_crit_price()
-        vol_alert = s.get_crit_vol()
-
-        price_peak = s.get_max_price()
-        vol_peak = s.get_vol_at_max_price()
-
-        price_spot_str = f"{price_spot:.2f}" if price_spot is not None else "n/a"
-        price_alert_str = f"{price_alert:.2f}" if price_alert is not None else "n/a"
-        price_peak_str = f"{price_peak:.2f}" if price_peak is not None else "n/a"
-
-        vol_spot_str = vol_spot or "n/a"
-        vol_alert_str = vol_alert or "n/a"
-        vol_peak_str = vol_peak or "n/a"
-
-        # Row 1: Tick+Score | TimeSpot | Float | RV | RSI | Price | Vol
-        row1_col1 = (
-            f"[{style_for_score(score)}]{ticker} "
-            f"({tier} {score:+d})[/]"
-        )
-        row1 = [
-            row1_col1,
-            f"{time_spotted_str}",
-            f"{float_str}",
-            f"[{style_for_rvol(rv_spot)}]{rv_spot:.1f}x[/]"
-            if rv_spot is not None else "n/a",
-            f"[{style_for_rsi(rsi_spot)}]{rsi_spot:.0f}[/]"
-            if rsi_spot is not None else "n/a",
-            f"${price_spot_str}",
-            f"[{style_for_vol(vol_spot_str, float_shares)}]{vol_spot_str}[/]",
-        ]
-
-        # Row 2: G%spot->pk/G%alert->pk | TimeAlert | FR | RV | RSI | Price | Vol
-        row2 = [
-            f"{g_spot_to_peak:.1f}% / {g_alert_to_peak:.1f}%",
-            f"{time_alerted_str}",
-            f"[{style_for_fr(fr_alert)}]{fr_alert_str}[/]",
-            f"[{style_for_rvol(rv_alert)}]{rv_alert:.1f}x[/]"
-            if rv_alert is not None else "n/a",
-            f"[{style_for_rsi(rsi_alert)}]{rsi_alert:.0f}[/]"
-            if rsi_alert is not None else "n/a",
-            f"${price_alert_str}",
-            f"[{style_for_vol(vol_alert_str, float_shares)}]{vol_alert_str}[/]",
-        ]
-
-        # Row 3: AlertTime->PkTime | TimePk | FR | RV | RSI | Price | Vol
-        row3 = [
-            f"{time_to_peak_str}",
-            f"{time_peaked_str}",
-            f"[{style_for_fr(fr_peak)}]{fr_peak_str}[/]",
-            f"[{style_for_rvol(rv_peak)}]"
-            f"{rv_peak:.1f}x[/]" if rv_peak is not None else "n/a",
-            f"[{style_for_rsi(rsi_peak)}]{rsi_peak:.0f}[/]"
-            if rsi_peak is not None else "n/a",
-            f"${price_peak_str}",
-            f"{vol_peak_str}",
-        ]
-
-        table.add_row(*row1)
-        table.add_row(*row2)
-        table.add_row(*row3)
+def top_gainer_cells(s: Stock) -> list[str]:
+    """One top gainers row as Rich markup cells (see TOP_GAINER_COLUMNS)."""
+    age = s.get_age()
+    score = s.get_live_score()
+    score_str = (
+        f"[{style_for_score(score)}]{s.get_live_tier()} {score:+d}[/]"
+        if score is not None else "--"
+    )
+    return [
+        s.get_ticker(),
+        f"${s.price:.2f}",
+        colorize_pct(s.get_abs()),
+        score_str,
+        *(safe_pct(age, s.get_pct_chg(m), m) for m in PCT_CHG_WINDOWS),
+    ]
 
-        # optional separator row between tickers
-        table.add_row("", "", "", "", "", "", "")
 
-    console.print(table)
+def show_top_gainers(stocks: list[Stock], now: dt) -> None:
+    """
+    Render the top gainers with their absolute and 1/5/10/20-minute % changes.
+    """
+    if not stocks:
+        return
+    from rich import box
+    from rich.table import Table
+
+    table = Table(
+        title=f"TOP {len(stocks)} GAINERS @ {now.strftime('%H:%M:%S')}",
+        show_header=True,
+        header_style="bold cyan",
+        box=box.SIMPLE_HEAVY,
+    )
+    for header, justify in TOP_GAINER_COLUMNS:
+        table.add_column(header, justify=justify)
+
+    for s in stocks:
+        table.add_row(*top_gainer_cells(s))
+
+    get_console().print(table)
+
+
+def update_dashboard(
+    dashboard: "Dashboard", gainers: GainersStore, alerted: list[Stock], now: dt
+) -> None:
+    """Hands the current top 5 and alert watchlist to the live dashboard."""
+    top = gainers.top(5)
+    dashboard.set_section(
+        "top",
+        f"TOP {len(top)} GAINERS @ {now.strftime('%H:%M:%S')}",
+        TOP_GAINER_COLUMNS,
+        [(s.get_ticker(), top_gainer_cells(s)) for s in top],
+    )
+    rows = []
+    for s in alerted[:10]:
+        for i, cells in enumerate(watchlist_cells(s)):
+            rows.append(((s.get_ticker(), i), cells))
+        rows.append(((s.get_ticker(), "sep"), [""] * 7))
+    dashboard.set_section("alerts", "ALERTS" if rows else "", [("", "left")] * 7, rows)
 
 
 def export_eod_stats_to_excel(
-        winners: list[Stock], pct_chg_des: float, export_dir: Path
+        winners: list[Stock], pct_chg_des: float, export_dir: Path, day: Optional[dt] = None
 ):
     """
     Create/write to an Excel file with the summary of stocks that met criteria.
+    The file is dated `day`, the session's date (defaults to today).
     """
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    assert ws is not None, "Logic error: openpyxl's wb.active is unexpectedly None!"
-    ws.title = f"EOD Crit Stock Growth Summary"
-
-    headers = [
-        "CritTime",
-        "CritPrice",
-        "Ticker",
-        "PeakTime",
-        "MaxPrice",
-        "Volume",
-        "Peak%",
-        "Score",
-        "Tier",
-        "Peak%FromSpot",
-        "Time2Peak(min)",
-        "FloatShares",
-        "CritRVol",
-        "CritRSI",
-        "CritFR",
-    ]
-    ws.append(headers)
-
-    # Format for date/time we want
-    date_format = "HH:MM:SS"
-    pct_format = "0.00%"
-    currency_format = '"$"#,##0.00'
-
-    # Store today's date/time for naming
-    date_str = dt.now().strftime("%Y_%m_%d")
-
-    # Append a row for each winner
-    for s in winners:
-        crit_time = s.get_crit_time()
-        peak_time = s.get_time_max_price()
-        # e.g. 20.0 => 0.2 in excel
-        peak_change = s.get_peak_change() / 100.0
-        peak_from_spot = s.get_peak_change_spot() / 100.0
-        time_to_peak = s.get_time_peak_alert()
-
-        row = [
-            crit_time,  # datetime
-            s.get_crit_price(),  # float
-            s.get_ticker(),  # string
-            peak_time,  # datetime
-            s.get_max_price(),  # float
-            s.get_vol_at_max_price(),  # string
-            peak_change,  # float for actual %  e.g. 0.2 => 20%
-            s.get_crit_score(),
-            s.get_crit_tier(),
-            peak_from_spot,
-            time_to_peak,
-            s.get_float_shares(),
-            s.get_crit_rvol(),
-            s.get_crit_rsi(),
-            s.get_crit_vol_float_ratio(),
-        ]
-        ws.append(row)
-
-    # Data starts at row 2
-    for i in range(2, len(winners) + 2):
-        # CritTime
-        ws.cell(row=i, column=1).number_format = date_format
-        # PeakTime
-        ws.cell(row=i, column=4).number_format = date_format
-        # CritPrice
-        ws.cell(row=i, column=2).number_format = currency_format
-        # MaxPrice
-        ws.cell(row=i, column=5).number_format = currency_format
-        # Peak%
-        ws.cell(row=i, column=7).number_format = pct_format
-        # Peak%FromSpot
-        ws.cell(row=i, column=10).number_format = pct_format
-        # 
-
-    fname = f"eod_summary_{pct_chg_des}%_{date_str}.xlsx"
-    export_dir.mkdir(parents=True, exist_ok=True)
-    fpath = export_dir / fname
-
-    wb.save(str(fpath))
+    date_str = (day or dt.now()).strftime("%Y_%m_%d")
+    fpath = export_dir / f"eod_summary_{pct_chg_des}%_{date_str}.xlsx"
+    write_xlsx(fpath, "EOD Crit Stock Growth Summary", EOD_COLUMNS, (eod_row(s) for s in winners))
     print(f"End-of-day summary exported to: {fpath}")
 
 
-def export_all_seen_to_excel(stocks: list[Stock], pct_chg_des: float, export_dir: Path) -> None:
+def export_all_seen_to_excel(
+        stocks: list[Stock], pct_chg_des: float, export_dir: Path, day: Optional[dt] = None
+) -> None:
     """
     Export *every* ticker that appeared in Top Gainers at any point during the session.
-    One row per ticker (summary-style, not tick-by-tick).
-    """
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    assert ws is not None
-    ws.title = "All Top Gainers Seen"
-
-    headers = [
-        "TimeEntered",
-        "Ticker",
-        "OG_Price",
-        "OG_Vol",
-        "OG_RVol",
-        "OG_RSI",
-        "MetCriteria",
-        "CritTime",
-        "CritPrice",
-        "CritScore",
-        "Tier",
-        "FloatShares",
-        "CritRVol",
-        "CritRSI",
-        "CritFR",
-        "PeakTime",
-        "MaxPrice",
-        "VolAtPeak",
-        "Peak%FromSpot",
-        "Peak%FromAlert",
-        "TimeAlertToPeak(min)",
-    ]
-    ws.append(headers)
-
-    date_format = "HH:MM:SS"
-    pct_format = "0.00%"
-    currency_format = '"$"#,##0.00'
-
-    date_str = dt.now().strftime("%Y_%m_%d")
-
-    for s in stocks:
-        time_entered = s.get_time_entered()
-        ticker = s.get_ticker()
-
-        og_price = s.get_og_price()
-        og_vol = s.get_og_vol()
-        og_rvol = s.get_og_rvol()
-        og_rsi = s.get_og_rsi()
-
-        met = s.has_met_crit()
-        crit_time = s.get_crit_time()
-        crit_price = s.get_crit_price()
-        crit_score = s.get_crit_score()
-        crit_tier = s.get_crit_tier()
-
-        float_shares = s.get_float_shares()
-        crit_rvol = s.get_crit_rvol()
-        crit_rsi = s.get_crit_rsi()
-        crit_fr = s.get_crit_vol_float_ratio()
-
-        peak_time = s.get_time_max_price()
-        max_price = s.get_max_price()
-        vol_at_peak = s.get_vol_at_max_price()
-
-        # Excel wants percents as fractions (0.25 = 25%)
-        peak_from_spot = s.get_peak_change_spot() / 100.0
-        peak_from_alert = s.get_peak_change() / 100.0
-        time_alert_to_peak = s.get_time_peak_alert()
-
-        ws.append([
-            time_entered,
-            ticker,
-            og_price,
-            og_vol,
-            og_rvol,
-            og_rsi,
-            met,
-            crit_time,
-            crit_price,
-            crit_score,
-            crit_tier,
-            float_shares,
-            crit_rvol,
-            crit_rsi,
-            crit_fr,
-            peak_time,
-            max_price,
-            vol_at_peak,
-            peak_from_spot,
-            peak_from_alert,
-            time_alert_to_peak,
-        ])
-
-    # Format time / currency / percent columns
-    for i in range(2, len(stocks) + 2):
-        ws.cell(row=i, column=1).number_format = date_format   # TimeEntered
-        ws.cell(row=i, column=4).number_format = "@"           # OG_Vol (string)
-        ws.cell(row=i, column=8).number_format = date_format   # CritTime
-        ws.cell(row=i, column=16).number_format = date_format  # PeakTime
-
-        ws.cell(row=i, column=3).number_format = currency_format   # OG_Price
-        ws.cell(row=i, column=9).number_format = currency_format   # CritPrice
-        ws.cell(row=i, column=17).number_format = currency_format  # MaxPrice
-
-        ws.cell(row=i, column=19).number_format = pct_format   # Peak%FromSpot
-        ws.cell(row=i, column=20).number_format = pct_format   # Peak%FromAlert
-
-    fname = f"all_gainers_{pct_chg_des}%_{date_str}.xlsx"
-    export_dir.mkdir(parents=True, exist_ok=True)
-    fpath = export_dir / fname
-    wb.save(str(fpath))
+    One row per ticker (summary-style, not tick-by-tick), dated like the EOD summary.
+    """
+    date_str = (day or dt.now()).strftime("%Y_%m_%d")
+    fpath = export_dir / f"all_gainers_{pct_chg_des}%_{date_str}.xlsx"
+    write_xlsx(fpath, "All Top Gainers Seen", ALL_SEEN_COLUMNS, (all_seen_row(s) for s in stocks))
     print(f"All-seen gainers exported to: {fpath}")
 
 
-def show_eod_stats(gainers: list[Stock], pct_chg_des: float):
+def show_eod_stats(
+    gainers: GainersStore,
+    pct_chg_des: float,
+    export_dir: Optional[Path] = EXPORT_PATH,
+    day: Optional[dt] = None,
+):
     """
     End-of-day summary for all stocks that have met or surpassed pct_chg_des, in a Rich table.
-    Saves to excel file if possible for record keeping.
+    Saves to excel file in export_dir if possible for record keeping, dated `day`.
     """
-    winners = [s for s in gainers if s.has_met_crit()]
+    state = gainers.state
+    rows = state.crit_rows()
+    winners = [gainers.stock_at(r) for r in rows]
     if not winners:
         print("\nNo stocks met or surpassed your desired growth today.")
         return
+    from millify import millify
+    from rich.table import Table
 
-    console = Console()
     table = Table(
         title=f"SUMMARY OF STOCKS THAT SURPASSED {pct_chg_des}% GROWTH TODAY",
         show_header=True,
@@ -1046,16 +1502,20 @@ def show_eod_stats(gainers: list[Stock], pct_chg_des: float):
     table.add_column("RSI", justify="right")
     table.add_column("FloatRatio", justify="right")
 
-    for s in winners:
+    # Peak stats for every winner at once, straight from the session columns
+    peak_changes = state.peak_change(rows)
+    peaks_from_spot = state.peak_change_spot(rows)
+    times_to_peak = state.time_peak_alert(rows)
+
+    for s, peak_change, peak_from_spot, time_to_peak in zip(
+        winners, peak_changes, peaks_from_spot, times_to_peak
+    ):
         crit_time = s.get_crit_time()
         time_max = s.get_time_max_price()
         assert crit_time is not None, "Logic error: we must have crit time here!"
         assert time_max is not None, "Logic error: we must have time max here!"
         crit_time_str = crit_time.strftime("%H:%M:%S")
         time_max_str = time_max.strftime("%H:%M:%S")
-        peak_change = s.get_peak_change()
-        peak_from_spot = s.get_peak_change_spot()
-        time_to_peak = s.get_time_peak_alert()
         crit_score = s.get_crit_score() if s.get_crit_score() is not None else 0
         float_shares = s.get_float_shares()
         crit_rvol = s.get_crit_rvol()
@@ -1064,7 +1524,8 @@ def show_eod_stats(gainers: list[Stock], pct_chg_des: float):
         crit_vol_float_ratio = round(crit_vol_float_ratio, 2) if crit_vol_float_ratio is not None else None
 
 
-        volume_str = s.get_vol_at_max_price()
+        volume = s.get_vol_at_max_price()
+        volume_str = format_volume(volume) if volume is not None else "--"
         peak_str = colorize_pct(peak_change)
         crit_price_str = f"${s.get_crit_price():.2f}"
         max_price_str = f"${s.get_max_price():.2f}"
@@ -1095,57 +1556,191 @@ def show_eod_stats(gainers: list[Stock], pct_chg_des: float):
             crit_vol_float_ratio_str
         )
 
-    console.print(table)
-    if EXPORT_PATH is not None:
-        export_eod_stats_to_excel(winners, pct_chg_des, EXPORT_PATH)
+    get_console().print(table)
+    if export_dir is not None:
+        export_eod_stats_to_excel(winners, pct_chg_des, export_dir, day)
     else:
         print("No EOD_EXPORT_PATH environment variable found; skipping Excel export.")
 
 
+def warm_up(driver: webdriver.Chrome, float_prov: FloatProvider, day: dt) -> bool:
+    """
+    Pre-open warm-up, so the first cycle after the open runs at steady-state
+    latency rather than cold: re-checks the login, reloads the gainers page
+    and validates the table and both header tabs, runs each scrape script
+    once so Chrome has them compiled, and queues float lookups for the
+    previous session's tickers plus whatever is on the table now.
+    Returns False if the table or tabs didn't check out.
+    """
+    t0 = perf_counter()
+    with tracer.span("warm_up"):
+        try:
+            ensure_logged_in(driver)
+        except RuntimeError as e:
+            # Headless and logged out: scrape what the public page shows rather than stop
+            print(f"\n\033[1;33m[WARNING]\033[0m Warm-up: {e}")
+        driver.get(GAINS_URL)
+        try:
+            wait_for_table(driver, 20)
+        except TimeoutException:
+            print("\n\033[1;33m[WARNING]\033[0m Warm-up: the gainers table did not load.")
+            return False
+        technicals = scrape_technicals(driver)
+        overview = scrape_overview(driver)
+        if not overview or not technicals:
+            print("\n\033[1;33m[WARNING]\033[0m Warm-up: could not read both the overview "
+                  "and technicals tabs; check the page layout.")
+            return False
+        tickers = [row["ticker"] for row in overview]
+        if CHECKPOINT_PATH is not None:
+            tickers += recent_tickers(CHECKPOINT_PATH, day)
+        for ticker in dict.fromkeys(tickers):
+            float_prov.prefetch(ticker)
+    print(f"Warm-up done in {perf_counter() - t0:.1f}s: table OK ({len(overview)} rows), "
+          f"{len(float_prov.cache)} floats cached, {float_prov.pending} lookups queued.")
+    return True
+
+
 def run_main_loop(
     MARKET_CLOSE: dt,
     driver: webdriver.Chrome,
     float_prov: FloatProvider,
-    gainers: list[Stock],
+    gainers: GainersStore,
     ref_rate_des: float,
     pct_chg_des: float,
+    recorder: Optional[TickRecorder] = None,
+    journal: Optional[ExcelJournal] = None,
+    checkpointer: Optional[SessionCheckpointer] = None,
+    alerted: Optional[list[Stock]] = None,
+    history: Optional[HistoryWriter] = None,
 ):
     """
     The main loop that repeatedly scrapes the gainers table, updates stocks,
     checks user criteria, displays top 5 if changed, etc.
+    Every cycle's rows are also handed to the tick recorder, and new sightings
+    and alerts to the Excel journal, if given. The session is checkpointed
+    periodically and on the way out, if given a checkpointer. Alerts go to
+    the history database as they happen, if given one.
     """
-    alerted: list[Stock] = []
-
-    while dt.now() < MARKET_CLOSE:
-        # 1) Refresh the browser to get latest data
-        try:
-            driver.refresh()
-        except TimeoutException:
-            print("\n\033[1;33m[WARNING]\033[0m Page refresh timed out, continuing anyway...")
-        try:
-            wait_for_table(driver, 12)
-        except TimeoutException:
-            print("\n\033[1;33m[WARNING]\033[0m Table did not fully load after refresh...")
-  
-        # 2) Scrape
-        overview_rows = scrape_overview(driver)
-        technicals_map = scrape_technicals(driver)
-
-        new_data = []
-        for row in overview_rows:
-            rsi = technicals_map.get(row["ticker"])
-            new_data.append(
-                (row["ticker"], row["price"], row["vol"], row["rvol"], rsi)
-            )
-        # 3) Process
-        changed = process_stocks(
-            gainers, float_prov, alerted, new_data, pct_chg_des
-        )
-        # 4) If changed, sort and show top 5
-        if changed:
-            gainers.sort(key=lambda s: s.get_abs(), reverse=True)
-        # 5) Sleep
-        sleep(ref_rate_des if changed else 10)
+    if alerted is None:
+        alerted = []
+    pool = ScreenerPool(driver) if len(SCREENERS) > 1 or POOL_SIZE > 1 else None
+    pinned = PinnedScraper(driver) if PINNED_TABS and pool is None else None
+    stream = TableStream(driver) if STREAM_MODE and pool is None and pinned is None else None
+    notifier = Notifier(SOUND)
+    dashboard = None
+    if DASHBOARD:
+        from dashboard import Dashboard
+        dashboard = Dashboard(get_console(), DASHBOARD_FPS)
+        dashboard.start()
+    scheduler = RefreshScheduler(ref_rate_des, MIN_REFRESH_SECS, MAX_REFRESH_SECS)
+    try:
+        while dt.now() < MARKET_CLOSE:
+            cycle_start = perf_counter_ns()
+            timed_out = False
+            if pool is not None:
+                # 1-2) Every configured screener at once, merged by ticker
+                with tracer.span("pool_scrape"):
+                    overview_rows, technicals_map = pool.scrape()
+                # One slow page is skipped on its own; only back the whole
+                # refresh off when nothing came back at all
+                timed_out = pool.skipped == len(pool.workers) or not overview_rows
+            elif pinned is not None:
+                # 1-2) Both column sets at once, each on its own browser
+                with tracer.span("pinned_scrape"):
+                    overview_rows, technicals_map = pinned.scrape()
+                timed_out = pinned.timed_out
+            elif stream is not None:
+                # 1-2) Only the rows that changed in the page since last cycle
+                with tracer.span("stream_scrape"):
+                    overview_rows, technicals_map = stream.scrape()
+                timed_out = stream.timed_out
+            else:
+                # 1) Refresh the browser to get latest data
+                try:
+                    with tracer.span("refresh"):
+                        driver.refresh()
+                except TimeoutException:
+                    timed_out = True
+                    print("\n\033[1;33m[WARNING]\033[0m Page refresh timed out, continuing anyway...")
+                try:
+                    wait_for_table(driver, 12)
+                except TimeoutException:
+                    timed_out = True
+                    print("\n\033[1;33m[WARNING]\033[0m Table did not fully load after refresh...")
+
+                # 2) Scrape
+                overview_rows = scrape_overview(driver)
+                technicals_map = scrape_technicals(driver)
+
+            new_data = []
+            for row in overview_rows:
+                rsi = technicals_map.get(row["ticker"])
+                new_data.append(
+                    (row["ticker"], row["price"], row["vol"], row["rvol"], rsi)
+                )
+            STARTUP.finish("first scrape")
+            # One timestamp for the whole cycle, shared with the recorder so
+            # replays see exactly the clock the live run did
+            cycle_time = dt.now()
+            if recorder is not None:
+                # With the float each row's lookup had landed on, so replays
+                # score against the same floats the live run had
+                recorder.record(cycle_time, new_data, [float_prov.peek(row[0]) for row in new_data])
+            # 3) Process, noting where this cycle's board stood to tell movers from ticks
+            board_rows = gainers.state.rows_of(row[0] for row in new_data)
+            abs_before = gainers.state.col("abs_pct_chg")[board_rows]
+            n_alerted = len(alerted)
+            n_seen = len(gainers)
+            with tracer.span("process_stocks"):
+                changed = process_stocks(
+                    gainers, float_prov, alerted, new_data, pct_chg_des, cycle_time, notifier
+                )
+            if journal is not None:
+                with tracer.span("excel_journal"):
+                    # New tickers take the next rows of the session state, in order
+                    journal.record("seen", (gainers.stock_at(r) for r in range(n_seen, len(gainers))))
+                    journal.record("alert", alerted[n_alerted:])
+                    journal.maybe_checkpoint(alerted, gainers, cycle_time)
+            if history is not None and len(alerted) > n_alerted:
+                history.record(cycle_time, pct_chg_des, alerted[n_alerted:])
+            if checkpointer is not None:
+                with tracer.span("checkpoint"):
+                    checkpointer.maybe_save(gainers, alerted, cycle_time)
+            # 4) Show top 5 (gainers store keeps itself ranked) and the watchlist
+            with tracer.span("render"):
+                if dashboard is not None:
+                    update_dashboard(dashboard, gainers, alerted, cycle_time)
+                else:
+                    if len(alerted) > n_alerted:
+                        show_alert_watchlist(alerted[:10])
+                    if changed:
+                        show_top_gainers(gainers.top(5), cycle_time)
+            if tracer.enabled:
+                tracer.add("cycle", cycle_start, perf_counter_ns() - cycle_start)
+            # 5) Wait out the rest of the cycle; faster when rows are moving
+            # (new listings, or abs % shifting HOT_MOVE_PCT points) or tickers
+            # on this cycle's board are closing in, slower when static or timing
+            # out. Tickers that left the board keep their last abs %, so don't count
+            movers, near_crit = board_pace(gainers, new_data, board_rows, abs_before, n_seen, pct_chg_des)
+            lateness = scheduler.wait(movers, near_crit, timed_out)
+            if lateness > scheduler.period / 2:
+                print(f"\n\033[1;33m[WARNING]\033[0m Cycle ran {lateness:.1f}s past its "
+                      f"{scheduler.period:g}s refresh period.")
+    finally:
+        if checkpointer is not None:
+            checkpointer.close(gainers, alerted)
+        if dashboard is not None:
+            dashboard.close()
+        print(f"\n{scheduler.summary()}")
+        if tracer.enabled:
+            print(f"\n{tracer.report()}")
+        notifier.close()
+        if pool is not None:
+            pool.print_timings()
+            pool.close()
+        if pinned is not None:
+            pinned.close()
 
 
 def main():
@@ -1153,58 +1748,108 @@ def main():
     Main entry point for the StockBot application.
     Checks market day, waits if before open, obtains user params, logs in, and runs main loop.
     """
+    STARTUP.mark("imports")
+    if TRACE or TRACE_PATH is not None:
+        tracer.enable(
+            TRACE_PATH / f"trace_{dt.now().strftime('%Y_%m_%d_%H%M%S')}.json" if TRACE_PATH else None
+        )
+        # `kill -USR1 <pid>` prints the per-stage latencies at any time
+        tracer.print_on_signal()
     float_prov = FloatProvider()
+    if len(float_prov.cache):
+        print(f"Loaded {len(float_prov.cache)} cached floats.")
+    STARTUP.mark("float cache")
+    history = None
+    if HISTORY_DB_PATH is not None:
+        history = HistoryWriter(HISTORY_DB_PATH)
+        STARTUP.mark("history db")
     ref_rate_des, pct_chg_des = get_user_params()
+    STARTUP.skip()
     # Setup driver & login
     driver = setup_webdriver()
+    STARTUP.mark("browser")
     try:
-        driver.get(URL)
-        logged_in = is_logged_in(driver)
-        print(
-                "You",
-                "\033[1;32mare\033[0m logged in." if logged_in
-                        else "\033[1;31mare not\033[0m logged in."
-        )
-        if not logged_in:
-            if HEADLESS:
-                raise RuntimeError(
-                        "Not logged in. Run once non-headless to authenticate.")
-            driver.get(URL)
-            login_to_tradingview(driver, EMAIL, PASS)
-            # Check recaptcha
-            check_recaptcha(driver)
-            # Make sure to wait for login (reCAPTCHA can be tricky with this)
-            wait_for_login(driver)
+        ensure_logged_in(driver)
+        STARTUP.mark("login")
 
         # Go to Gainers page
         driver.get(GAINS_URL)
+        STARTUP.mark("gainers page")
 
         while True:
             # Get next market day
             now = dt.now()
             next_open, next_close = get_next_day(now)
             sec_until_open = (next_open - now).total_seconds() 
-            # Create main list
-            gainers = []
+            # Create main store, picking up where a crashed run left off today
+            gainers = GainersStore()
+            alerted: list[Stock] = []
+            checkpointer = None
+            if CHECKPOINT_PATH is not None:
+                checkpointer = SessionCheckpointer(
+                    CHECKPOINT_PATH / f"session_{pct_chg_des}%_{next_open.strftime('%Y_%m_%d')}.npz",
+                    next_open, CHECKPOINT_SECS,
+                )
+                restored = checkpointer.restore()
+                if restored is not None:
+                    gainers, alerted, load_ms = restored
+                    print(f"Restored {len(gainers)} tickers and {len(alerted)} alerts "
+                          f"from {checkpointer.path} in {load_ms:.0f} ms.")
+                    for s in gainers:
+                        if s.get_float_shares() is None:
+                            float_prov.prefetch(s.get_ticker())
+                STARTUP.mark("checkpoint restore")
             # Wait until market open of next available day
             if sec_until_open > 0:
                 print(f"\nWaiting until market open on {next_open.strftime('%a @ %H:%M:%S')}...")
-                sleep(sec_until_open)
+                if WARMUP_MIN > 0:
+                    # Sleep to a few minutes before the open, then get everything hot
+                    sleep(max(0.0, sec_until_open - WARMUP_MIN * 60))
+                    warm_up(driver, float_prov, next_open)
+                    sleep(max(0.0, (next_open - dt.now()).total_seconds()))
+                else:
+                    sleep(sec_until_open)
+                STARTUP.skip()
+            # Record every scrape cycle if asked to
+            recorder = None
+            if TICK_LOG_PATH is not None:
+                recorder = TickRecorder(
+                    TICK_LOG_PATH / f"ticks_{next_open.strftime('%Y_%m_%d')}.bin"
+                )
+            # Journal the session for the Excel exports as it happens
+            journal = None
+            if EXPORT_PATH is not None:
+                journal = ExcelJournal(EXPORT_PATH, pct_chg_des, next_open, EXCEL_CHECKPOINT_MIN)
             # Run main loop
-            run_main_loop(
-                next_close, driver, float_prov, gainers, ref_rate_des, pct_chg_des
-            )
+            try:
+                run_main_loop(
+                    next_close, driver, float_prov, gainers, ref_rate_des, pct_chg_des,
+                    recorder, journal, checkpointer, alerted, history,
+                )
+            finally:
+                if recorder is not None:
+                    recorder.close()
 
             # End-of-day summary
-            show_eod_stats(gainers, pct_chg_des)
+            show_eod_stats(gainers, pct_chg_des, EXPORT_PATH, next_open)
+            print(f"\n{float_prov.metrics.summary()}")
             # Export everything we saw even if no stocks hit criteria
             if EXPORT_PATH is not None:
-                export_all_seen_to_excel(gainers, pct_chg_des, EXPORT_PATH)
+                export_all_seen_to_excel(list(gainers), pct_chg_des, EXPORT_PATH, next_open)
+            if journal is not None:
+                journal.finalize()
+            # Final stats for every ticker seen, alerted or not
+            if history is not None:
+                history.record(next_open, pct_chg_des, gainers)
 
             print("\nMarket CLOSED now!\n")
     except KeyboardInterrupt:
         print("\nEnding program...")
     finally:
+        float_prov.close()
+        if history is not None:
+            history.close()
+        tracer.close()
         try:
             driver.quit()
         except Exception:
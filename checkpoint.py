@@ -0,0 +1,157 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+import os
+from pathlib import Path
+from time import perf_counter
+from typing import Optional
+
+import numpy as np
+
+from gainers_store import GainersStore
+from price_history import PriceHistory
+from session_state import FIELDS, NO_INT, SessionState
+from stock import Stock
+
+# Layout: one .npz holding every SessionState column over the filled rows,
+# the tickers, each stock's price ring as one (rows, ring) float64 matrix
+# with its first/last bucket, the alerted rows in alert order, and the
+# version/day it belongs to.
+VERSION = 2
+
+Snapshot = tuple[list[str], dict[str, np.ndarray], list[tuple], list[int], str]
+
+
+def take_snapshot(gainers: GainersStore, alerted: list[Stock], day: datetime) -> Snapshot:
+    """Copies everything a checkpoint needs; cheap enough for the loop thread."""
+    state = gainers.state
+    histories = [gainers.stock_at(r).past_prices.snapshot() for r in range(len(state))]
+    return (
+        list(state.tickers), state.snapshot(), histories,
+        [s.row for s in alerted], day.strftime("%Y-%m-%d"),
+    )
+
+
+def write_checkpoint(path: Path, snap: Snapshot):
+    """Packs a snapshot and swaps it into place, so a crash mid-write keeps the last good file."""
+    tickers, cols, histories, alerted_rows, day = snap
+    arrays: dict[str, np.ndarray] = {
+        "version": np.array(VERSION),
+        "day": np.array(day),
+        "tickers": np.array(tickers, dtype=str),
+        "alerted": np.array(alerted_rows, dtype=np.int64),
+        "ring_first": np.array([NO_INT if h[1] is None else h[1] for h in histories], dtype=np.int64),
+        "ring_last": np.array([h[2] for h in histories], dtype=np.int64),
+    }
+    if histories:
+        arrays["rings"] = np.stack([np.frombuffer(h[0], dtype=np.float64) for h in histories])
+    for name in FIELDS:
+        arrays[name] = cols[name]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez_compressed(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: Path, day: datetime) -> Optional[tuple[GainersStore, list[Stock]]]:
+    """
+    Rebuilds the gainers store and alerted list from path, or returns None
+    if there is no checkpoint for this trading day.
+    """
+    if not path.exists():
+        return None
+    with np.load(path, allow_pickle=False) as npz:
+        if int(npz["version"]) != VERSION or str(npz["day"]) != day.strftime("%Y-%m-%d"):
+            return None
+        tickers = npz["tickers"].tolist()
+        cols = {name: npz[name] for name in FIELDS}
+        firsts = npz["ring_first"].tolist()
+        lasts = npz["ring_last"].tolist()
+        rings = npz["rings"] if tickers else None
+        alerted_rows = npz["alerted"].tolist()
+    histories = []
+    for i in range(len(tickers)):
+        h = PriceHistory()
+        h.restore(rings[i].tobytes(), None if firsts[i] == NO_INT else firsts[i], lasts[i])
+        histories.append(h)
+    gainers = GainersStore.from_state(SessionState.from_columns(tickers, cols), histories)
+    return gainers, [gainers.stock_at(r) for r in alerted_rows]
+
+
+def recent_tickers(folder: Path, before: datetime) -> list[str]:
+    """
+    Every ticker seen on the latest checkpointed day before `before` (under
+    any threshold), in first-seen order; [] if there is none.
+    """
+    cutoff = before.strftime("%Y_%m_%d")
+    by_day: dict[str, list[Path]] = {}
+    for path in folder.glob("session_*.npz"):
+        day = "_".join(path.stem.split("_")[-3:])
+        if day < cutoff:
+            by_day.setdefault(day, []).append(path)
+    if not by_day:
+        return []
+    tickers: dict[str, None] = {}
+    for path in sorted(by_day[max(by_day)]):
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                tickers.update(dict.fromkeys(npz["tickers"].tolist()))
+        except (OSError, ValueError, KeyError):
+            continue
+    return list(tickers)
+
+
+class SessionCheckpointer:
+    """
+    Periodic crash-safe checkpoints of the session. The state is copied on
+    the loop's thread every `every_s` seconds (a few ms even for thousands of
+    tickers); compressing and writing happen on a background thread. A
+    checkpoint still being written when the next is due is not doubled up.
+    """
+    def __init__(self, path: Path, day: datetime, every_s: float = 30.0):
+        self.path = path
+        self.day = day
+        self.every_s = every_s
+        self.saves = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+        self._pending: Optional[Future] = None
+        self._last: Optional[datetime] = None
+
+    def restore(self) -> Optional[tuple[GainersStore, list[Stock], float]]:
+        """This day's checkpoint, if any, with the milliseconds it took to load."""
+        t0 = perf_counter()
+        try:
+            restored = load_checkpoint(self.path, self.day)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"\n\033[1;33m[WARNING]\033[0m Could not restore {self.path}: {e}")
+            return None
+        if restored is None:
+            return None
+        return (*restored, (perf_counter() - t0) * 1e3)
+
+    def maybe_save(self, gainers: GainersStore, alerted: list[Stock], now: datetime):
+        """Starts a checkpoint if one is due and the last one has finished."""
+        if self._last is not None and (now - self._last).total_seconds() < self.every_s:
+            return
+        if self._pending is not None and not self._pending.done():
+            return
+        self._last = now
+        self.save(gainers, alerted)
+
+    def save(self, gainers: GainersStore, alerted: list[Stock]):
+        self._pending = self._executor.submit(self._write, take_snapshot(gainers, alerted, self.day))
+
+    def _write(self, snap: Snapshot):
+        try:
+            write_checkpoint(self.path, snap)
+            self.saves += 1
+        except Exception as e:
+            print(f"\n\033[1;33m[WARNING]\033[0m Session checkpoint failed: {e}")
+
+    def close(self, gainers: Optional[GainersStore] = None, alerted: Optional[list[Stock]] = None):
+        """Writes a last checkpoint if given the session, then waits for pending writes."""
+        if gainers is not None and alerted is not None:
+            self.save(gainers, alerted)
+        self._executor.shutdown(wait=True)
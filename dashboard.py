@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from time import monotonic, sleep
+from typing import Hashable, Optional
+
+from rich import box
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+
+
+@dataclass
+class Section:
+    title: str
+    columns: list[tuple[str, str]] # (header, justify); all-empty headers hide the header
+    rows: list[tuple[Hashable, list[str]]] # (row key, Rich markup cells)
+
+
+class Dashboard:
+    """
+    Live terminal dashboard: one long-lived Console and Live region, redrawn
+    in place on its own thread, at most `fps` times a second and only when
+    something changed. Callers hand over rows as Rich markup strings keyed by
+    row; a row whose cells didn't change reuses its already-parsed Text, so a
+    frame costs the same however long the session has run. Anything printed
+    meanwhile scrolls above the dashboard.
+    """
+    def __init__(self, console: Console, fps: float = 4.0):
+        self.console = console
+        self.min_interval = 1 / fps
+        self.frames = 0
+        self._sections: dict[str, Section] = {}
+        self._cache: dict[tuple[str, Hashable], tuple[list[str], list[Text]]] = {}
+        self._lock = Lock()
+        self._dirty = Event()
+        self._closed = False
+        self._live = Live(console=console, auto_refresh=False, redirect_stdout=True, redirect_stderr=True)
+        self._thread: Optional[Thread] = None
+
+    def start(self):
+        self._live.start()
+        self._thread = Thread(target=self._run, name="dashboard", daemon=True)
+        self._thread.start()
+
+    def set_section(
+        self,
+        name: str,
+        title: str,
+        columns: list[tuple[str, str]],
+        rows: list[tuple[Hashable, list[str]]],
+    ):
+        """Replaces a section's rows; sections show in the order first set."""
+        section = Section(title, columns, rows)
+        with self._lock:
+            if self._sections.get(name) == section:
+                return
+            self._sections[name] = section
+        self._dirty.set()
+
+    def close(self):
+        self._closed = True
+        self._dirty.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._live.stop()
+
+    def _run(self):
+        last = 0.0
+        while True:
+            self._dirty.wait()
+            if self._closed:
+                return
+            # Cap the frame rate; whatever arrives meanwhile is folded into one frame
+            wait = last + self.min_interval - monotonic()
+            if wait > 0 and not self._closed:
+                sleep(wait)
+            self._dirty.clear()
+            try:
+                self._live.update(self._render(), refresh=True)
+                self.frames += 1
+            except Exception as e:
+                self._live.console.print(f"[yellow][WARNING][/] Dashboard render failed: {e}")
+            last = monotonic()
+
+    def _cells(self, section: str, key: Hashable, cells: list[str]) -> list[Text]:
+        cached = self._cache.get((section, key))
+        if cached is not None and cached[0] == cells:
+            return cached[1]
+        texts = [Text.from_markup(c) for c in cells]
+        self._cache[(section, key)] = (cells, texts)
+        return texts
+
+    def _render(self) -> Group:
+        with self._lock:
+            sections = list(self._sections.items())
+        tables = []
+        live_keys = set()
+        for name, sec in sections:
+            show_header = any(header for header, _ in sec.columns)
+            table = Table(
+                title=sec.title or None,
+                show_header=show_header,
+                header_style="bold cyan",
+                box=box.SIMPLE_HEAVY,
+                pad_edge=False,
+            )
+            for header, justify in sec.columns:
+                table.add_column(header, justify=justify, no_wrap=True)
+            for key, cells in sec.rows:
+                live_keys.add((name, key))
+                table.add_row(*self._cells(name, key, cells))
+            tables.append(table)
+        # Forget rows that left the screen so the cache stays as small as the view
+        for k in self._cache.keys() - live_keys:
+            del self._cache[k]
+        return Group(*tables)
@@ -0,0 +1,198 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import csv
+from datetime import datetime
+import os
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from stock import Stock
+
+DATE_FORMAT = "HH:MM:SS"
+PCT_FORMAT = "0.00%"
+CURRENCY_FORMAT = '"$"#,##0.00'
+VOLUME_FORMAT = "#,##0"
+
+# (header, number format) per column
+EOD_COLUMNS: list[tuple[str, Optional[str]]] = [
+    ("CritTime", DATE_FORMAT),
+    ("CritPrice", CURRENCY_FORMAT),
+    ("Ticker", None),
+    ("PeakTime", DATE_FORMAT),
+    ("MaxPrice", CURRENCY_FORMAT),
+    ("Volume", VOLUME_FORMAT),
+    ("Peak%", PCT_FORMAT),
+    ("Score", None),
+    ("Tier", None),
+    ("Peak%FromSpot", PCT_FORMAT),
+    ("Time2Peak(min)", None),
+    ("FloatShares", None),
+    ("CritRVol", None),
+    ("CritRSI", None),
+    ("CritFR", None),
+]
+
+ALL_SEEN_COLUMNS: list[tuple[str, Optional[str]]] = [
+    ("TimeEntered", DATE_FORMAT),
+    ("Ticker", None),
+    ("OG_Price", CURRENCY_FORMAT),
+    ("OG_Vol", VOLUME_FORMAT),
+    ("OG_RVol", None),
+    ("OG_RSI", None),
+    ("MetCriteria", None),
+    ("CritTime", DATE_FORMAT),
+    ("CritPrice", CURRENCY_FORMAT),
+    ("CritScore", None),
+    ("Tier", None),
+    ("FloatShares", None),
+    ("CritRVol", None),
+    ("CritRSI", None),
+    ("CritFR", None),
+    ("PeakTime", DATE_FORMAT),
+    ("MaxPrice", CURRENCY_FORMAT),
+    ("VolAtPeak", VOLUME_FORMAT),
+    ("Peak%FromSpot", PCT_FORMAT),
+    ("Peak%FromAlert", PCT_FORMAT),
+    ("TimeAlertToPeak(min)", None),
+]
+
+
+def eod_row(s: Stock) -> list[Any]:
+    """One EOD summary row (see EOD_COLUMNS). Excel wants percents as fractions."""
+    return [
+        s.get_crit_time(),
+        s.get_crit_price(),
+        s.get_ticker(),
+        s.get_time_max_price(),
+        s.get_max_price(),
+        s.get_vol_at_max_price(),
+        s.get_peak_change() / 100.0,
+        s.get_crit_score(),
+        s.get_crit_tier(),
+        s.get_peak_change_spot() / 100.0,
+        s.get_time_peak_alert(),
+        s.get_float_shares(),
+        s.get_crit_rvol(),
+        s.get_crit_rsi(),
+        s.get_crit_vol_float_ratio(),
+    ]
+
+
+def all_seen_row(s: Stock) -> list[Any]:
+    """One all-seen row (see ALL_SEEN_COLUMNS)."""
+    return [
+        s.get_time_entered(),
+        s.get_ticker(),
+        s.get_og_price(),
+        s.get_og_vol(),
+        s.get_og_rvol(),
+        s.get_og_rsi(),
+        s.has_met_crit(),
+        s.get_crit_time(),
+        s.get_crit_price(),
+        s.get_crit_score(),
+        s.get_crit_tier(),
+        s.get_float_shares(),
+        s.get_crit_rvol(),
+        s.get_crit_rsi(),
+        s.get_crit_vol_float_ratio(),
+        s.get_time_max_price(),
+        s.get_max_price(),
+        s.get_vol_at_max_price(),
+        s.get_peak_change_spot() / 100.0,
+        s.get_peak_change() / 100.0,
+        s.get_time_peak_alert(),
+    ]
+
+
+def write_xlsx(
+    path: Path, title: str, columns: list[tuple[str, Optional[str]]], rows: Iterable[list[Any]]
+) -> Path:
+    """
+    Streams rows into a write-only workbook, so memory stays flat however many
+    rows there are, and swaps it into place only once fully written.
+    """
+    # openpyxl takes a good part of startup to import and is only needed here
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+    ws.append([header for header, _ in columns])
+    formats = [fmt for _, fmt in columns]
+    for row in rows:
+        cells = []
+        for value, fmt in zip(row, formats):
+            # An empty cell needs no number format, and skipping it saves writing it
+            if fmt is None or value is None:
+                cells.append(value)
+            else:
+                cell = WriteOnlyCell(ws, value)
+                cell.number_format = fmt
+                cells.append(cell)
+        ws.append(cells)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    wb.save(str(tmp))
+    os.replace(tmp, path)
+    return path
+
+
+class ExcelJournal:
+    """
+    Intraday record of the session for the exports. Every sighting and alert
+    is appended to a CSV journal the moment it happens (flushed per line, so
+    a crash loses nothing), and every `checkpoint_min` minutes both workbooks
+    are rewritten as checkpoint files on a background thread. The EOD exports
+    then only have to write the final files and clear the checkpoints.
+    """
+    def __init__(self, export_dir: Path, pct_chg_des: float, day: datetime, checkpoint_min: float = 10.0):
+        date_str = day.strftime("%Y_%m_%d")
+        export_dir.mkdir(parents=True, exist_ok=True)
+        self.journal_path = export_dir / f"journal_{pct_chg_des}%_{date_str}.csv"
+        self.eod_checkpoint = export_dir / f"eod_summary_{pct_chg_des}%_{date_str}.checkpoint.xlsx"
+        self.all_checkpoint = export_dir / f"all_gainers_{pct_chg_des}%_{date_str}.checkpoint.xlsx"
+        self.checkpoint_s = checkpoint_min * 60
+        new_file = not self.journal_path.exists()
+        self._f = open(self.journal_path, "a", newline="", buffering=1)
+        self._csv = csv.writer(self._f)
+        if new_file:
+            self._csv.writerow(["Event", *(header for header, _ in ALL_SEEN_COLUMNS)])
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="excel")
+        self._pending: Optional[Future] = None
+        self._last_checkpoint: Optional[datetime] = None
+
+    def record(self, event: str, stocks: Iterable[Stock]):
+        """Journals a row per stock; event is "seen" or "alert"."""
+        for s in stocks:
+            self._csv.writerow([event, *all_seen_row(s)])
+
+    def maybe_checkpoint(self, winners: Iterable[Stock], seen: Iterable[Stock], now: datetime):
+        """Starts a checkpoint if one is due and the last one has finished."""
+        if self.checkpoint_s <= 0:
+            return
+        if self._last_checkpoint is None:
+            self._last_checkpoint = now
+            return
+        if (now - self._last_checkpoint).total_seconds() < self.checkpoint_s:
+            return
+        if self._pending is not None and not self._pending.done():
+            return
+        self._last_checkpoint = now
+        # Rows are read here, on the loop's thread; only the writing is off-loaded
+        eod_rows = [eod_row(s) for s in winners]
+        all_rows = [all_seen_row(s) for s in seen]
+        self._pending = self._executor.submit(self._write_checkpoint, eod_rows, all_rows)
+
+    def _write_checkpoint(self, eod_rows: list[list[Any]], all_rows: list[list[Any]]):
+        try:
+            write_xlsx(self.eod_checkpoint, "EOD Crit Stock Growth Summary", EOD_COLUMNS, eod_rows)
+            write_xlsx(self.all_checkpoint, "All Top Gainers Seen", ALL_SEEN_COLUMNS, all_rows)
+        except Exception as e:
+            print(f"\n\033[1;33m[WARNING]\033[0m Excel checkpoint failed: {e}")
+
+    def finalize(self):
+        """Closes the journal and drops the checkpoints once the final exports are written."""
+        self._executor.shutdown(wait=True)
+        self._f.close()
+        for path in (self.eod_checkpoint, self.all_checkpoint):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,83 @@
+from pathlib import Path
+import sqlite3
+from threading import Lock
+from time import time
+from typing import Optional
+
+
+class FloatCache:
+    """
+    Float shares by ticker, persisted to SQLite so they survive restarts. A
+    ticker FMP has no float for is cached too (as None) with a shorter TTL.
+    Everything still fresh is loaded into memory at startup, so lookups never
+    touch disk; only new entries are written through.
+    """
+    def __init__(self, path: Optional[Path], ttl_s: float, neg_ttl_s: float):
+        self.ttl_s = ttl_s
+        self.neg_ttl_s = neg_ttl_s
+        self._mem: dict[str, tuple[Optional[float], float]] = {} # ticker -> (shares, fetched_at)
+        self._lock = Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            try:
+                self._open(path)
+            except sqlite3.Error as e:
+                print(f"\n\033[1;33m[WARNING]\033[0m Float cache at {path} unusable, not persisting: {e}")
+                self._db = None
+
+    def _open(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written from the float lookup threads, always under self._lock
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS floats ("
+            "ticker TEXT PRIMARY KEY, shares REAL, fetched_at REAL NOT NULL)"
+        )
+        now = time()
+        # Drop what has expired under the current TTLs, then warm-load the rest
+        self._db.execute(
+            "DELETE FROM floats WHERE (shares IS NULL AND fetched_at < ?) OR fetched_at < ?",
+            (now - self.neg_ttl_s, now - self.ttl_s),
+        )
+        for ticker, shares, fetched_at in self._db.execute("SELECT ticker, shares, fetched_at FROM floats"):
+            self._mem[ticker] = (shares, fetched_at)
+
+    def __len__(self) -> int:
+        return len(self._mem)
+
+    def __contains__(self, ticker: str) -> bool:
+        return self.get(ticker)[0]
+
+    def get(self, ticker: str) -> tuple[bool, Optional[float]]:
+        """(hit, float_shares). A hit with None is a cached 'FMP has no float'."""
+        entry = self._mem.get(ticker)
+        if entry is None:
+            return False, None
+        shares, fetched_at = entry
+        ttl = self.ttl_s if shares is not None else self.neg_ttl_s
+        if time() - fetched_at > ttl:
+            return False, None
+        return True, shares
+
+    def put(self, ticker: str, shares: Optional[float]):
+        """Caches a float, or None for a ticker FMP has no float for."""
+        now = time()
+        self._mem[ticker] = (shares, now)
+        if self._db is None:
+            return
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO floats (ticker, shares, fetched_at) VALUES (?, ?, ?)",
+                    (ticker, shares, now),
+                )
+            except sqlite3.Error as e:
+                print(f"\n\033[1;33m[WARNING]\033[0m Failed to persist float for {ticker}: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
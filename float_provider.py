@@ -1,38 +1,314 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
+from float_cache import FloatCache
 import os
 from pathlib import Path
+import random
 import requests
+from requests.adapters import HTTPAdapter
+from threading import Condition, Lock, Thread
+from time import monotonic, sleep
+from tracer import tracer
 from typing import Optional
 
 env_path = Path(".") / ".env"
 load_dotenv(dotenv_path=env_path)
 FMP_KEY = os.getenv("FMP_KEY")
+FMP_BASE_URL = os.getenv("FMP_BASE_URL", "https://financialmodelingprep.com")
+# On-disk float cache; defaults to the EOD export folder, "0" to keep it in memory only
+_CACHE_DIR = os.getenv("EOD_EXPORT_PATH", "")
+FLOAT_CACHE_PATH = os.getenv(
+    "FLOAT_CACHE_PATH", str(Path(_CACHE_DIR) / "float_cache.sqlite") if _CACHE_DIR else ""
+)
+FLOAT_TTL_HOURS = float(os.getenv("FLOAT_TTL_HOURS", "72"))
+FLOAT_NEG_TTL_HOURS = float(os.getenv("FLOAT_NEG_TTL_HOURS", "12"))
+# Upstream request shaping: symbols per call, how long to gather a burst, FMP calls/min
+FLOAT_BATCH_SIZE = max(1, int(os.getenv("FLOAT_BATCH_SIZE", "25")))
+FLOAT_BATCH_WINDOW_MS = float(os.getenv("FLOAT_BATCH_WINDOW_MS", "200"))
+FLOAT_RATE_PER_MIN = float(os.getenv("FLOAT_RATE_PER_MIN", "300"))
+FLOAT_MAX_RETRIES = int(os.getenv("FLOAT_MAX_RETRIES", "3"))
+
+
+def _float_of(rows: list[dict]) -> Optional[float]:
+    """Float shares from a single-symbol reply, None if FMP has none."""
+    return (rows[0].get("floatShares") if rows else None) or None
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, in bursts of up to `capacity`."""
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._t = monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> float:
+        """Takes one token, sleeping until one is available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._t) * self.rate)
+                self._t = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                need = (1 - self._tokens) / self.rate
+            sleep(need)
+            waited += need
+
+    def pause(self, secs: float):
+        """Holds every caller back for `secs` (e.g. after a 429)."""
+        with self._lock:
+            self._tokens = min(self._tokens, -secs * self.rate)
+
+
+@dataclass
+class FloatMetrics:
+    """Counters for the upstream float lookups, safe to update from any thread."""
+    requests: int = 0
+    batches: int = 0
+    tickers: int = 0
+    max_batch: int = 0
+    queue_wait_s: float = 0.0
+    max_queue_wait_s: float = 0.0
+    rate_limited: int = 0
+    retries: int = 0
+    failures: int = 0
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def add_batch(self, waits: list[float]):
+        with self._lock:
+            self.batches += 1
+            self.tickers += len(waits)
+            self.max_batch = max(self.max_batch, len(waits))
+            self.queue_wait_s += sum(waits)
+            self.max_queue_wait_s = max(self.max_queue_wait_s, *waits)
+
+    def add(self, name: str, n: int = 1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + n)
+
+    def summary(self) -> str:
+        if not self.batches:
+            return "Float lookups: none"
+        return (
+            f"Float lookups: {self.tickers} tickers in {self.batches} batches "
+            f"(avg {self.tickers / self.batches:.1f}, max {self.max_batch}), "
+            f"{self.requests} requests, {self.rate_limited} rate limited (429), "
+            f"{self.retries} retries, {self.failures} failed | queue wait "
+            f"avg {self.queue_wait_s / self.tickers * 1000:.0f} ms, "
+            f"max {self.max_queue_wait_s * 1000:.0f} ms"
+        )
+
 
 class FloatProvider:
-    def __init__(self):
-        self.cache: dict[str, float] = {} # ticker -> shares
+    """
+    Float shares from FMP. prefetch() queues a ticker; a dispatcher thread
+    gathers queued tickers for up to `batch_window_s` and looks them up
+    `batch_size` symbols per call over one pooled keep-alive session, paced by
+    a token bucket with retry/backoff. peek() reads the outcome without
+    blocking and get_float_shares() waits for it. Results, including
+    "no float", are kept in a FloatCache persisted across restarts.
+    """
+    def __init__(
+        self,
+        workers: int = 4,
+        cache_path: Optional[str] = FLOAT_CACHE_PATH,
+        api_key: Optional[str] = None,
+        base_url: str = FMP_BASE_URL,
+        batch_size: int = FLOAT_BATCH_SIZE,
+        batch_window_s: float = FLOAT_BATCH_WINDOW_MS / 1000,
+        rate_per_min: float = FLOAT_RATE_PER_MIN,
+        max_retries: int = FLOAT_MAX_RETRIES,
+    ):
+        self.cache = FloatCache(
+            Path(cache_path) if cache_path and cache_path != "0" else None,
+            FLOAT_TTL_HOURS * 3600,
+            FLOAT_NEG_TTL_HOURS * 3600,
+        )
+        self.api_key = api_key if api_key is not None else FMP_KEY
+        self.url = f"{base_url.rstrip('/')}/stable/shares-float"
+        self.batch_size = batch_size
+        self.batch_window_s = batch_window_s
+        self.max_retries = max_retries
+        self.metrics = FloatMetrics()
+        self._bucket = TokenBucket(rate_per_min / 60, max(1.0, rate_per_min / 60))
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="float")
+        self._pending: dict[str, Future] = {}
+        self._queue: list[tuple[str, float]] = [] # (ticker, time queued)
+        self._lock = Lock()
+        self._cv = Condition(self._lock)
+        self._closed = False
+        self._dispatcher = Thread(target=self._dispatch, name="float-dispatch", daemon=True)
+        self._dispatcher.start()
+
+    def prefetch(self, ticker: str) -> None:
+        """Queues a ticker's float lookup, if not already known/underway."""
+        tick = ticker.upper()
+        if tick in self.cache or not self.api_key:
+            return
+        with self._cv:
+            if tick not in self._pending and not self._closed:
+                self._pending[tick] = Future()
+                self._queue.append((tick, monotonic()))
+                self._cv.notify()
+
+    @property
+    def pending(self) -> int:
+        """Lookups queued or in flight."""
+        with self._cv:
+            return len(self._pending)
+
+    def peek(self, ticker: str) -> tuple[bool, Optional[float]]:
+        """
+        Non-blocking read: (resolved, float_shares). resolved is False while a
+        lookup is in flight or none has been started (or the last one failed);
+        a resolved None means FMP has no float for the ticker.
+        """
+        tick = ticker.upper()
+        hit, shares = self.cache.get(tick)
+        if hit:
+            return True, shares
+        if not self.api_key:
+            return True, None
+        fut = self._pending.get(tick)
+        if fut is None or not fut.done():
+            return False, None
+        return True, fut.result()
 
     def get_float_shares(self, ticker: str) -> Optional[float]:
+        """Blocking lookup (joins an in-flight prefetch if there is one)."""
         tick = ticker.upper()
-        if tick in self.cache:
-            return self.cache[tick]
-        if not FMP_KEY:
+        hit, shares = self.cache.get(tick)
+        if hit:
+            return shares
+        if not self.api_key:
             return None
+        self.prefetch(tick)
+        fut = self._pending.get(tick)
+        return fut.result() if fut is not None else self.cache.get(tick)[1]
 
-        url = (
-                "https://financialmodelingprep.com/stable/shares-float"
-                f"?symbol={tick}&apikey={FMP_KEY}"
-        )
+    def close(self):
+        with self._cv:
+            self._closed = True
+            self._cv.notify()
+            for fut in self._pending.values():
+                fut.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+        self.cache.close()
+
+    def _dispatch(self):
+        while True:
+            with self._cv:
+                while not self._queue and not self._closed:
+                    self._cv.wait()
+                # Let a burst build up, but never hold the oldest ticker past the window
+                deadline = self._queue[0][1] + self.batch_window_s if self._queue else 0.0
+                while len(self._queue) < self.batch_size and not self._closed:
+                    left = deadline - monotonic()
+                    if left <= 0:
+                        break
+                    self._cv.wait(left)
+                if self._closed:
+                    return
+                batch = self._queue[:self.batch_size]
+                del self._queue[:self.batch_size]
+            self._executor.submit(self._fetch_batch, batch)
+
+    def _fetch_batch(self, batch: list[tuple[str, float]]):
+        ticks = [tick for tick, _ in batch]
+        results: dict[str, Optional[float]] = {}
         try:
-            r = requests.get(url, timeout=5)
+            self._bucket.acquire()
+            now = monotonic()
+            self.metrics.add_batch([now - queued for _, queued in batch])
+            if len(ticks) == 1:
+                results[ticks[0]] = _float_of(self._request(ticks))
+                return
+            try:
+                rows = self._request(ticks)
+                batch_error = None
+            except Exception as e:
+                # Some plans reject comma lists outright (a 4xx or an error object)
+                rows, batch_error = [], e
+            for row in rows:
+                sym = str(row.get("symbol", "")).upper()
+                if sym in ticks:
+                    results[sym] = row.get("floatShares") or None
+            # Whatever the reply left out is looked up on its own rather than
+            # cached as "no float": an empty answer may mean the endpoint doesn't
+            # batch, and a partial one may just be truncated
+            missing = [tick for tick in ticks if tick not in results]
+            for tick in missing:
+                self._bucket.acquire()
+                results[tick] = _float_of(self._request([tick]))
+            rejected = batch_error is not None and bool(missing)
+            if rejected or (not rows and any(results[tick] is not None for tick in missing)):
+                with self._lock:
+                    was_batching, self.batch_size = self.batch_size > 1, 1
+                if was_batching:
+                    reason = f"rejected ({batch_error})" if rejected else "ignored"
+                    print(
+                        f"\n\033[1;33m[WARNING]\033[0m FMP {reason} a multi-symbol float "
+                        "request; looking floats up one ticker at a time from now on."
+                    )
+        except Exception as e:
+            self.metrics.add("failures", len(ticks) - len(results))
+            print(f"\n\033[1;33m[WARNING]\033[0m Failed to fetch floats for {', '.join(ticks)}: {e}")
+        finally:
+            with self._lock:
+                for tick in ticks:
+                    if tick in results:
+                        # Cache misses too, so a ticker FMP doesn't know isn't re-requested all day
+                        self.cache.put(tick, results[tick])
+                    # A failed lookup is retried by a later prefetch
+                    fut = self._pending.pop(tick, None)
+                    if fut is not None and not fut.done():
+                        fut.set_result(results.get(tick))
+
+    def _request(self, ticks: list[str]) -> list[dict]:
+        """One FMP call for these symbols, retried with backoff on 429/5xx/network errors."""
+        params = {"symbol": ",".join(ticks), "apikey": self.api_key}
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.metrics.add("retries")
+                self._bucket.acquire()
+            self.metrics.add("requests")
+            backoff = 0.5 * 2 ** attempt * (0.5 + random.random())
+            try:
+                with tracer.span("float_request"):
+                    r = self._session.get(self.url, params=params, timeout=5)
+            except requests.RequestException:
+                if attempt == self.max_retries:
+                    raise
+                sleep(backoff)
+                continue
+            if r.status_code == 429:
+                self.metrics.add("rate_limited")
+                if attempt < self.max_retries:
+                    # Back every batch off, not just this one
+                    try:
+                        retry_after = float(r.headers.get("Retry-After", ""))
+                    except ValueError:
+                        retry_after = backoff
+                    self._bucket.pause(retry_after)
+                    continue
+            elif r.status_code >= 500 and attempt < self.max_retries:
+                sleep(backoff)
+                continue
             r.raise_for_status()
             data = r.json()
-            if not data:
-                return None
-            float_shares = data[0].get("floatShares")
-            if float_shares:
-                self.cache[tick] = float_shares
-            return float_shares
-        except Exception as e:
-            print(f"\n\033[1;33m[WARNING]\033[0m Failed to fetch float for {tick}: {e}")
-            return None
+            if not isinstance(data, list):
+                if data:
+                    raise ValueError(f"unexpected reply {str(data)[:200]}")
+                return []
+            return data
+        return []
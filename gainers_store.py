@@ -0,0 +1,117 @@
+from bisect import bisect_left
+from datetime import datetime
+import numpy as np
+from price_history import PriceHistory
+from session_state import SessionState
+from signal_scorer import SignalScorer
+from typing import Iterator, Optional
+from stock import Stock
+
+
+class GainersStore:
+    """
+    Every stock seen in the top gainers list this session, indexed by ticker and
+    kept ranked by absolute percent change (highest first). The stocks are
+    views onto the store's columnar SessionState, `state`.
+    """
+    def __init__(self):
+        self.state = SessionState()
+        self._by_ticker: dict[str, Stock] = {}
+        self._by_row: list[Stock] = []
+        # Ranking: sorted keys (-abs_pct, seq) with the stocks kept in parallel
+        self._rank_keys: list[tuple[float, int]] = []
+        self._ranked: list[Stock] = []
+        self._key_of: dict[str, tuple[float, int]] = {}
+        self._seq = 0
+
+    @classmethod
+    def from_state(cls, state: SessionState, histories: list[PriceHistory]) -> "GainersStore":
+        """Store over an already-filled session (one price history per row), ranked afresh."""
+        store = cls()
+        store.state = state
+        for row, ticker in enumerate(state.tickers):
+            stock = Stock.at_row(state, row, histories[row])
+            store._by_ticker[ticker] = stock
+            store._by_row.append(stock)
+        # Same keys add() would have given: ties in first-seen order
+        store._seq = len(state)
+        keys = [(-abs_pct, row + 1) for row, abs_pct in enumerate(state.col("abs_pct_chg").tolist())]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        store._rank_keys = [keys[i] for i in order]
+        store._ranked = [store._by_row[i] for i in order]
+        store._key_of = {state.tickers[i]: keys[i] for i in range(len(keys))}
+        return store
+
+    def __len__(self) -> int:
+        return len(self._by_ticker)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._by_ticker
+
+    def __iter__(self) -> Iterator[Stock]:
+        """Iterate stocks from highest to lowest absolute percent change."""
+        return iter(list(self._ranked))
+
+    def get(self, ticker: str) -> Optional[Stock]:
+        return self._by_ticker.get(ticker)
+
+    def stock_at(self, row: int) -> Stock:
+        return self._by_row[row]
+
+    def add(
+        self,
+        ticker: str,
+        price: float,
+        vol: Optional[float],
+        rvol: float,
+        rsi: float,
+        curr_time: datetime,
+    ) -> Stock:
+        """Creates a newly seen stock in the session and ranks it."""
+        if ticker in self._by_ticker:
+            raise ValueError(f"{ticker} is already in the gainers store")
+        stock = Stock(ticker, price, vol, rvol, rsi, curr_time, self.state)
+        # Key everything on the session's interned copy of the ticker
+        ticker = stock.get_ticker()
+        self._by_ticker[ticker] = stock
+        self._by_row.append(stock)
+        # Ties keep the order the stocks were first seen in
+        self._seq += 1
+        self._insert(ticker, stock, (-stock.get_abs(), self._seq))
+        return stock
+
+    def set_abs(self, stock: Stock, new_abs: float):
+        """Sets a stock's absolute % change and moves it to its new rank."""
+        ticker = stock.get_ticker()
+        old_key = self._key_of[ticker]
+        i = bisect_left(self._rank_keys, old_key)
+        del self._rank_keys[i]
+        del self._ranked[i]
+        stock.set_abs(new_abs)
+        self._insert(ticker, stock, (-new_abs, old_key[1]))
+
+    def top(self, n: int) -> list[Stock]:
+        """Returns the n stocks with the highest absolute % change."""
+        return self._ranked[:n]
+
+    def score_live(self, stocks: list[Stock]):
+        """Scores the given stocks in one vectorized pass and stores their live score/tier."""
+        if not stocks:
+            return
+        rows = np.fromiter((s.row for s in stocks), dtype=np.intp, count=len(stocks))
+        cols = self.state.cols
+        live = SignalScorer.score_batch(
+            cols["float_shares"][rows],
+            cols["last_rvol"][rows],
+            cols["last_vol_float_ratio"][rows],
+            cols["last_rsi"][rows],
+            cols["abs_pct_chg"][rows],
+        )
+        cols["live_score"][rows] = live.scores
+        cols["live_tier"][rows] = live.tiers
+
+    def _insert(self, ticker: str, stock: Stock, key: tuple[float, int]):
+        i = bisect_left(self._rank_keys, key)
+        self._rank_keys.insert(i, key)
+        self._ranked.insert(i, stock)
+        self._key_of[ticker] = key
@@ -0,0 +1,256 @@
+import argparse
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from queue import Empty, SimpleQueue
+import sqlite3
+from threading import Thread
+from time import perf_counter
+from typing import Iterable, Optional
+
+from stock import Stock, format_volume, parse_volume
+
+# One row per ticker per session (day + threshold). A ticker's row is written
+# when it alerts and rewritten with its final peak stats at the close, so a
+# crashed session still keeps its alerts. Times are local "YYYY-MM-DD HH:MM:SS".
+COLUMNS: list[tuple[str, str]] = [
+    ("day", "TEXT NOT NULL"),
+    ("pct", "REAL NOT NULL"),
+    ("ticker", "TEXT NOT NULL"),
+    ("time_entered", "TEXT"),
+    ("og_price", "REAL"),
+    ("og_vol", "REAL"),
+    ("og_rvol", "REAL"),
+    ("og_rsi", "REAL"),
+    ("met_crit", "INTEGER NOT NULL"),
+    ("crit_time", "TEXT"),
+    ("crit_price", "REAL"),
+    ("crit_vol", "REAL"),
+    ("crit_rvol", "REAL"),
+    ("crit_rsi", "REAL"),
+    ("crit_fr", "REAL"),
+    ("score", "INTEGER"),
+    ("tier", "TEXT"),
+    ("float_shares", "REAL"),
+    ("peak_time", "TEXT"),
+    ("max_price", "REAL"),
+    ("peak_vol", "REAL"),
+    ("peak_rvol", "REAL"),
+    ("peak_rsi", "REAL"),
+    ("peak_pct", "REAL"),
+    ("peak_pct_spot", "REAL"),
+    ("min_to_peak", "INTEGER"),
+]
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS stocks ("
+    + ", ".join(f"{name} {kind}" for name, kind in COLUMNS)
+    + ", PRIMARY KEY (day, pct, ticker))",
+    # The primary key already serves lookups by day
+    "CREATE INDEX IF NOT EXISTS stocks_ticker ON stocks (ticker, day)",
+    "CREATE INDEX IF NOT EXISTS stocks_tier ON stocks (tier, day)",
+    "CREATE INDEX IF NOT EXISTS stocks_score ON stocks (score, day)",
+]
+_INSERT = (
+    f"INSERT OR REPLACE INTO stocks ({', '.join(name for name, _ in COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(COLUMNS))})"
+)
+
+
+def _time(t: Optional[datetime]) -> Optional[str]:
+    return None if t is None else t.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def history_row(s: Stock, day: str, pct_chg_des: float) -> tuple:
+    """One stocks row (see COLUMNS) for a stock as it is right now."""
+    return (
+        day,
+        pct_chg_des,
+        s.get_ticker(),
+        _time(s.get_time_entered()),
+        s.get_og_price(),
+        s.get_og_vol(),
+        s.get_og_rvol(),
+        s.get_og_rsi(),
+        int(s.has_met_crit()),
+        _time(s.get_crit_time()),
+        s.get_crit_price(),
+        s.get_crit_vol(),
+        s.get_crit_rvol(),
+        s.get_crit_rsi(),
+        s.get_crit_vol_float_ratio(),
+        s.get_crit_score(),
+        s.get_crit_tier(),
+        s.get_float_shares(),
+        _time(s.get_time_max_price()),
+        s.get_max_price(),
+        s.get_vol_at_max_price(),
+        s.get_peak_rvol(),
+        s.get_peak_rsi(),
+        s.get_peak_change(),
+        s.get_peak_change_spot(),
+        s.get_time_peak_alert(),
+    )
+
+
+def connect(path: Path, readonly: bool = False) -> sqlite3.Connection:
+    """Opens the history database in WAL mode, creating it and its indexes if needed."""
+    if readonly:
+        db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        for stmt in _SCHEMA:
+            db.execute(stmt)
+    db.row_factory = sqlite3.Row
+    return db
+
+
+class HistoryWriter:
+    """
+    Multi-day history of every ticker seen, in SQLite. record() reads the
+    rows on the caller's thread (the session keeps changing under it) and
+    only enqueues them; a background thread writes whatever has queued up in
+    a single transaction, so the loop never waits on disk.
+    """
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows_written = 0
+        self._db: Optional[sqlite3.Connection] = None
+        try:
+            self._db = connect(path)
+        except sqlite3.Error as e:
+            print(f"\n\033[1;33m[WARNING]\033[0m History database at {path} unusable, not recording: {e}")
+            return
+        self._q: SimpleQueue = SimpleQueue()
+        self._thread = Thread(target=self._run, name="history-db", daemon=True)
+        self._thread.start()
+
+    def record(self, day: datetime, pct_chg_des: float, stocks: Iterable[Stock]):
+        """Queues the current state of these stocks for the given session."""
+        if self._db is None:
+            return
+        day_str = day.strftime("%Y-%m-%d")
+        rows = [history_row(s, day_str, pct_chg_des) for s in stocks]
+        if rows:
+            self._q.put(rows)
+
+    def close(self):
+        """Writes out everything queued so far and closes the database."""
+        if self._db is None:
+            return
+        self._q.put(None)
+        self._thread.join()
+        self._db.close()
+        self._db = None
+
+    def _run(self):
+        done = False
+        while not done:
+            batches = [self._q.get()]
+            # Fold in whatever else queued up meanwhile
+            while True:
+                try:
+                    batches.append(self._q.get_nowait())
+                except Empty:
+                    break
+            done = None in batches
+            rows = [row for batch in batches if batch is not None for row in batch]
+            if not rows:
+                continue
+            try:
+                self._db.execute("BEGIN")
+                self._db.executemany(_INSERT, rows)
+                self._db.execute("COMMIT")
+                self.rows_written += len(rows)
+            except sqlite3.Error as e:
+                if self._db.in_transaction:
+                    self._db.execute("ROLLBACK")
+                print(f"\n\033[1;33m[WARNING]\033[0m Failed to write {len(rows)} history rows: {e}")
+
+
+def query(
+    db: sqlite3.Connection,
+    since: Optional[date] = None,
+    ticker: Optional[str] = None,
+    tier: Optional[str] = None,
+    min_score: Optional[int] = None,
+    max_float: Optional[float] = None,
+    pct: Optional[float] = None,
+    alerts_only: bool = False,
+) -> list[sqlite3.Row]:
+    """Rows matching every filter given, newest day first, then by crit/entry time."""
+    where, args = [], []
+    if since is not None:
+        where.append("day >= ?")
+        args.append(since.isoformat())
+    if ticker is not None:
+        where.append("ticker = ?")
+        args.append(ticker.upper())
+    if tier is not None:
+        where.append("tier = ?")
+        args.append(tier.upper())
+    if min_score is not None:
+        where.append("score >= ?")
+        args.append(min_score)
+    if max_float is not None:
+        where.append("float_shares < ?")
+        args.append(max_float)
+    if pct is not None:
+        where.append("pct = ?")
+        args.append(pct)
+    if alerts_only:
+        where.append("met_crit = 1")
+    sql = "SELECT * FROM stocks"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY day DESC, coalesce(crit_time, time_entered)"
+    return db.execute(sql, args).fetchall()
+
+
+def _fmt(v, spec: str = "") -> str:
+    return "-" if v is None else format(v, spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the StockBot multi-day history database.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--days", type=int, help="only the last N days")
+    parser.add_argument("--ticker")
+    parser.add_argument("--tier", help="crit tier, e.g. A")
+    parser.add_argument("--min-score", type=int)
+    parser.add_argument("--max-float", help="float below this many shares, e.g. 3M")
+    parser.add_argument("--pct", type=float, help="only sessions run at this threshold")
+    parser.add_argument("--alerts", action="store_true", help="only tickers that met criteria")
+    args = parser.parse_args()
+
+    max_float = None
+    if args.max_float is not None:
+        max_float = parse_volume(args.max_float)
+        if max_float is None:
+            parser.error(f"can't read --max-float {args.max_float!r}")
+    since = date.today() - timedelta(days=args.days) if args.days is not None else None
+
+    db = connect(args.path, readonly=True)
+    t0 = perf_counter()
+    rows = query(db, since, args.ticker, args.tier, args.min_score, max_float, args.pct, args.alerts)
+    ms = (perf_counter() - t0) * 1e3
+    db.close()
+
+    print(f"{'day':<10} {'pct':>5} {'ticker':<6} {'crit':>8} {'price':>8} {'tier':>4} {'score':>5} "
+          f"{'float':>9} {'rvol':>6} {'peak%':>7} {'min':>4}")
+    for r in rows:
+        crit = r["crit_time"][-8:] if r["crit_time"] else "-"
+        float_str = format_volume(r["float_shares"]) if r["float_shares"] is not None else "-"
+        print(
+            f"{r['day']:<10} {r['pct']:>5g} {r['ticker']:<6} {crit:>8} "
+            f"{_fmt(r['crit_price'], '.2f'):>8} {_fmt(r['tier']):>4} {_fmt(r['score']):>5} "
+            f"{float_str:>9} "
+            f"{_fmt(r['crit_rvol'], '.1f'):>6} {_fmt(r['peak_pct'], '.1f'):>7} {_fmt(r['min_to_peak']):>4}"
+        )
+    print(f"{len(rows)} rows in {ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
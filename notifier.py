@@ -0,0 +1,87 @@
+from pathlib import Path
+from platform import system
+from queue import Empty, SimpleQueue
+from threading import Thread
+from time import monotonic
+from typing import Callable
+
+OS = system()
+
+
+def load_player(file: str) -> Callable[[], None]:
+    """
+    Reads the sound once and returns a function that plays it (blocking).
+    Windows plays from memory; elsewhere simpleaudio is used when installed,
+    falling back to playsound (which opens the file on every call).
+    """
+    if OS == "Windows":
+        import winsound
+
+        data = Path(file).read_bytes()
+        return lambda: winsound.PlaySound(data, winsound.SND_MEMORY)
+    try:
+        import simpleaudio
+
+        wave = simpleaudio.WaveObject.from_wave_file(file)
+        return lambda: wave.play().wait_done()
+    except ImportError:
+        from playsound import playsound
+
+        return lambda: playsound(file)
+
+
+class Notifier:
+    """
+    Plays alert chimes off the scrape loop. alert() only enqueues; a background
+    thread gathers everything that arrives within `coalesce_s` of the first
+    alert and chimes once for the whole burst.
+    """
+    def __init__(self, sound_file: str, coalesce_s: float = 0.5):
+        self.coalesce_s = coalesce_s
+        self.chimes = 0
+        self.alerts = 0
+        self._q: SimpleQueue = SimpleQueue()
+        self._play = None
+        try:
+            self._play = load_player(sound_file)
+        except Exception as e:
+            print(f"\n\033[1;33m[WARNING]\033[0m Alert sound unavailable, alerting silently: {e}")
+        self._thread = Thread(target=self._run, name="notifier", daemon=True)
+        self._thread.start()
+
+    def alert(self, tickers: list[str]):
+        """Queues a chime for these newly alerted tickers. Never blocks."""
+        if tickers:
+            self._q.put(tickers)
+
+    def close(self):
+        self._q.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        while True:
+            item = self._q.get()
+            if item is None:
+                return
+            burst = list(item)
+            deadline = monotonic() + self.coalesce_s
+            while (left := deadline - monotonic()) > 0:
+                try:
+                    item = self._q.get(timeout=left)
+                except Empty:
+                    break
+                if item is None:
+                    self._chime(burst)
+                    return
+                burst.extend(item)
+            self._chime(burst)
+
+    def _chime(self, tickers: list[str]):
+        self.alerts += len(tickers)
+        self.chimes += 1
+        if self._play is None:
+            return
+        try:
+            self._play()
+        except Exception as e:
+            print(f"\n\033[1;33m[WARNING]\033[0m Failed to play alert sound: {e}")
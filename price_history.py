@@ -0,0 +1,86 @@
+from array import array
+from datetime import datetime, timedelta
+from typing import Optional
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class PriceHistory:
+    """
+    Fixed-size, time-indexed ring buffer of prices.
+
+    Time is cut into buckets of `resolution_s` seconds and each slot holds the
+    last price seen in its bucket. Buckets skipped between samples are filled
+    with the previous price, so the ring is always dense and looking back any
+    number of minutes is one index computation. Memory is fixed by the window
+    and resolution, no matter how long the session or how fast the refresh.
+    """
+    __slots__ = ("_res", "_buckets_per_min", "_size", "_prices", "_first", "_last")
+
+    def __init__(self, window_min: int = 20, resolution_s: int = 5):
+        self._res = timedelta(seconds=resolution_s)
+        self._buckets_per_min = 60 // resolution_s
+        self._size = window_min * self._buckets_per_min + 1
+        self._prices = array("d", bytes(8 * self._size))
+        self._first: Optional[int] = None
+        self._last = 0
+
+    def __len__(self) -> int:
+        """Number of buckets currently held."""
+        if self._first is None:
+            return 0
+        return min(self._last - self._first + 1, self._size)
+
+    def append(self, t: datetime, price: float):
+        """Records the price at time t. Out-of-order samples update the latest bucket."""
+        b = (t - _EPOCH) // self._res
+        if self._first is None:
+            self._first = self._last = b
+            self._prices[b % self._size] = price
+            return
+
+        if b > self._last:
+            # Carry the last price through any skipped buckets
+            prev = self._prices[self._last % self._size]
+            for k in range(max(self._last + 1, b - self._size + 1), b):
+                self._prices[k % self._size] = prev
+            self._last = b
+        self._prices[self._last % self._size] = price
+
+    def snapshot(self) -> tuple[array, Optional[int], int]:
+        """Copy of the ring plus its first and last bucket, for restore()."""
+        return array("d", self._prices), self._first, self._last
+
+    def restore(self, prices: bytes, first: Optional[int], last: int):
+        """Loads a snapshot() back, given the ring as raw float64 bytes."""
+        restored = array("d")
+        restored.frombytes(prices)
+        if len(restored) != self._size:
+            raise ValueError(f"ring of {len(restored)} prices, expected {self._size}")
+        self._prices = restored
+        self._first = first
+        self._last = last
+
+    def latest(self) -> Optional[float]:
+        if self._first is None:
+            return None
+        return self._prices[self._last % self._size]
+
+    def price_ago(self, minutes: int) -> Optional[float]:
+        """
+        Price `minutes` before the latest sample, or None if the history
+        doesn't reach that far back yet (or the window is too short).
+        """
+        if self._first is None:
+            return None
+        target = self._last - minutes * self._buckets_per_min
+        if target < self._first or self._last - target >= self._size:
+            return None
+        return self._prices[target % self._size]
+
+    def pct_change(self, minutes: int) -> Optional[float]:
+        """Percent change of the latest price over the past `minutes`."""
+        old = self.price_ago(minutes)
+        if not old:
+            return None
+        return ((self._prices[self._last % self._size] - old) / old) * 100
@@ -0,0 +1,173 @@
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, Optional
+
+import bot
+from float_provider import FloatProvider
+from gainers_store import GainersStore
+from stock import Stock
+from tick_recorder import FloatState, TickRow, read_cycles
+
+
+class VirtualClock:
+    """
+    Stands in for dt.now() during a replay. Time only moves to each recorded
+    cycle's timestamp, so nothing ever sleeps.
+    """
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = start or datetime(1970, 1, 1)
+
+    def now(self) -> datetime:
+        return self._now
+
+    def advance_to(self, t: datetime):
+        self._now = max(self._now, t)
+
+
+class NoFloats(FloatProvider):
+    """Float provider for replays that should not touch the network."""
+    def __init__(self):
+        super().__init__(workers=1, cache_path=None)
+
+    def prefetch(self, ticker: str) -> None:
+        pass
+
+    def peek(self, ticker: str) -> tuple[bool, Optional[float]]:
+        return True, None
+
+    def get_float_shares(self, ticker: str) -> Optional[float]:
+        return None
+
+
+class SyncFloats(FloatProvider):
+    """
+    Float provider that resolves every lookup before answering, so a replay
+    doesn't depend on how fast FMP happens to respond on the replay machine.
+    Unlike the live loop, every alert is then scored with its float known,
+    so tiers can differ from what the live session showed.
+    """
+    def __init__(self):
+        # Every lookup is waited on, so there is no burst worth batching
+        super().__init__(batch_window_s=0.0)
+
+    def peek(self, ticker: str) -> tuple[bool, Optional[float]]:
+        return True, self.get_float_shares(ticker)
+
+
+class RecordedFloats(FloatProvider):
+    """
+    Float provider that plays back the float states a tick log recorded each
+    cycle, so peek() answers exactly what it did live: a float that landed
+    mid-session only counts from that cycle on. Never touches the network.
+    """
+    def __init__(self):
+        super().__init__(workers=1, cache_path=None, api_key="")
+        self._states: dict[str, FloatState] = {}
+
+    def set_cycle(self, rows: list[TickRow], floats: list[FloatState]):
+        self._states = {row[0]: state for row, state in zip(rows, floats)}
+
+    def prefetch(self, ticker: str) -> None:
+        pass
+
+    def peek(self, ticker: str) -> tuple[bool, Optional[float]]:
+        return self._states.get(ticker, (False, None))
+
+    def get_float_shares(self, ticker: str) -> Optional[float]:
+        return self.peek(ticker)[1]
+
+
+@dataclass
+class ReplayResult:
+    gainers: GainersStore
+    alerted: list[Stock] = field(default_factory=list)
+    day: Optional[datetime] = None
+    cycles: int = 0
+    rows: int = 0
+    elapsed_s: float = 0.0
+
+
+def replay_session(
+    cycles: Iterable[tuple[datetime, list[TickRow], Optional[list[FloatState]]]],
+    pct_chg_des: float,
+    float_prov: Optional[FloatProvider] = None,
+    show_top: bool = False,
+) -> ReplayResult:
+    """
+    Drives process_stocks over recorded cycles (as read_cycles yields them)
+    exactly as run_main_loop does, on a virtual clock and without sound,
+    alert watchlist or Selenium. By default floats are the ones the live run
+    had each cycle; logs from before floats were recorded fall back to
+    SyncFloats.
+    """
+    clock = VirtualClock()
+    result = ReplayResult(GainersStore())
+
+    t0 = perf_counter()
+    for cycle_time, new_data, floats in cycles:
+        if float_prov is None:
+            if floats is not None:
+                float_prov = RecordedFloats()
+            else:
+                print(
+                    "\n\033[1;33m[WARNING]\033[0m This tick log has no recorded floats; looking "
+                    "them all up first, so alert scores may differ from the live run."
+                )
+                float_prov = SyncFloats()
+        if isinstance(float_prov, RecordedFloats) and floats is not None:
+            float_prov.set_cycle(new_data, floats)
+        clock.advance_to(cycle_time)
+        changed = bot.process_stocks(
+            result.gainers, float_prov, result.alerted, new_data, pct_chg_des, clock.now()
+        )
+        if changed and show_top:
+            bot.show_top_gainers(result.gainers.top(5), clock.now())
+        result.day = cycle_time
+        result.cycles += 1
+        result.rows += len(new_data)
+    result.elapsed_s = perf_counter() - t0
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded tick log through process_stocks, faster than real time."
+    )
+    parser.add_argument("paths", type=Path, nargs="+", help="tick log(s), replayed in order")
+    parser.add_argument("--pct", type=float, required=True, help="percent change desired")
+    floats = parser.add_mutually_exclusive_group()
+    floats.add_argument(
+        "--no-floats", action="store_true",
+        help="don't look up floats (no network); scores then ignore float",
+    )
+    floats.add_argument(
+        "--lookup-floats", action="store_true",
+        help="score every alert with its float looked up first, instead of the recorded ones",
+    )
+    parser.add_argument("--top", action="store_true", help="render the top 5 on every changed cycle")
+    parser.add_argument("--export-dir", type=Path, help="export the EOD summary here")
+    args = parser.parse_args()
+
+    def cycles():
+        for path in args.paths:
+            yield from read_cycles(path)
+
+    float_prov = None
+    if args.no_floats:
+        float_prov = NoFloats()
+    elif args.lookup_floats:
+        float_prov = SyncFloats()
+    result = replay_session(cycles(), args.pct, float_prov, show_top=args.top)
+    print(
+        f"\nReplayed {result.cycles} cycles / {result.rows} rows "
+        f"in {result.elapsed_s:.2f}s, {len(result.alerted)} alerts."
+    )
+    # Exports are dated by the replayed session, not by today
+    bot.show_eod_stats(result.gainers, args.pct, args.export_dir, result.day)
+
+
+if __name__ == "__main__":
+    main()
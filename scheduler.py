@@ -0,0 +1,87 @@
+from collections import deque
+from time import monotonic, sleep
+from typing import Optional
+
+
+class RefreshScheduler:
+    """
+    Paces the scrape loop on fixed cycle deadlines: each wait is whatever is
+    left of the period once the cycle's own work is done, so scraping and
+    processing no longer stretch the period. A cycle that overruns its
+    deadline starts right away and its lateness is recorded; missed deadlines
+    are skipped rather than caught up in a burst.
+
+    The period adapts around the user's `base_s`: half of it while the table
+    is volatile (`hot_rows` or more movers, or tickers on the board closing
+    in on the threshold), stretching out while nothing moves, and doubling
+    on consecutive scrape timeouts, always within [min_s, max_s]. A mover is
+    a row whose abs % change shifted meaningfully this cycle (or a new
+    listing), not just any price tick. A quiet table only stretches it
+    to 1.5x `base_s`, so a ticker that starts running is not seen much later
+    than at the user's rate; passing max_s lets it stretch that far instead.
+    """
+    def __init__(
+        self,
+        base_s: float,
+        min_s: float = 2.0,
+        max_s: Optional[float] = None,
+        hot_rows: int = 5,
+    ):
+        self.base_s = base_s
+        self.min_s = min(min_s, base_s)
+        self.max_s = max_s if max_s is not None else max(base_s * 4, 10.0)
+        self.idle_max_s = max_s if max_s is not None else base_s * 1.5
+        self.hot_rows = hot_rows
+        self.period = base_s
+        self.last_lateness = 0.0
+        self.cycles = 0
+        self.late_cycles = 0
+        self._lateness: deque[float] = deque(maxlen=1000)
+        self._idle = 0
+        self._timeouts = 0
+        self._deadline = monotonic()
+
+    def _next_period(self, movers: int, near_crit: int, timed_out: bool) -> float:
+        if timed_out:
+            self._timeouts += 1
+            return self.base_s * 2 ** min(self._timeouts, 6)
+        self._timeouts = 0
+        if near_crit or movers >= self.hot_rows:
+            self._idle = 0
+            return self.base_s / 2
+        if not movers:
+            self._idle += 1
+            return min(self.idle_max_s, self.base_s * (1 + 0.5 * self._idle))
+        self._idle = 0
+        return self.base_s
+
+    def next_wait(self, movers: int, near_crit: int = 0, timed_out: bool = False) -> float:
+        """
+        Ends a cycle: picks the next period from how the cycle went and returns
+        the seconds left until the next deadline (0 if already past it).
+        """
+        now = monotonic()
+        self.period = min(self.max_s, max(self.min_s, self._next_period(movers, near_crit, timed_out)))
+        self._deadline += self.period
+        self.cycles += 1
+        self.last_lateness = max(0.0, now - self._deadline)
+        self._lateness.append(self.last_lateness)
+        if self.last_lateness > 0:
+            self.late_cycles += 1
+            self._deadline = now
+        return self._deadline - now
+
+    def wait(self, movers: int, near_crit: int = 0, timed_out: bool = False) -> float:
+        """next_wait(), then sleeps it off. Returns this cycle's lateness."""
+        sleep(self.next_wait(movers, near_crit, timed_out))
+        return self.last_lateness
+
+    def summary(self) -> str:
+        if not self.cycles:
+            return "Refresh: no cycles"
+        late = sorted(self._lateness)
+        return (
+            f"Refresh: {self.cycles} cycles, {self.late_cycles} late | lateness "
+            f"p50 {late[len(late) // 2]:.2f}s, p95 {late[int(len(late) * 0.95)]:.2f}s, "
+            f"max {late[-1]:.2f}s"
+        )
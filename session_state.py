@@ -0,0 +1,217 @@
+from datetime import datetime, timedelta
+import numpy as np
+import sys
+from typing import Any, Iterable, Optional
+
+_EPOCH = datetime(1970, 1, 1)
+_US = timedelta(microseconds=1)
+NO_TIME = np.iinfo(np.int64).min
+NO_INT = np.iinfo(np.int64).min
+
+# Column name -> kind. Floats use NaN and times/ints a sentinel for None.
+FIELDS: dict[str, str] = {
+    # Entry snapshot
+    "OG_PRICE": "float",
+    "TIME_ENTERED": "time",
+    "OG_VOL": "float",
+    "OG_RVOL": "float",
+    "OG_RSI": "float",
+    # Crit snapshot
+    "CRIT_TIME": "time",
+    "CRIT_PRICE": "float",
+    "CRIT_VOL": "float",
+    "CRIT_RVOL": "float",
+    "CRIT_RSI": "float",
+    "CRIT_VOL_FLOAT_RATIO": "float",
+    "CRIT_SCORE": "int",
+    "CRIT_TIER": "tier",
+    # Rolling
+    "price": "float",
+    "base_price": "float",
+    "abs_pct_chg": "float",
+    "pct_chg_after": "float",
+    "met_crit": "bool",
+    "age": "int",
+    "max_price": "float",
+    "time_max_price": "time",
+    "volume_at_max_price": "float",
+    "rvol_at_max_price": "float",
+    "rsi_at_max_price": "float",
+    "float_shares": "float",
+    "last_volume": "float",
+    "last_rvol": "float",
+    "last_rsi": "float",
+    "last_vol_float_ratio": "float",
+    "live_score": "int",
+    "live_tier": "tier",
+}
+
+_DTYPES = {
+    "float": (np.float64, np.nan),
+    "time": (np.int64, NO_TIME),
+    "int": (np.int64, NO_INT),
+    "bool": (np.bool_, False),
+    "tier": ("U1", ""),
+}
+
+
+def to_time(us: int) -> Optional[datetime]:
+    return None if us == NO_TIME else _EPOCH + timedelta(microseconds=int(us))
+
+
+def from_time(t: Optional[datetime]) -> int:
+    return NO_TIME if t is None else (t - _EPOCH) // _US
+
+
+class SessionState:
+    """
+    Columnar store for every tracked ticker: one typed NumPy array per Stock
+    field plus a ticker -> row index. Stock objects are thin views onto a row,
+    so whole-session sorting, filtering and aggregation are array operations.
+    """
+    def __init__(self, capacity: int = 256):
+        self.tickers: list[str] = []
+        self.index: dict[str, int] = {}
+        self.size = 0
+        self._capacity = max(1, capacity)
+        self.cols: dict[str, np.ndarray] = {
+            name: self._alloc(kind, self._capacity) for name, kind in FIELDS.items()
+        }
+
+    def __len__(self) -> int:
+        return self.size
+
+    @staticmethod
+    def _alloc(kind: str, n: int) -> np.ndarray:
+        dtype, fill = _DTYPES[kind]
+        return np.full(n, fill, dtype=dtype)
+
+    def _grow(self):
+        new_cap = self._capacity * 2
+        for name, kind in FIELDS.items():
+            arr = self._alloc(kind, new_cap)
+            arr[:self._capacity] = self.cols[name]
+            self.cols[name] = arr
+        self._capacity = new_cap
+
+    def add_row(self, ticker: str) -> int:
+        """Appends an empty row for ticker and returns its index."""
+        # One shared string per ticker across the session, tick log and alerts
+        ticker = sys.intern(ticker)
+        if ticker in self.index:
+            raise ValueError(f"{ticker} already has a row in this session")
+        if self.size == self._capacity:
+            self._grow()
+        row = self.size
+        self.tickers.append(ticker)
+        self.index[ticker] = row
+        self.size += 1
+        return row
+
+    def col(self, name: str) -> np.ndarray:
+        """View of a column over the filled rows."""
+        return self.cols[name][:self.size]
+
+    def snapshot(self) -> dict[str, np.ndarray]:
+        """Copies of every column over the filled rows."""
+        return {name: self.col(name).copy() for name in FIELDS}
+
+    @classmethod
+    def from_columns(cls, tickers: list[str], cols: dict[str, np.ndarray]) -> "SessionState":
+        """Rebuilds a session from tickers and snapshot() columns."""
+        state = cls(capacity=len(tickers))
+        for ticker in tickers:
+            state.add_row(ticker)
+        for name in FIELDS:
+            state.cols[name][:state.size] = cols[name]
+        return state
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (allocated capacity, not just filled rows)."""
+        return sum(a.nbytes for a in self.cols.values())
+
+    def crit_rows(self) -> np.ndarray:
+        """Rows that have met criteria, highest abs % change first."""
+        rows = np.flatnonzero(self.col("met_crit"))
+        return rows[np.argsort(-self.col("abs_pct_chg")[rows], kind="stable")]
+
+    def rows_of(self, tickers: Iterable[str]) -> np.ndarray:
+        """Rows of whichever of these tickers already have one."""
+        index = self.index
+        return np.fromiter((index[t] for t in tickers if t in index), dtype=np.intp)
+
+    def moved_count(self, rows: np.ndarray, before: np.ndarray, min_move: float) -> int:
+        """How many of `rows` moved at least `min_move` points of abs % change since `before`."""
+        return int(np.count_nonzero(np.abs(self.col("abs_pct_chg")[rows] - before) >= min_move))
+
+    def near_crit_count(self, pct_chg_des: float, rows: np.ndarray, frac: float = 0.8) -> int:
+        """
+        How many of `rows` (e.g. this cycle's board) are yet to meet criteria
+        but within `frac` of the threshold.
+        """
+        abs_pct = self.col("abs_pct_chg")[rows]
+        near = (abs_pct >= pct_chg_des * frac) & (abs_pct < pct_chg_des) & ~self.col("met_crit")[rows]
+        return int(np.count_nonzero(near))
+
+    def peak_change(self, rows: np.ndarray) -> np.ndarray:
+        """Vectorized Stock.get_peak_change for the given rows."""
+        crit = self.col("CRIT_PRICE")[rows]
+        peak = self.col("max_price")[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = (peak - crit) / crit * 100
+        return np.where(np.isnan(crit) | (crit == 0.0), 0.0, out)
+
+    def peak_change_spot(self, rows: np.ndarray) -> np.ndarray:
+        """Vectorized Stock.get_peak_change_spot for the given rows."""
+        og = self.col("OG_PRICE")[rows]
+        peak = self.col("max_price")[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = (peak - og) / og * 100
+        return np.where(og == 0.0, 0.0, out)
+
+    def time_peak_alert(self, rows: np.ndarray) -> list[Optional[int]]:
+        """Vectorized Stock.get_time_peak_alert for the given rows."""
+        crit = self.col("CRIT_TIME")[rows]
+        peak = self.col("time_max_price")[rows]
+        valid = (crit != NO_TIME) & (peak != NO_TIME)
+        mins = np.where(valid, peak - crit, 0) // 60_000_000
+        return [int(m) if ok else None for m, ok in zip(mins, valid)]
+
+
+class Column:
+    """Descriptor exposing one SessionState column as a Stock attribute."""
+    def __init__(self):
+        self.name = ""
+        self.kind = ""
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.kind = FIELDS[name]
+
+    def __get__(self, obj, objtype=None) -> Any:
+        if obj is None:
+            return self
+        v = obj._state.cols[self.name].item(obj._row)
+        kind = self.kind
+        if kind == "float":
+            return None if v != v else v
+        if kind == "time":
+            return to_time(v)
+        if kind == "int":
+            return None if v == NO_INT else v
+        if kind == "tier":
+            return v or None
+        return v
+
+    def __set__(self, obj, value: Any):
+        kind = self.kind
+        if kind == "float":
+            value = np.nan if value is None else value
+        elif kind == "time":
+            value = from_time(value)
+        elif kind == "int":
+            value = NO_INT if value is None else value
+        elif kind == "tier":
+            value = value or ""
+        obj._state.cols[self.name][obj._row] = value
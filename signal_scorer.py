@@ -1,8 +1,34 @@
 from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
 from typing import Optional
 
 
+# Band edges/points for score_batch, mirroring the if/elif chains in score().
+# A value's band is the number of edges it is >= to.
+_FLOAT_EDGES = (1, 3, 10, 20)
+_FLOAT_PTS = np.array([4, 3, 2, 1, 0])
+_RVOL_EDGES = (3, 5, 10)
+_RVOL_PTS = np.array([0, 1, 2, 3])
+_VF_EDGES = (0.5, 1, 2)
+_VF_PTS = np.array([0, 1, 2, 3])
+_RSI_EDGES = (35, 60, 75, 85, 90)
+_RSI_PTS = np.array([0, 2, 3, 1, 0, -2])
+_ABS_EDGES = (20, 30)
+_ABS_PTS = np.array([0, 1, 2])
+_TIER_EDGES = (5, 8, 11)
+_TIER_IDX = np.arange(4)
+_TIERS = np.array(["D", "C", "B", "A"])
+
+
+def _band(x: np.ndarray, edges: tuple, pts: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float64)
+    idx = (x >= edges[0]).astype(np.intp)
+    for e in edges[1:]:
+        idx += x >= e
+    return pts[idx]
+
+
 @dataclass
 class SignalFeatures:
     ticker: str
@@ -22,6 +48,12 @@ class SignalScore:
     tier: str
 
 
+@dataclass
+class SignalScoreBatch:
+    scores: np.ndarray
+    tiers: np.ndarray
+
+
 class SignalScorer:
     @staticmethod
     def score(f: SignalFeatures) -> SignalScore:
@@ -89,3 +121,29 @@ class SignalScorer:
             tier = "D"
         
         return SignalScore(score, tier)
+
+    @staticmethod
+    def score_batch(
+        float_shares: np.ndarray,
+        rvol: np.ndarray,
+        vol_float_ratio: np.ndarray,
+        rsi: np.ndarray,
+        abs_pct: np.ndarray,
+    ) -> SignalScoreBatch:
+        """
+        Vectorized score() over a whole cycle of rows. Missing values are NaN,
+        and every row gets exactly the score/tier score() would give it.
+        """
+        fs = np.asarray(float_shares, dtype=np.float64)
+
+        # Missing values are NaN, which fails every >= and lands in band 0, worth
+        # nothing for each feature but float (where band 0 is the best, so mask it).
+        score = _band(fs / 1_000_000, _FLOAT_EDGES, _FLOAT_PTS)
+        score[(fs == 0) | np.isnan(fs)] = 0
+        score += _band(rvol, _RVOL_EDGES, _RVOL_PTS)
+        score += _band(vol_float_ratio, _VF_EDGES, _VF_PTS)
+        score += _band(rsi, _RSI_EDGES, _RSI_PTS)
+        score += _band(abs_pct, _ABS_EDGES, _ABS_PTS)
+
+        tiers = _TIERS[_band(score, _TIER_EDGES, _TIER_IDX)]
+        return SignalScoreBatch(score, tiers)
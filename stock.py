@@ -7,20 +7,100 @@
 # prices up to the last 20 minutes.                                                                     #
 #-------------------------------------------------------------------------------------------------------#
 from datetime import datetime
+from functools import lru_cache
+import math
+from price_history import PriceHistory
+from session_state import Column, SessionState
 from typing import Optional
 
+_VOLUME_SUFFIXES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+
+
+@lru_cache(maxsize=8192)
+def parse_volume(text: Optional[str]) -> Optional[float]:
+    """
+    Shares from a TradingView volume string ("950", "1,234", "12.3K", "4.5M",
+    "1.2B", "3T"), None if it doesn't parse. Memoized, since the scrape
+    scripts already return shares and only old tick logs still parse.
+    """
+    if not text:
+        return None
+    s = text.strip().upper().replace(",", "")
+    mult = _VOLUME_SUFFIXES.get(s[-1:])
+    if mult is not None:
+        s = s[:-1]
+    try:
+        shares = float(s)
+    except ValueError:
+        return None
+    return shares * (mult or 1.0) if math.isfinite(shares) else None
+
+
+def format_volume(shares: float) -> str:
+    """Volume the way TradingView shows it, e.g. 950, 12.30K, 4.50M, 1.20B."""
+    for suffix, mult in (("T", 1e12), ("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        if shares >= mult:
+            return f"{shares / mult:.2f}{suffix}"
+    return f"{shares:.0f}"
+
 
 class Stock:
+    """
+    View onto one row of a SessionState. Every field below lives in a typed
+    column of the session, so the Stock object itself only holds its row.
+    A Stock created without a session gets a private one-row session.
+    Slotted, so a view costs a few dozen bytes and has no instance dict.
+    """
+    __slots__ = ("_state", "_row", "past_prices")
+
+    # Entry snapshot
+    OG_PRICE = Column()
+    TIME_ENTERED = Column()
+    OG_VOL = Column()
+    OG_RVOL = Column()
+    OG_RSI = Column()
+    # Crit snapshot
+    CRIT_TIME = Column()
+    CRIT_PRICE = Column()
+    CRIT_VOL = Column()
+    CRIT_RVOL = Column()
+    CRIT_RSI = Column()
+    CRIT_VOL_FLOAT_RATIO = Column()
+    CRIT_SCORE = Column()
+    CRIT_TIER = Column()
+    # Rolling
+    price = Column()
+    base_price = Column()
+    abs_pct_chg = Column()
+    pct_chg_after = Column()
+    met_crit = Column()
+    age = Column()
+    max_price = Column()
+    time_max_price = Column()
+    volume_at_max_price = Column()
+    rvol_at_max_price = Column()
+    rsi_at_max_price = Column()
+    float_shares = Column()
+    last_volume = Column()
+    last_rvol = Column()
+    last_rsi = Column()
+    last_vol_float_ratio = Column()
+    live_score = Column()
+    live_tier = Column()
+
     def __init__(self,
          ticker: str,
          price: float,
-         vol: str,
+         vol: Optional[float],
          rvol: float,
          rsi: float,
          curr_time: datetime,
+         state: Optional[SessionState] = None,
     ):
+        self._state = state if state is not None else SessionState(capacity=1)
+        self._row = self._state.add_row(ticker)
+
         # Entry snapshot constants
-        self.TICKER = ticker
         self.OG_PRICE = price
         self.TIME_ENTERED = curr_time
         self.OG_VOL = vol
@@ -44,20 +124,38 @@ class Stock:
         self.pct_chg_after = 0.0
         self.met_crit = False
         self.age = 0
-        self.past_prices = [price]
+        self.past_prices = PriceHistory()
+        self.past_prices.append(curr_time, price)
         self.max_price = price
         self.time_max_price = None
         self.volume_at_max_price = vol
         self.rvol_at_max_price: Optional[float] = None
         self.rsi_at_max_price: Optional[float] = None
         self.float_shares: Optional[float] = None
-        self.last_volume_str: str = vol
+        self.last_volume: Optional[float] = vol
         self.last_rvol: Optional[float] = None
         self.last_rsi: Optional[float] = None
         self.last_vol_float_ratio: Optional[float] = None
 
+    @classmethod
+    def at_row(cls, state: SessionState, row: int, past_prices: PriceHistory) -> "Stock":
+        """View onto a row that is already filled in, e.g. one restored from a checkpoint."""
+        stock = cls.__new__(cls)
+        stock._state = state
+        stock._row = row
+        stock.past_prices = past_prices
+        return stock
+
+    @property
+    def TICKER(self) -> str:
+        return self._state.tickers[self._row]
+
+    @property
+    def row(self) -> int:
+        return self._row
+
     def get_ticker(self) -> str:
-        return self.TICKER
+        return self._state.tickers[self._row]
 
     def get_new_abs(self, price: float) -> float:
         """Calculate the new absolute percent change relative to OG_PRICE."""
@@ -82,23 +180,29 @@ class Stock:
     def get_age(self) -> int:
         return self.age
 
+    def get_pct_chg(self, minutes: int) -> Optional[float]:
+        """Percent change over the past `minutes`, None if not enough history yet."""
+        return self.past_prices.pct_change(minutes)
+
     def get_time_entered(self) -> datetime:
         return self.TIME_ENTERED
 
     def has_met_crit(self) -> bool:
         return self.met_crit
 
-    def did_meet_crit(self):
+    def did_meet_crit(self, curr_time: Optional[datetime] = None):
         """
         Flags that the stock has met user criteria, and records the time/price
-        if not already set.
+        if not already set. curr_time defaults to now.
         """
         self.met_crit = True
         if self.CRIT_TIME is None:
-            self.CRIT_TIME = datetime.now()
+            if curr_time is None:
+                curr_time = datetime.now()
+            self.CRIT_TIME = curr_time
             self.CRIT_PRICE = self.price
             self.max_price = self.price
-            self.time_max_price = datetime.now()
+            self.time_max_price = curr_time
 
     def set_price(self, new_price: float):
         self.price = new_price
@@ -112,7 +216,7 @@ class Stock:
     def set_float_shares(self, new_float_shares: Optional[float]):
         self.float_shares = new_float_shares
 
-    def get_og_vol(self) -> str:
+    def get_og_vol(self) -> Optional[float]:
         return self.OG_VOL
 
     def get_og_rvol(self) -> float:
@@ -127,7 +231,7 @@ class Stock:
     def get_time_max_price(self) -> Optional[datetime]:
         return self.time_max_price
 
-    def get_vol_at_max_price(self) -> str:
+    def get_vol_at_max_price(self) -> Optional[float]:
         return self.volume_at_max_price
 
     def get_crit_time(self) -> Optional[datetime]:
@@ -154,9 +258,15 @@ class Stock:
     def get_crit_tier(self) -> Optional[str]:
         return self.CRIT_TIER
 
-    def get_crit_vol(self) -> Optional[str]:
+    def get_crit_vol(self) -> Optional[float]:
         return self.CRIT_VOL
 
+    def get_live_score(self) -> Optional[int]:
+        return self.live_score
+
+    def get_live_tier(self) -> Optional[str]:
+        return self.live_tier
+
     def get_peak_rvol(self) -> Optional[float]:
         return self.rvol_at_max_price
 
@@ -192,20 +302,20 @@ class Stock:
     def update_technicals(
         self,
         price: float,
-        vol: str,
+        vol: Optional[float],
         curr_time: datetime,
         rvol: Optional[float],
         rsi: Optional[float],
     ):
         """Updates the indicators every loop"""
         self.age = (curr_time - self.TIME_ENTERED).seconds // 60
-        self.last_volume_str = vol
+        self.past_prices.append(curr_time, price)
+        self.last_volume = vol
         self.last_rvol = rvol
         self.last_rsi = rsi
 
-        vol_shares = Stock.parse_volume_to_shares(vol)
-        if self.float_shares and self.float_shares > 0 and vol_shares:
-            self.last_vol_float_ratio = vol_shares / self.float_shares
+        if self.float_shares and self.float_shares > 0 and vol:
+            self.last_vol_float_ratio = vol / self.float_shares
         else:
             self.last_vol_float_ratio = None
 
@@ -216,29 +326,9 @@ class Stock:
             self.rvol_at_max_price = rvol
             self.rsi_at_max_price = rsi
 
-    @staticmethod
-    def parse_volume_to_shares(vol: str) -> Optional[float]:
-        """
-        Convert TradingView volume strings to raw number of shares.
-        """
-        if not vol:
-            return None
-        s = vol.strip().upper().replace(",", "")
-        mult = 1.0
-        if s.endswith("K"):
-            mult = 1_000
-            s = s[:-1]
-        elif s.endswith("M"):
-            mult = 1_000_000
-            s = s[:-1]
-        try:
-            return float(s) * mult
-        except ValueError:
-            return None
-
     def snapshot_crit_technicals(self, score: int, tier: str) -> None:
         """Snapshots the technicals at the time criteria is met."""
-        self.CRIT_VOL = self.last_volume_str
+        self.CRIT_VOL = self.last_volume
         self.CRIT_RVOL = self.last_rvol
         self.CRIT_RSI = self.last_rsi
         self.CRIT_VOL_FLOAT_RATIO = self.last_vol_float_ratio
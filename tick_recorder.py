@@ -0,0 +1,227 @@
+import argparse
+from datetime import datetime, timedelta
+import mmap
+import math
+import os
+from pathlib import Path
+from queue import SimpleQueue
+import struct
+from threading import Thread
+from typing import Iterator, Optional
+
+from stock import parse_volume
+
+# File layout (little endian):
+#   header: b"SBTK" + uint16 version
+#   cycle:  int64 time (us since 1970-01-01, local) + uint32 row count, then per row:
+#           uint8 len + ticker bytes, float64 price, float64 volume (shares),
+#           float64 rvol, float64 rsi (NaN when missing), float64 float shares
+#           as the bot knew them that cycle (NaN while the lookup was pending,
+#           0 once FMP had answered with no float)
+# Version 1 stored the volume as uint8 len + the page's text ("12.3M"); it is
+# still readable, with the text parsed to shares. Versions 1 and 2 have no
+# float column.
+MAGIC = b"SBTK"
+VERSION = 3
+_HEADER = struct.Struct("<4sH")
+_CYCLE = struct.Struct("<qI")
+_F64 = struct.Struct("<d")
+_F64x2 = struct.Struct("<dd")
+_F64x4 = struct.Struct("<dddd")
+_F64x5 = struct.Struct("<ddddd")
+_EPOCH = datetime(1970, 1, 1)
+_US = timedelta(microseconds=1)
+
+TickRow = tuple[str, float, Optional[float], Optional[float], Optional[float]]
+# (resolved, float_shares), as FloatProvider.peek() returned it that cycle
+FloatState = tuple[bool, Optional[float]]
+
+
+def _nan(v: Optional[float]) -> float:
+    return math.nan if v is None else v
+
+
+def _encode_float(state: Optional[FloatState]) -> float:
+    if state is None or not state[0]:
+        return math.nan
+    return state[1] or 0.0
+
+
+def _decode_float(v: float) -> FloatState:
+    return (False, None) if v != v else (True, v or None)
+
+
+def _encode_cycle(t: datetime, rows: list[TickRow], floats: Optional[list[FloatState]] = None) -> bytes:
+    parts = [_CYCLE.pack((t - _EPOCH) // _US, len(rows))]
+    for i, (ticker, price, vol, rvol, rsi) in enumerate(rows):
+        tb = ticker.encode()[:255]
+        parts.append(bytes((len(tb),)) + tb)
+        fl = _encode_float(floats[i] if floats is not None else None)
+        parts.append(_F64x5.pack(price, _nan(vol), _nan(rvol), _nan(rsi), fl))
+    return b"".join(parts)
+
+
+def _file_version(path: Path) -> Optional[int]:
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+    if len(head) < _HEADER.size:
+        return None
+    magic, version = _HEADER.unpack(head)
+    return version if magic == MAGIC else None
+
+
+class TickRecorder:
+    """
+    Append-only binary log of every scrape cycle. record() only enqueues; a
+    background thread encodes and writes through a large buffer, so the scrape
+    loop never waits on disk. The buffer is flushed whenever the queue runs
+    dry, so a crash or kill loses at most the cycles still queued.
+    """
+    def __init__(self, path: Path, buffer_size: int = 1 << 20):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not path.exists() or path.stat().st_size == 0
+        version = None if new_file else _file_version(path)
+        if not new_file and version != VERSION:
+            # Never append to a log in another format; keep it under its old version
+            if version is None:
+                old = path.with_name(f"{path.stem}.corrupt{path.suffix}")
+                print(f"\n\033[1;33m[WARNING]\033[0m {path} has no tick log header, moved to {old}.")
+            else:
+                old = path.with_name(f"{path.stem}.v{version}{path.suffix}")
+                print(f"\n\033[1;33m[WARNING]\033[0m {path} is in an older format, moved to {old}.")
+            os.replace(path, old)
+            new_file = True
+        self.path = path
+        self._f = open(path, "ab", buffering=buffer_size)
+        if new_file:
+            self._f.write(_HEADER.pack(MAGIC, VERSION))
+        self._q: SimpleQueue = SimpleQueue()
+        self._thread = Thread(target=self._run, name="tick-recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, t: datetime, rows: list[TickRow], floats: Optional[list[FloatState]] = None):
+        """
+        Queues one cycle of (ticker, price, vol, rvol, rsi) rows to be written,
+        with each row's float state as the bot saw it, if given.
+        """
+        self._q.put((t, rows, floats))
+
+    def close(self):
+        """Writes out everything queued so far and closes the file."""
+        self._q.put(None)
+        self._thread.join()
+        self._f.close()
+
+    def _run(self):
+        while True:
+            item = self._q.get()
+            if item is None:
+                break
+            try:
+                self._f.write(_encode_cycle(*item))
+                # Caught up: push the buffer to the OS so a crash doesn't take it along
+                if self._q.empty():
+                    self._f.flush()
+            except Exception as e:
+                print(f"\n\033[1;33m[WARNING]\033[0m Failed to record ticks: {e}")
+        self._f.flush()
+
+
+def read_ticks(path: Path) -> Iterator[tuple[datetime, list[TickRow]]]:
+    """
+    Memory-maps a tick log and yields (cycle_time, rows) for each cycle. A
+    truncated final cycle (e.g. from a crash mid-write) is skipped.
+    """
+    for t, rows, _ in read_cycles(path):
+        yield t, rows
+
+
+def read_cycles(path: Path) -> Iterator[tuple[datetime, list[TickRow], Optional[list[FloatState]]]]:
+    """Like read_ticks, plus each row's recorded float state (None for logs before version 3)."""
+    with open(path, "rb") as f:
+        if path.stat().st_size < _HEADER.size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version = _HEADER.unpack_from(mm, 0)
+            if magic != MAGIC or version not in (1, 2, VERSION):
+                raise ValueError(f"{path} is not a version 1-{VERSION} tick log")
+            yield from _iter_cycles(mm, _HEADER.size, len(mm), version)
+
+
+def _iter_cycles(
+    buf, pos: int, end: int, version: int = VERSION
+) -> Iterator[tuple[datetime, list[TickRow], Optional[list[FloatState]]]]:
+    unpack_f64 = _F64.unpack_from
+    unpack_f64x2 = _F64x2.unpack_from
+    unpack_f64x4 = _F64x4.unpack_from
+    unpack_f64x5 = _F64x5.unpack_from
+    while pos + _CYCLE.size <= end:
+        us, n = _CYCLE.unpack_from(buf, pos)
+        p = pos + _CYCLE.size
+        rows: list[TickRow] = []
+        floats: Optional[list[FloatState]] = [] if version >= 3 else None
+        try:
+            for _ in range(n):
+                tlen = buf[p]
+                ticker = bytes(buf[p + 1:p + 1 + tlen]).decode()
+                p += 1 + tlen
+                if version == 1:
+                    price, = unpack_f64(buf, p)
+                    vlen = buf[p + 8]
+                    vol = parse_volume(bytes(buf[p + 9:p + 9 + vlen]).decode())
+                    p += 9 + vlen
+                    rvol, rsi = unpack_f64x2(buf, p)
+                    p += 16
+                elif version == 2:
+                    price, vol, rvol, rsi = unpack_f64x4(buf, p)
+                    p += 32
+                    vol = None if vol != vol else vol
+                else:
+                    price, vol, rvol, rsi, fl = unpack_f64x5(buf, p)
+                    p += 40
+                    vol = None if vol != vol else vol
+                    floats.append(_decode_float(fl))
+                rows.append((
+                    ticker,
+                    price,
+                    vol,
+                    None if rvol != rvol else rvol,
+                    None if rsi != rsi else rsi,
+                ))
+        except (IndexError, struct.error):
+            return
+        if p > end:
+            return
+        yield _EPOCH + timedelta(microseconds=us), rows, floats
+        pos = p
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize or dump a StockBot tick log.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--ticker", help="print every recorded row for this ticker")
+    args = parser.parse_args()
+
+    cycles = rows = 0
+    first = last = None
+    tickers: set[str] = set()
+    for t, cycle_rows, floats in read_cycles(args.path):
+        cycles += 1
+        rows += len(cycle_rows)
+        first = first or t
+        last = t
+        for i, row in enumerate(cycle_rows):
+            tickers.add(row[0])
+            if args.ticker and row[0] == args.ticker:
+                extra = []
+                if floats is not None:
+                    resolved, shares = floats[i]
+                    extra.append(f"float={shares if resolved else 'pending'}")
+                print(t.strftime("%H:%M:%S.%f")[:-3], *row[1:], *extra)
+
+    span = f"{first:%H:%M:%S} -> {last:%H:%M:%S}" if first and last else "n/a"
+    print(f"{cycles} cycles, {rows} rows, {len(tickers)} tickers, {span}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+import json
+from os import getpid
+from pathlib import Path
+import signal
+from threading import RLock, get_ident
+from time import perf_counter_ns
+from typing import Optional
+
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.add(self.name, self.start, perf_counter_ns() - self.start)
+        return False
+
+
+class Tracer:
+    """
+    Per-stage latency spans for the main loop. Each stage keeps its last
+    `window` durations for rolling p50/p95/p99, and every span can also be
+    appended to a Chrome trace-event file (open it in chrome://tracing or
+    ui.perfetto.dev). While disabled, span() hands back one shared no-op
+    context manager, so instrumented code costs next to nothing.
+    """
+    def __init__(self, window: int = 500):
+        self.enabled = False
+        self.window = window
+        self._durations: dict[str, deque[int]] = {}
+        self._names: dict[str, str] = {} # stage -> JSON-encoded name
+        # Re-entrant: the SIGUSR1 report can interrupt add() on the same thread
+        self._lock = RLock()
+        self._file = None
+        self._sep = ""
+        self._pid = getpid()
+
+    def enable(self, trace_path: Optional[Path] = None):
+        """Starts collecting stats, and trace events too if a path is given."""
+        self.enabled = True
+        if trace_path is not None and self._file is None:
+            trace_path.parent.mkdir(parents=True, exist_ok=True)
+            # JSON Array Format: viewers accept the array without its closing bracket,
+            # so events can be appended as they happen and a crash loses nothing
+            self._file = open(trace_path, "w", buffering=1 << 16)
+            self._file.write("[")
+
+    def span(self, name: str):
+        """Context manager timing one stage: `with tracer.span("scrape"): ...`"""
+        return _Span(self, name) if self.enabled else _NULL_SPAN
+
+    def traced(self, name: str):
+        """Decorator putting every call of a function in a span."""
+        def wrap(fn):
+            @wraps(fn)
+            def inner(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with _Span(self, name):
+                    return fn(*args, **kwargs)
+            return inner
+        return wrap
+
+    def add(self, name: str, start_ns: int, dur_ns: int):
+        with self._lock:
+            d = self._durations.get(name)
+            if d is None:
+                d = self._durations[name] = deque(maxlen=self.window)
+                self._names[name] = json.dumps(name)
+            d.append(dur_ns)
+            if self._file is not None:
+                # Formatted by hand; json.dumps per event would dominate the span cost
+                self._file.write(
+                    f'{self._sep}{{"name":{self._names[name]},"ph":"X","pid":{self._pid},'
+                    f'"tid":{get_ident()},"ts":{start_ns / 1000},"dur":{dur_ns / 1000}}}'
+                )
+                self._sep = ",\n"
+
+    def stats(self) -> dict[str, tuple[int, float, float, float]]:
+        """Stage -> (samples, p50, p95, p99) in milliseconds, over the rolling window."""
+        with self._lock:
+            snapshot = {name: sorted(d) for name, d in self._durations.items()}
+        out = {}
+        for name, d in snapshot.items():
+            n = len(d)
+            out[name] = (n, *(d[min(n - 1, int(n * q))] / 1e6 for q in (0.50, 0.95, 0.99)))
+        return out
+
+    def report(self) -> str:
+        stats = self.stats()
+        if not stats:
+            return "No spans recorded."
+        lines = [f"{'stage':<22} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+        for name, (n, p50, p95, p99) in sorted(stats.items(), key=lambda kv: -kv[1][1]):
+            lines.append(f"{name:<22} {n:>6} {p50:>9.1f} {p95:>9.1f} {p99:>9.1f}")
+        return "\n".join(lines)
+
+    def print_on_signal(self):
+        """Prints the report whenever the process gets SIGUSR1 (not on Windows)."""
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda *_: print(f"\n{self.report()}"))
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.write("]\n")
+                self._file.close()
+                self._file = None
+
+
+# Shared by every module, so spans from the loop and worker threads land together
+tracer = Tracer()